@@ -0,0 +1,97 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Union
+
+
+class FakeAction:
+    def __init__(self, resource: FakeResource, action: str):
+        self.resource = resource
+        self.action = action
+
+    def post(self, payload: Optional[dict] = None, **kwargs) -> dict:
+        return self.resource.value
+
+
+class FakeResource:
+    def __init__(self, path: str, value: dict):
+        self.path = path
+        self.value = value
+
+    def __call__(self, action: str) -> FakeAction:
+        return FakeAction(self, action)
+
+    def get(self, **kwargs) -> dict:
+        return self.value
+
+    def update(self, payload: Optional[dict] = None, **kwargs) -> dict:
+        return self.value
+
+
+class FakeCollection:
+    """
+    In memory collection, every id resolves to the same fixture so the
+    benchmarks measure the facade overhead without any HTTP or JSON work.
+    """
+
+    def __init__(self, path: str, value: dict, by_id: Optional[Dict[str, dict]] = None, count: int = 100):
+        self.path = path
+        self.value = value
+        self.by_id = by_id or {}
+        self.count = count
+
+    def __getitem__(self, key: Union[str, slice]) -> Union[FakeResource, List[dict]]:
+        if isinstance(key, slice):
+            return [self.value] * max(0, min(key.stop, self.count) - key.start)
+        return FakeResource(f'{self.path}/{key}', self.by_id.get(key, self.value))
+
+    def filter(self, *args, **kwargs) -> FakeCollection:
+        return self
+
+    def select(self, *args) -> FakeCollection:
+        return self
+
+    def limit(self, limit: int) -> FakeCollection:
+        return self
+
+
+class FakeNamespace:
+    def __init__(self, collections: Dict[str, FakeCollection]):
+        self.collections = collections
+
+    def __getattr__(self, name: str) -> FakeCollection:
+        try:
+            return self.collections[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+class FakeClient:
+    """
+    Minimal in memory replacement of the ConnectClient covering the calls
+    done by the facades.
+    """
+
+    endpoint = 'https://fake.connect/public/v1'
+
+    def __init__(self, asset_request: dict, tier_configuration_request: dict):
+        self.response: Any = None
+        self.assets = FakeCollection('assets', asset_request['asset'])
+        self.requests = FakeCollection('requests', asset_request, {
+            tier_configuration_request['id']: tier_configuration_request,
+        })
+        self.tiers = FakeCollection('tiers', tier_configuration_request['configuration'])
+        self._tier = FakeNamespace({
+            'configs': FakeCollection('tier/configs', tier_configuration_request['configuration']),
+            'config_requests': FakeCollection('tier/config-requests', tier_configuration_request),
+        })
+
+    def ns(self, name: str) -> FakeNamespace:
+        return self._tier
+
+    def get(self, path: str, **kwargs) -> dict:
+        return self.requests.value
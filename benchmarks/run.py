@@ -0,0 +1,188 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Facade overhead microbenchmarks, every facade method runs against an in
+memory fake client, so the measures only include the facade work.
+
+    python -m benchmarks.run                # compare with the stored baseline.
+    python -m benchmarks.run --save         # store the current measures as baseline.
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.fake_client import FakeClient
+from rndi.connect.business_objects.adapters import Request
+from rndi.connect.api_facades.codec import available_codecs, get_codec
+from rndi.connect.api_facades.facade import ConnectOpenAPIFacade
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests')
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_THRESHOLD = 0.20
+# absolute tolerance for the allocations, small interpreter variations must not fail the check.
+ALLOCATION_TOLERANCE = 256
+
+
+def _load(name: str) -> dict:
+    with open(os.path.join(FIXTURES, name)) as f:
+        return json.load(f)
+
+
+def codec_cases() -> Dict[str, Callable[[], object]]:
+    """
+    Encoding and decoding of a large asset request (300 parameters) with each
+    installed JSON codec.
+    """
+    asset_request = _load('request_asset.json')
+    asset_request['asset']['params'] = [
+        {'id': f'PARAM_{i}', 'name': f'Parameter {i}', 'type': 'text', 'value': f'value-{i}', 'value_error': ''}
+        for i in range(300)
+    ]
+    document = json.dumps(asset_request).encode('utf-8')
+
+    benchmarks = {}
+    for name in available_codecs():
+        codec = get_codec(name)
+        benchmarks[f'codec_loads[{name}]'] = lambda codec=codec: codec.loads(document)
+        benchmarks[f'codec_dumps[{name}]'] = lambda codec=codec: codec.dumps(asset_request)
+    return benchmarks
+
+
+def cases() -> Dict[str, Callable[[], object]]:
+    asset_request = _load('request_asset.json')
+    tier_configuration_request = _load('request_tier_config.json')
+
+    api = ConnectOpenAPIFacade(FakeClient(asset_request, tier_configuration_request), coalesce_reads=False)
+
+    asset_id, ar_id = asset_request['asset']['id'], asset_request['id']
+    tc_id, tcr_id = tier_configuration_request['configuration']['id'], tier_configuration_request['id']
+
+    ar = Request(copy.deepcopy(asset_request))
+    tcr = Request(copy.deepcopy(tier_configuration_request))
+    asset_parameters = [{'id': 'ORDER_TYPE', 'value': 'RANDOM'}]
+    tier_parameters = [{'id': 'my_ordering_parameter', 'value': 'RANDOM'}]
+
+    return {
+        'find_asset': lambda: api.find_asset(asset_id),
+        'find_asset_request': lambda: api.find_asset_request(ar_id),
+        'find_tier_configuration': lambda: api.find_tier_configuration(tc_id),
+        'find_tier_configuration_request': lambda: api.find_tier_configuration_request(tcr_id),
+        'approve_asset_request': lambda: api.approve_asset_request(ar, 'TL-000-000-000'),
+        'fail_asset_request': lambda: api.fail_asset_request(ar, 'Failure reason.'),
+        'inquire_asset_request': lambda: api.inquire_asset_request(ar, 'TL-000-000-000'),
+        'update_asset_request_parameters': lambda: api.update_asset_request_parameters(ar, asset_parameters),
+        'approve_tier_configuration_request': lambda: api.approve_tier_configuration_request(tcr, 'TL-000-000-000'),
+        'fail_tier_configuration_request': lambda: api.fail_tier_configuration_request(tcr, 'Failure reason.'),
+        'inquire_tier_configuration_request': lambda: api.inquire_tier_configuration_request(tcr),
+        'update_tier_configuration_request_parameters': lambda: api.update_tier_configuration_request_parameters(
+            tcr,
+            tier_parameters,
+        ),
+        'iter_asset_requests[100]': lambda: sum(1 for _ in api.iter_asset_requests(prefetch=False)),
+        **codec_cases(),
+    }
+
+
+def measure(fn: Callable[[], object], number: int, repeat: int, samples: int = 20) -> Tuple[float, float]:
+    """
+    :return: Tuple[float, float] The best ns/op and the mean allocated bytes/op (tracemalloc peak).
+    """
+    for _ in range(min(number, 100)):
+        fn()
+
+    ns_per_op = min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e9
+
+    peaks = []
+    for _ in range(samples):
+        tracemalloc.start()
+        try:
+            fn()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    return ns_per_op, sum(peaks) / len(peaks)
+
+
+def compare(
+        results: Dict[str, Dict[str, float]],
+        baseline: Dict[str, Dict[str, float]],
+        threshold: float,
+) -> List[str]:
+    """
+    :return: List[str] The regressions description, empty if none.
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+
+        if result['ns_per_op'] > reference['ns_per_op'] * (1 + threshold):
+            regressions.append(
+                f"{name}: {result['ns_per_op']:.0f} ns/op, baseline {reference['ns_per_op']:.0f} ns/op",
+            )
+
+        limit = reference['bytes_per_op'] * (1 + threshold) + ALLOCATION_TOLERANCE
+        if result['bytes_per_op'] > limit:
+            regressions.append(
+                f"{name}: {result['bytes_per_op']:.0f} B/op, baseline {reference['bytes_per_op']:.0f} B/op",
+            )
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Connect API facades overhead benchmarks.')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline JSON file.')
+    parser.add_argument('--save', action='store_true', help='Store the results as the new baseline.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD, help='Allowed regression ratio.')
+    parser.add_argument('--number', type=int, default=2000, help='Calls per timing run.')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing runs, the best one is kept.')
+    parser.add_argument('--filter', default=None, help='Only run the benchmarks containing the given text.')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, fn in cases().items():
+        if args.filter and args.filter not in name:
+            continue
+        ns_per_op, bytes_per_op = measure(fn, args.number, args.repeat)
+        results[name] = {'ns_per_op': ns_per_op, 'bytes_per_op': bytes_per_op}
+        print(f'{name:<48} {ns_per_op:>12.0f} ns/op {bytes_per_op:>10.0f} B/op')
+
+    if args.save:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f'Baseline stored in {args.baseline}.')
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f'No baseline found in {args.baseline}, run with --save to create it.')
+        return 0
+
+    with open(args.baseline) as f:
+        regressions = compare(results, json.load(f), args.threshold)
+
+    for regression in regressions:
+        print(f'REGRESSION {regression}', file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
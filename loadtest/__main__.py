@@ -0,0 +1,10 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import sys
+
+from loadtest.generator import main
+
+sys.exit(main())
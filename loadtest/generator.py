@@ -0,0 +1,205 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Load generator driving the facades against the stub server (or any Connect
+endpoint) with N threads, or N tasks on the async facade.
+
+    python -m loadtest --workers 16 --duration 30 --latency lognormal:-3.5,0.5 --throttle-rate 0.01
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from connect.client import AsyncConnectClient, ClientError, ConnectClient
+from loadtest.stub_server import StubServer
+from rndi.connect.api_facades.facade import AsyncConnectOpenAPIFacade, ConnectOpenAPIFacade
+from rndi.connect.api_facades.retry import RetryPolicy
+
+SCENARIOS = ('find', 'approve', 'process', 'tier')
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Nearest rank percentile of the given sorted values.
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, int(round(q * len(values))) - 1))]
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: List[float] = []
+        self.errors: Dict[str, int] = {}
+
+    def record(self, seconds: float, error: Optional[ClientError] = None) -> None:
+        with self._lock:
+            self.latencies.append(seconds)
+            if error is not None:
+                status = str(error.status_code)
+                self.errors[status] = self.errors.get(status, 0) + 1
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        return {
+            'operations': len(latencies),
+            'errors': dict(self.errors),
+            'throughput': len(latencies) / elapsed if elapsed else 0.0,
+            'p50': percentile(latencies, 0.50),
+            'p95': percentile(latencies, 0.95),
+            'p99': percentile(latencies, 0.99),
+            'max': latencies[-1] if latencies else 0.0,
+        }
+
+
+def operation(api: Any, scenario: str, request_id: str) -> Any:
+    """
+    Builds one scenario iteration over the given facade, it returns a
+    coroutine on the async facade.
+    """
+    asset_request_id = f'PR-{request_id}-001'
+    tier_configuration_request_id = f'TCR-{request_id}-001'
+
+    if scenario == 'find':
+        return api.find_asset_request(asset_request_id)
+    if scenario == 'approve':
+        return api.approve_asset_request({'id': asset_request_id, 'asset': {}}, 'TL-000-000-000')
+    if scenario == 'tier':
+        return api.approve_tier_configuration_request(
+            {'id': tier_configuration_request_id, 'configuration': {}},
+            'TL-000-000-000',
+        )
+
+    raise ValueError(f'Unknown scenario `{scenario}`.')
+
+
+def process(api: ConnectOpenAPIFacade, request_id: str) -> Any:
+    request = api.find_asset_request(f'PR-{request_id}-001')
+    request = api.update_asset_request_parameters(request, [{'id': 'ORDER_TYPE', 'value': 'LOADTEST'}])
+    return api.approve_asset_request(request, 'TL-000-000-000')
+
+
+async def process_async(api: AsyncConnectOpenAPIFacade, request_id: str) -> Any:
+    request = await api.find_asset_request(f'PR-{request_id}-001')
+    request = await api.update_asset_request_parameters(request, [{'id': 'ORDER_TYPE', 'value': 'LOADTEST'}])
+    return await api.approve_asset_request(request, 'TL-000-000-000')
+
+
+def run_threads(
+        facade: Callable[[], ConnectOpenAPIFacade],
+        scenario: str,
+        workers: int,
+        duration: float,
+) -> Dict[str, Any]:
+    recorder = Recorder()
+    ids = itertools.count()
+    deadline = time.monotonic() + duration
+
+    def worker(index: int) -> None:
+        api = facade()
+        while time.monotonic() < deadline:
+            request_id = f'{index:04d}-{next(ids):08d}'
+            started = time.perf_counter()
+            try:
+                if scenario == 'process':
+                    process(api, request_id)
+                else:
+                    operation(api, scenario, request_id)
+                recorder.record(time.perf_counter() - started)
+            except ClientError as e:
+                recorder.record(time.perf_counter() - started, e)
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(worker, range(workers)))
+
+    return recorder.report(time.monotonic() - started)
+
+
+async def run_tasks(
+        api: AsyncConnectOpenAPIFacade,
+        scenario: str,
+        workers: int,
+        duration: float,
+) -> Dict[str, Any]:
+    recorder = Recorder()
+    ids = itertools.count()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration
+
+    async def worker(index: int) -> None:
+        while loop.time() < deadline:
+            request_id = f'{index:04d}-{next(ids):08d}'
+            started = time.perf_counter()
+            try:
+                if scenario == 'process':
+                    await process_async(api, request_id)
+                else:
+                    await operation(api, scenario, request_id)
+                recorder.record(time.perf_counter() - started)
+            except ClientError as e:
+                recorder.record(time.perf_counter() - started, e)
+
+    started = loop.time()
+    await asyncio.gather(*(worker(index) for index in range(workers)))
+
+    return recorder.report(loop.time() - started)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Connect API facades load generator.')
+    parser.add_argument('--endpoint', default=None, help='Connect endpoint, a local stub server is started if none.')
+    parser.add_argument('--api-key', default='ApiKey SU-000:0000', help='Connect API key.')
+    parser.add_argument('--scenario', choices=SCENARIOS, default='process', help='Operations of each iteration.')
+    parser.add_argument('--workers', type=int, default=8, help='Number of threads (or tasks with --async).')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds to run.')
+    parser.add_argument('--async', dest='use_async', action='store_true', help='Use the async facade.')
+    parser.add_argument('--retries', type=int, default=1, help='Attempts of the facade retry policy.')
+    parser.add_argument('--latency', default='fixed:0.02', help='Stub latency: fixed, uniform, exponential, lognormal.')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Stub ratio of 500 responses.')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Stub ratio of 429 responses.')
+    args = parser.parse_args(argv)
+
+    server = None
+    endpoint = args.endpoint
+    if endpoint is None:
+        server = StubServer(latency=args.latency, error_rate=args.error_rate, throttle_rate=args.throttle_rate)
+        server.start()
+        endpoint = server.endpoint
+
+    retry_policy = RetryPolicy(max_attempts=args.retries) if args.retries > 1 else None
+    try:
+        if args.use_async:
+            client = AsyncConnectClient(args.api_key, endpoint=endpoint, use_specs=False, max_retries=0)
+            api = AsyncConnectOpenAPIFacade(client, retry_policy=retry_policy)
+            report = asyncio.run(run_tasks(api, args.scenario, args.workers, args.duration))
+        else:
+            client = ConnectClient(args.api_key, endpoint=endpoint, use_specs=False, max_retries=0)
+            report = run_threads(
+                lambda: ConnectOpenAPIFacade(client, retry_policy=retry_policy),
+                args.scenario,
+                args.workers,
+                args.duration,
+            )
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    print(f"operations  {report['operations']}")
+    print(f"throughput  {report['throughput']:.1f} ops/s")
+    print(f"latency     p50 {report['p50'] * 1000:.1f} ms, p95 {report['p95'] * 1000:.1f} ms, "
+          f"p99 {report['p99'] * 1000:.1f} ms, max {report['max'] * 1000:.1f} ms")
+    print(f"errors      {report['errors'] or 'none'}")
+
+    return 0
@@ -0,0 +1,281 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Local stand-in of the Connect endpoints used by the facades, with latency
+distributions, error and throttling injection, stateful transitions and
+conditional GETs (ETag and Last-Modified validators).
+Unknown ids are created on the fly from the fixtures, so any id works.
+"""
+from __future__ import annotations
+
+import copy
+from email.utils import formatdate, parsedate_to_datetime
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests')
+PREFIX = '/public/v1'
+
+TRANSITIONS = {
+    'approve': 'approved',
+    'fail': 'failed',
+    'inquire': 'inquiring',
+}
+
+ROUTES = [
+    (re.compile(r'^/assets/(?P<id>[^/?]+)$'), 'asset'),
+    (re.compile(r'^/tiers/(?P<id>[^/?]+)$'), 'tier_configuration'),
+    (re.compile(r'^/tier/configs/(?P<id>[^/?]+)$'), 'tier_configuration'),
+    (re.compile(r'^/requests/(?P<id>[^/?]+)(?:/(?P<action>approve|fail|inquire))?$'), 'asset_request'),
+    (
+        re.compile(r'^/tier/config-requests/(?P<id>[^/?]+)(?:/(?P<action>approve|fail|inquire))?$'),
+        'tier_configuration_request',
+    ),
+]
+
+
+def latency_distribution(spec: str) -> Callable[[], float]:
+    """
+    Builds a latency sampler (seconds) from the given spec:
+
+        fixed:0.02, uniform:0.01,0.05, exponential:0.03, lognormal:-3.5,0.5
+
+    :param spec: str The distribution spec.
+    :return: Callable The latency sampler.
+    """
+    name, _, args = spec.partition(':')
+    values = [float(value) for value in args.split(',')] if args else []
+
+    if name == 'fixed':
+        return lambda: values[0] if values else 0.0
+    if name == 'uniform':
+        return lambda: random.uniform(values[0], values[1])
+    if name == 'exponential':
+        return lambda: random.expovariate(1 / values[0])
+    if name == 'lognormal':
+        return lambda: random.lognormvariate(values[0], values[1])
+
+    raise ValueError(f'Unknown latency distribution `{spec}`.')
+
+
+def _load(name: str) -> dict:
+    with open(os.path.join(FIXTURES, name)) as f:
+        return json.load(f)
+
+
+class StubState:
+    """
+    Thread safe in memory store of the stub entities.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._asset_request = _load('request_asset.json')
+        self._tier_configuration_request = _load('request_tier_config.json')
+        self.entities: Dict[Tuple[str, str], dict] = {}
+        self.modified: Dict[Tuple[str, str], float] = {}
+
+    def _template(self, entity: str, entity_id: str) -> dict:
+        if entity == 'asset':
+            value = copy.deepcopy(self._asset_request['asset'])
+        elif entity == 'tier_configuration':
+            value = copy.deepcopy(self._tier_configuration_request['configuration'])
+        elif entity == 'asset_request':
+            value = copy.deepcopy(self._asset_request)
+            value['status'] = 'pending'
+        else:
+            value = copy.deepcopy(self._tier_configuration_request)
+            value['status'] = 'pending'
+        value['id'] = entity_id
+        return value
+
+    def get(self, entity: str, entity_id: str) -> dict:
+        with self._lock:
+            value = self.entities.get((entity, entity_id))
+            if value is None:
+                value = self.entities[(entity, entity_id)] = self._template(entity, entity_id)
+                self.modified[(entity, entity_id)] = time.time()
+            return copy.deepcopy(value)
+
+    def modified_at(self, entity: str, entity_id: str) -> float:
+        with self._lock:
+            return self.modified.get((entity, entity_id), 0.0)
+
+    def update(self, entity: str, entity_id: str, payload: dict) -> dict:
+        with self._lock:
+            value = self.entities.get((entity, entity_id)) or self._template(entity, entity_id)
+            # asset requests update the asset params, tier configuration requests their own params.
+            target = value['asset'] if entity == 'asset_request' else value
+            params = {param['id']: param for param in target.get('params', [])}
+            source = payload.get('asset', payload) if entity == 'asset_request' else payload
+            for param in source.get('params', []):
+                params.setdefault(param['id'], {'id': param['id']}).update(param)
+            target['params'] = list(params.values())
+
+            self.entities[(entity, entity_id)] = value
+            self.modified[(entity, entity_id)] = time.time()
+            return copy.deepcopy(value)
+
+    def transition(self, entity: str, entity_id: str, action: str) -> Optional[dict]:
+        with self._lock:
+            value = self.entities.get((entity, entity_id)) or self._template(entity, entity_id)
+            if value.get('status') not in ('pending', 'inquiring'):
+                return None
+
+            value['status'] = TRANSITIONS[action]
+            self.entities[(entity, entity_id)] = value
+            self.modified[(entity, entity_id)] = time.time()
+            return copy.deepcopy(value)
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(
+            self,
+            address: Tuple[str, int] = ('127.0.0.1', 0),
+            latency: str = 'fixed:0',
+            error_rate: float = 0.0,
+            throttle_rate: float = 0.0,
+            retry_after: int = 1,
+    ):
+        """
+        :param address: Tuple[str, int] The listening address, port 0 picks a free port.
+        :param latency: str The latency distribution spec, see latency_distribution.
+        :param error_rate: float Ratio of calls failing with 500.
+        :param throttle_rate: float Ratio of calls failing with 429.
+        :param retry_after: int The Retry-After seconds of the throttled calls.
+        """
+        super().__init__(address, StubHandler)
+        self.latency = latency_distribution(latency)
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.state = StubState()
+        self.not_modified = 0
+        self._counters_lock = threading.Lock()
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}{PREFIX}'
+
+    def count_not_modified(self) -> None:
+        # the handlers run on the server threads.
+        with self._counters_lock:
+            self.not_modified += 1
+
+    def start(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server: StubServer
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._handle('GET')
+
+    def do_PUT(self) -> None:
+        self._handle('PUT')
+
+    def do_POST(self) -> None:
+        self._handle('POST')
+
+    def _send(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        content = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _send_entity(self, entity: str, entity_id: str) -> None:
+        value = self.server.state.get(entity, entity_id)
+        modified = self.server.state.modified_at(entity, entity_id)
+        etag = '"{0}"'.format(hashlib.sha1(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest())
+
+        if self._not_modified(etag, modified):
+            self.server.count_not_modified()
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self._send(200, value, {'ETag': etag, 'Last-Modified': formatdate(modified, usegmt=True)})
+
+    def _not_modified(self, etag: str, modified: float) -> bool:
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            return etag in [tag.strip() for tag in if_none_match.split(',')]
+
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is None:
+            return False
+        try:
+            return int(modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+    def _error(self, status: int, code: str, message: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send(status, {'error_code': code, 'errors': [message]}, headers)
+
+    def _handle(self, method: str) -> None:  # noqa: CCR001
+        length = int(self.headers.get('Content-Length') or 0)
+        payload = json.loads(self.rfile.read(length) or b'{}') if length else {}
+
+        time.sleep(max(0.0, self.server.latency()))
+
+        chance = random.random()
+        if chance < self.server.throttle_rate:
+            return self._error(429, 'THROTTLED', 'Too many requests.', {
+                'Retry-After': str(self.server.retry_after),
+            })
+        if chance < self.server.throttle_rate + self.server.error_rate:
+            return self._error(500, 'INTERNAL', 'Injected server error.')
+
+        path = self.path.split('?')[0]
+        if not path.startswith(PREFIX):
+            return self._error(404, 'NOT_FOUND', f'Unknown path {path}.')
+        path = path[len(PREFIX):]
+
+        for pattern, entity in ROUTES:
+            match = pattern.match(path)
+            if match is None:
+                continue
+
+            entity_id, action = match.group('id'), match.groupdict().get('action')
+            if method == 'GET' and action is None:
+                return self._send_entity(entity, entity_id)
+            if method == 'PUT' and action is None and entity.endswith('_request'):
+                return self._send(200, self.server.state.update(entity, entity_id, payload))
+            if method == 'POST' and action is not None:
+                value = self.server.state.transition(entity, entity_id, action)
+                if value is None:
+                    return self._error(
+                        400,
+                        'REQ_003',
+                        f'The request {entity_id} cannot transition to {TRANSITIONS[action]}.',
+                    )
+                return self._send(200, value)
+            return self._error(405, 'NOT_ALLOWED', f'{method} {path} is not supported.')
+
+        return self._error(404, 'NOT_FOUND', f'Unknown path {path}.')
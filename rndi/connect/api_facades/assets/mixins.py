@@ -5,12 +5,28 @@
 #
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+from functools import partial
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
 
-from connect.client import AsyncConnectClient, ClientError, ConnectClient
+from connect.client import AsyncConnectClient, ClientError, ConnectClient, R
 from rndi.connect.business_objects.adapters import Asset, Request
-from rndi.connect.api_facades.assets.contracts import AssetManagementService
+from rndi.connect.api_facades.assets.contracts import AssetManagementService, AsyncAssetManagementService
+from rndi.connect.api_facades.bulk import BulkReport, DEFAULT_MAX_WORKERS, run_bulk, run_bulk_async
+from rndi.connect.api_facades.cache import ASSET, ASSET_REQUEST
 from rndi.connect.api_facades.contracts import OnError, OnSuccess
+from rndi.connect.api_facades.helpers import (
+    changed_parameters,
+    merge_parameters,
+    raise_error,
+    resolve,
+    return_request,
+    rql_select,
+)
+from rndi.connect.api_facades.lazy import materialize
+from rndi.connect.api_facades.mixins import AsyncWithFacadeSupport, WithFacadeSupport
+from rndi.connect.api_facades.pagination import aiterate, DEFAULT_PAGE_SIZE, iterate
+from rndi.connect.api_facades.rate_limit import WRITE
+from rndi.connect.api_facades.views import RequestView
 
 APPROVE = 'approve'
 INQUIRE = 'inquire'
@@ -22,16 +38,103 @@ TEMPLATE_ID = 'template_id'
 ACTIVATION_TILE = 'activation_tile'
 EFFECTIVE_DATE = 'effective_date'
 REASON = 'reason'
+VIEW_EXCLUDED_FIELDS = ['asset.params']
 
+STATUSES = {
+    APPROVE: APPROVED,
+    INQUIRE: INQUIRING,
+    FAIL: FAILED,
+}
 
-class WithAssetFacade(AssetManagementService):
+
+class WithAssetFacade(AssetManagementService, WithFacadeSupport):
     client: Union[ConnectClient, AsyncConnectClient]
 
-    def find_asset(self, asset_id: str) -> Asset:
-        return Asset(self.client.assets[asset_id].get())
+    def find_asset(
+            self,
+            asset_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+    ) -> Asset:
+        fields = rql_select(select, exclude)
+
+        return self._wrap(Asset, self._read(
+            ASSET,
+            asset_id,
+            lambda **kwargs: self._get(self.client.assets[asset_id], fields, **kwargs),
+            fields,
+        ))
+
+    def find_asset_request(
+            self,
+            request_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+    ) -> Request:
+        fields = rql_select(select, exclude)
+
+        return self._wrap(Request, self._read(
+            ASSET_REQUEST,
+            request_id,
+            lambda **kwargs: self._get(self.client.requests[request_id], fields, **kwargs),
+            fields,
+        ))
 
-    def find_asset_request(self, request_id: str) -> Request:
-        return Request(self.client.requests[request_id].get())
+    def iter_assets(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> Iterator[Asset]:
+        for item in iterate(
+            self.client.assets.filter(*rql, **filters).select(*rql_select(select, exclude)),
+            page_size,
+            prefetch,
+            self._page_call('iter_assets'),
+            self._fan_out_pool(),
+        ):
+            yield self._wrap(Asset, item)
+
+    def iter_asset_requests(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> Iterator[Request]:
+        for item in iterate(
+            self.client.requests.filter(*rql, **filters).select(*rql_select(select, exclude)),
+            page_size,
+            prefetch,
+            self._page_call('iter_asset_requests'),
+            self._fan_out_pool(),
+        ):
+            yield self._wrap(Request, item)
+
+    def iter_asset_request_views(
+            self,
+            *rql: Union[str, R],
+            parameters: Optional[Iterable[str]] = None,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            **filters,
+    ) -> Iterator[RequestView]:
+        parameters = list(parameters or [])
+        # the parameters are only transferred if any of them is kept.
+        fields = rql_select(exclude=None if parameters else VIEW_EXCLUDED_FIELDS)
+        for item in iterate(
+            self.client.requests.filter(*rql, **filters).select(*fields),
+            page_size,
+            prefetch,
+            self._page_call('iter_asset_request_views'),
+            self._fan_out_pool(),
+        ):
+            yield RequestView.from_asset_request(item, parameters)
 
     def approve_asset_request(
             self,
@@ -43,7 +146,18 @@ class WithAssetFacade(AssetManagementService):
             on_success: Optional[OnSuccess] = None,
     ) -> Union[Any, Request]:
 
-        request = request if isinstance(request, Request) else Request(request)
+        request = materialize(request, Request)
+
+        if self.outbox is not None:
+            return self._enqueue(
+                'approve_asset_request',
+                request,
+                template_id=template_id,
+                activation_tile=activation_tile,
+                effective_date=effective_date,
+                on_error=on_error,
+                on_success=on_success,
+            )
 
         payload = {
             TEMPLATE_ID: template_id,
@@ -66,7 +180,10 @@ class WithAssetFacade(AssetManagementService):
             on_error: Optional[OnError] = None,
             on_success: Optional[OnSuccess] = None,
     ) -> Union[Any, Request]:
-        request = request if isinstance(request, Request) else Request(request)
+        request = materialize(request, Request)
+
+        if self.outbox is not None:
+            return self._enqueue('fail_asset_request', request, reason=reason, on_error=on_error, on_success=on_success)
 
         payload = {REASON: reason}
         request.with_reason(reason)
@@ -86,7 +203,16 @@ class WithAssetFacade(AssetManagementService):
             on_error: Optional[OnError] = None,
             on_success: Optional[OnSuccess] = None,
     ) -> Union[Any, Request]:
-        request = request if isinstance(request, Request) else Request(request)
+        request = materialize(request, Request)
+
+        if self.outbox is not None:
+            return self._enqueue(
+                'inquire_asset_request',
+                request,
+                template_id=template_id,
+                on_error=on_error,
+                on_success=on_success,
+            )
 
         payload = {
             TEMPLATE_ID: template_id,
@@ -106,27 +232,113 @@ class WithAssetFacade(AssetManagementService):
             parameters: List[Dict[str, Any]],
             on_error: Optional[OnError] = None,
             on_success: Optional[OnSuccess] = None,
+            diff: Optional[bool] = None,
     ) -> Union[Any, Request]:
-        request = request if isinstance(request, Request) else Request(request)
+        request = materialize(request, Request)
 
-        if on_success is None:
-            def on_success(request_: Request) -> Request:
-                return request_
+        if self.outbox is not None:
+            return self._enqueue(
+                'update_asset_request_parameters',
+                request,
+                parameters=parameters,
+                diff=diff,
+                on_error=on_error,
+                on_success=on_success,
+            )
+
+        on_success = return_request if on_success is None else on_success
+        on_error = raise_error if on_error is None else on_error
+
+        if (self.diff_parameter_updates if diff is None else diff):
+            current = request.asset().raw().get('params', [])
+            if self.parameter_coalescer is not None:
+                # the buffered updates will overwrite the server values, the diff must see them.
+                current = merge_parameters(current, self.parameter_coalescer.pending((ASSET_REQUEST, request.id())))
+            parameters = changed_parameters(current, parameters)
+            if not parameters:
+                return on_success(request)
+
+        if self.parameter_coalescer is not None:
+            return self.parameter_coalescer.submit(
+                (ASSET_REQUEST, request.id()),
+                parameters,
+                lambda parameters_: self._put_asset_request_parameters(request.id(), parameters_),
+                lambda updated_: on_success(request.with_asset(updated_.asset())),
+                on_error,
+            )
 
-        if on_error is None:
-            def on_error(error: ClientError):
-                raise error
         try:
-            updated = Request(self.client.requests[request.id()].update(payload={
-                "asset": {
-                    "params": parameters,
-                },
-            }))
+            updated = self._put_asset_request_parameters(request.id(), parameters)
 
             return on_success(request.with_asset(updated.asset()))
         except ClientError as e:
             return on_error(e)
 
+    def _put_asset_request_parameters(self, request_id: str, parameters: List[Dict[str, Any]]) -> Request:
+        response = self._call(lambda: self.client.requests[request_id].update(**self._payload({
+            "asset": {
+                "params": parameters,
+            },
+        })), kind=WRITE, operation='update_asset_request_parameters')
+        self._refresh(ASSET_REQUEST, request_id, response)
+
+        updated = Request(response)
+        if self.cache is not None:
+            self._invalidate((ASSET, updated.asset().id()))
+
+        return updated
+
+    def approve_asset_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            template_id: str,
+            activation_tile: Optional[str] = None,
+            effective_date: Optional[str] = None,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return run_bulk(
+            lambda request: self.approve_asset_request(
+                request,
+                template_id,
+                activation_tile,
+                effective_date,
+                on_error,
+                on_success,
+            ),
+            requests,
+            max_workers,
+        )
+
+    def fail_asset_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            reason: str,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return run_bulk(
+            lambda request: self.fail_asset_request(request, reason, on_error, on_success),
+            requests,
+            max_workers,
+        )
+
+    def inquire_asset_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            template_id: str,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return run_bulk(
+            lambda request: self.inquire_asset_request(request, template_id, on_error, on_success),
+            requests,
+            max_workers,
+        )
+
     def _update_asset_request_status(
             self,
             request: Request,
@@ -135,25 +347,307 @@ class WithAssetFacade(AssetManagementService):
             on_error: Optional[OnError] = None,
             on_success: Optional[OnSuccess] = None,
     ) -> Union[Any, Request]:
-        if on_success is None:
-            def on_success(req: Request):
-                return req
-
-        if on_error is None:
-            def on_error(error: ClientError):
-                raise error
-
-        statuses = {
-            APPROVE: APPROVED,
-            INQUIRE: INQUIRING,
-            FAIL: FAILED,
-        }
+        on_success = return_request if on_success is None else on_success
+        on_error = raise_error if on_error is None else on_error
+
+        if self.parameter_coalescer is not None:
+            # pending parameter updates must reach Connect before the transition.
+            self.parameter_coalescer.flush((ASSET_REQUEST, request.id()))
 
         try:
-            self.client.requests[request.id()](status).post(
-                # cleanup the none values of the payload.
-                payload={k: v for k, v in payload.items() if v is not None},
+            if self._in_status(request, STATUSES.get(status), partial(self._read_asset_request_status, request)):
+                return on_success(request.with_status(STATUSES.get(status)))
+
+            self._call(
+                lambda: self.client.requests[request.id()](status).post(
+                    # cleanup the none values of the payload.
+                    **self._payload({k: v for k, v in payload.items() if v is not None}),
+                ),
+                idempotent=False,
+                kind=WRITE,
+                operation=f'{status}_asset_request',
             )
-            return on_success(request.with_status(statuses.get(status)))
+            if self.cache is not None:
+                self._invalidate((ASSET_REQUEST, request.id()), (ASSET, request.asset().id()))
+            return on_success(request.with_status(STATUSES.get(status)))
         except ClientError as e:
             return on_error(e)
+
+    def _read_asset_request_status(self, request: Request) -> str:
+        return self.find_asset_request(request.id(), exclude=['asset']).status()
+
+
+class AsyncWithAssetFacade(AsyncAssetManagementService, AsyncWithFacadeSupport):
+    client: AsyncConnectClient
+
+    async def find_asset(
+            self,
+            asset_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+    ) -> Asset:
+        fields = rql_select(select, exclude)
+
+        return self._wrap(Asset, await self._read(
+            ASSET,
+            asset_id,
+            lambda **kwargs: self._get(self.client.assets[asset_id], fields, **kwargs),
+            fields,
+        ))
+
+    async def find_asset_request(
+            self,
+            request_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+    ) -> Request:
+        fields = rql_select(select, exclude)
+
+        return self._wrap(Request, await self._read(
+            ASSET_REQUEST,
+            request_id,
+            lambda **kwargs: self._get(self.client.requests[request_id], fields, **kwargs),
+            fields,
+        ))
+
+    async def iter_assets(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> AsyncIterator[Asset]:
+        async for item in aiterate(
+            self.client.assets.filter(*rql, **filters).select(*rql_select(select, exclude)),
+            page_size,
+            prefetch,
+            partial(self._call, operation='iter_assets'),
+        ):
+            yield self._wrap(Asset, item)
+
+    async def iter_asset_requests(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> AsyncIterator[Request]:
+        async for item in aiterate(
+            self.client.requests.filter(*rql, **filters).select(*rql_select(select, exclude)),
+            page_size,
+            prefetch,
+            partial(self._call, operation='iter_asset_requests'),
+        ):
+            yield self._wrap(Request, item)
+
+    async def iter_asset_request_views(
+            self,
+            *rql: Union[str, R],
+            parameters: Optional[Iterable[str]] = None,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            **filters,
+    ) -> AsyncIterator[RequestView]:
+        parameters = list(parameters or [])
+        # the parameters are only transferred if any of them is kept.
+        fields = rql_select(exclude=None if parameters else VIEW_EXCLUDED_FIELDS)
+        async for item in aiterate(
+            self.client.requests.filter(*rql, **filters).select(*fields),
+            page_size,
+            prefetch,
+            partial(self._call, operation='iter_asset_request_views'),
+        ):
+            yield RequestView.from_asset_request(item, parameters)
+
+    async def approve_asset_request(
+            self,
+            request: Union[dict, Request],
+            template_id: str,
+            activation_tile: Optional[str] = None,
+            effective_date: Optional[str] = None,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> Union[Any, Request]:
+        request = materialize(request, Request)
+
+        payload = {
+            TEMPLATE_ID: template_id,
+            ACTIVATION_TILE: activation_tile,
+            EFFECTIVE_DATE: effective_date,
+        }
+
+        return await self._update_asset_request_status(
+            request,
+            APPROVE,
+            payload,
+            on_error,
+            on_success,
+        )
+
+    async def fail_asset_request(
+            self,
+            request: Union[dict, Request],
+            reason: str,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> Union[Any, Request]:
+        request = materialize(request, Request)
+
+        payload = {REASON: reason}
+        request.with_reason(reason)
+
+        return await self._update_asset_request_status(
+            request,
+            FAIL,
+            payload,
+            on_error,
+            on_success,
+        )
+
+    async def inquire_asset_request(
+            self,
+            request: Union[dict, Request],
+            template_id: str,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> Union[Any, Request]:
+        request = materialize(request, Request)
+
+        payload = {
+            TEMPLATE_ID: template_id,
+        }
+
+        return await self._update_asset_request_status(
+            request,
+            INQUIRE,
+            payload,
+            on_error,
+            on_success,
+        )
+
+    async def update_asset_request_parameters(
+            self,
+            request: Union[dict, Request],
+            parameters: List[Dict[str, Any]],
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+            diff: Optional[bool] = None,
+    ) -> Union[Any, Request]:
+        request = materialize(request, Request)
+
+        on_success = return_request if on_success is None else on_success
+        on_error = raise_error if on_error is None else on_error
+
+        if (self.diff_parameter_updates if diff is None else diff):
+            parameters = changed_parameters(request.asset().raw().get('params', []), parameters)
+            if not parameters:
+                return await resolve(on_success(request))
+
+        try:
+            updated = await self._put_asset_request_parameters(request.id(), parameters)
+
+            return await resolve(on_success(request.with_asset(updated.asset())))
+        except ClientError as e:
+            return await resolve(on_error(e))
+
+    async def _put_asset_request_parameters(self, request_id: str, parameters: List[Dict[str, Any]]) -> Request:
+        response = await self._call(lambda: self.client.requests[request_id].update(**self._payload({
+            "asset": {
+                "params": parameters,
+            },
+        })), kind=WRITE, operation='update_asset_request_parameters')
+        await self._refresh(ASSET_REQUEST, request_id, response)
+
+        updated = Request(response)
+        if self.cache is not None:
+            await self._invalidate((ASSET, updated.asset().id()))
+
+        return updated
+
+    async def approve_asset_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            template_id: str,
+            activation_tile: Optional[str] = None,
+            effective_date: Optional[str] = None,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return await run_bulk_async(
+            lambda request: self.approve_asset_request(
+                request,
+                template_id,
+                activation_tile,
+                effective_date,
+                on_error,
+                on_success,
+            ),
+            requests,
+            max_workers,
+        )
+
+    async def fail_asset_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            reason: str,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return await run_bulk_async(
+            lambda request: self.fail_asset_request(request, reason, on_error, on_success),
+            requests,
+            max_workers,
+        )
+
+    async def inquire_asset_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            template_id: str,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return await run_bulk_async(
+            lambda request: self.inquire_asset_request(request, template_id, on_error, on_success),
+            requests,
+            max_workers,
+        )
+
+    async def _update_asset_request_status(
+            self,
+            request: Request,
+            status: str,
+            payload: Dict[str, Any] = None,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> Union[Any, Request]:
+        on_success = return_request if on_success is None else on_success
+        on_error = raise_error if on_error is None else on_error
+
+        try:
+            if await self._in_status(request, STATUSES.get(status), partial(self._read_asset_request_status, request)):
+                return await resolve(on_success(request.with_status(STATUSES.get(status))))
+
+            await self._call(
+                lambda: self.client.requests[request.id()](status).post(
+                    # cleanup the none values of the payload.
+                    **self._payload({k: v for k, v in payload.items() if v is not None}),
+                ),
+                idempotent=False,
+                kind=WRITE,
+                operation=f'{status}_asset_request',
+            )
+            if self.cache is not None:
+                await self._invalidate((ASSET_REQUEST, request.id()), (ASSET, request.asset().id()))
+            return await resolve(on_success(request.with_status(STATUSES.get(status))))
+        except ClientError as e:
+            return await resolve(on_error(e))
+
+    async def _read_asset_request_status(self, request: Request) -> str:
+        return (await self.find_asset_request(request.id(), exclude=['asset'])).status()
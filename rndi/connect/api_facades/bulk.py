@@ -0,0 +1,121 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, Iterator, List, Optional, Union
+
+from rndi.connect.business_objects.adapters import Request
+from rndi.connect.api_facades.lazy import materialize
+
+DEFAULT_MAX_WORKERS = 8
+
+
+class BulkItemResult:
+    def __init__(self, request_id: str, result: Any = None, error: Optional[Exception] = None):
+        self.request_id = request_id
+        self.result = result
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        state = 'ok' if self.succeeded else repr(self.error)
+        return f'<BulkItemResult {self.request_id}: {state}>'
+
+
+class BulkReport:
+    """
+    Per item report of a bulk operation, items are kept in the same order
+    as the input requests.
+    """
+
+    def __init__(self, items: List[BulkItemResult]):
+        self.items = items
+
+    def __iter__(self) -> Iterator[BulkItemResult]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def succeeded(self) -> List[BulkItemResult]:
+        return [item for item in self.items if item.succeeded]
+
+    @property
+    def failed(self) -> List[BulkItemResult]:
+        return [item for item in self.items if not item.succeeded]
+
+
+def _validate_max_workers(max_workers: int) -> None:
+    if max_workers <= 0:
+        raise ValueError('`max_workers` must be a positive, non-zero integer.')
+
+
+def _to_request(request: Union[dict, Request]) -> Request:
+    return materialize(request, Request)
+
+
+def _run_item(operation: Callable[[Request], Any], request: Request) -> BulkItemResult:
+    try:
+        return BulkItemResult(request.id(), result=operation(request))
+    except Exception as e:
+        return BulkItemResult(request.id(), error=e)
+
+
+def run_bulk(
+        operation: Callable[[Request], Any],
+        requests: Iterable[Union[dict, Request]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+) -> BulkReport:
+    """
+    Runs the given operation for each request concurrently in a thread pool.
+
+    :param operation: Callable The single request operation, it receives the Request.
+    :param requests: Iterable The requests to process.
+    :param max_workers: int The max number of concurrent operations.
+    :return: BulkReport The per item report.
+    """
+    _validate_max_workers(max_workers)
+
+    requests = [_to_request(request) for request in requests]
+    if not requests:
+        return BulkReport([])
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+        return BulkReport(list(executor.map(lambda request: _run_item(operation, request), requests)))
+
+
+async def run_bulk_async(
+        operation: Callable[[Request], Awaitable[Any]],
+        requests: Iterable[Union[dict, Request]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+) -> BulkReport:
+    """
+    Runs the given coroutine operation for each request concurrently as tasks,
+    at most max_workers at the same time.
+
+    :param operation: Callable The single request coroutine operation, it receives the Request.
+    :param requests: Iterable The requests to process.
+    :param max_workers: int The max number of concurrent operations.
+    :return: BulkReport The per item report.
+    """
+    _validate_max_workers(max_workers)
+
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def _run(request: Request) -> BulkItemResult:
+        async with semaphore:
+            try:
+                return BulkItemResult(request.id(), result=await operation(request))
+            except Exception as e:
+                return BulkItemResult(request.id(), error=e)
+
+    return BulkReport(list(await asyncio.gather(*[_run(_to_request(request)) for request in requests])))
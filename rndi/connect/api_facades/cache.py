@@ -0,0 +1,570 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import copy
+from datetime import datetime
+from email.utils import format_datetime
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+ASSET = 'asset'
+ASSET_REQUEST = 'asset_request'
+TIER_CONFIGURATION = 'tier_configuration'
+TIER_CONFIGURATION_REQUEST = 'tier_configuration_request'
+
+ETAG = 'ETag'
+LAST_MODIFIED = 'Last-Modified'
+IF_NONE_MATCH = 'If-None-Match'
+IF_MODIFIED_SINCE = 'If-Modified-Since'
+NOT_MODIFIED = 304
+
+
+def updated_at(value: dict) -> Optional[str]:
+    """
+    Extracts the last update timestamp of the given raw entity as HTTP date,
+    requests carry it in `updated`, assets and tier configurations in `events`.
+
+    :param value: dict The raw entity.
+    :return: Optional[str] The HTTP date or None if unknown.
+    """
+    timestamp = value.get('updated') or ((value.get('events') or {}).get('updated') or {}).get('at')
+    if not isinstance(timestamp, str):
+        return None
+    try:
+        moment = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return format_datetime(moment, usegmt=True) if moment.tzinfo is not None else None
+
+
+def response_validators(response: Any) -> Dict[str, str]:
+    """
+    :param response: Any The requests or httpx response.
+    :return: Dict[str, str] The ETag and Last-Modified headers of the given response (if any).
+    """
+    headers = getattr(response, 'headers', None) or {}
+    return {name: headers[name] for name in (ETAG, LAST_MODIFIED) if headers.get(name)}
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.revalidations = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+            'revalidations': self.revalidations,
+        }
+
+
+class InvalidationLog:
+    """
+    Sequence of the last invalidation of each entity, a read that started
+    before the invalidation of its entity must not store its (stale) result.
+    Only the last max_size keys are tracked, the reads older than the oldest
+    forgotten invalidation are considered stale.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """
+        :param max_size: int Max number of tracked entities.
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._floor = 0
+        self._last: OrderedDict[Tuple[str, str], int] = OrderedDict()
+
+    def current(self) -> int:
+        """
+        :return: int The sequence of the last invalidation, captured when a read starts.
+        """
+        with self._lock:
+            return self._sequence
+
+    def invalidate(self, entity: str, entity_id: str) -> None:
+        with self._lock:
+            self._sequence += 1
+            self._last[(entity, entity_id)] = self._sequence
+            self._last.move_to_end((entity, entity_id))
+            if len(self._last) > self.max_size:
+                _, self._floor = self._last.popitem(last=False)
+
+    def changed_since(self, entity: str, entity_id: str, sequence: int) -> bool:
+        """
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        :param sequence: int The sequence captured when the read started.
+        :return: bool True if the entity was invalidated after the read started.
+        """
+        with self._lock:
+            return self._last.get((entity, entity_id), self._floor) > sequence
+
+
+class Cache(ABC):
+    """
+    Entity cache contract, the entities are stored by (entity type, id) with
+    a time to live and the validators of the response that returned them.
+    """
+
+    ttl: float = 60.0
+    ttls: Dict[str, float] = {}
+    revalidate: bool = False
+    # True if the cache methods block on I/O, the async facades call them off the event loop.
+    blocking: bool = False
+    stats: CacheStats
+
+    @abstractmethod
+    def get(self, entity: str, entity_id: str) -> Optional[dict]:
+        """
+        Returns a copy of the cached entity or None if it is missing or expired.
+
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        :return: Optional[dict] The cached entity.
+        """
+
+    @abstractmethod
+    def set(self, entity: str, entity_id: str, value: dict, validators: Optional[Dict[str, str]] = None) -> None:
+        """
+        Stores a copy of the given entity, evicting the least recently used
+        entries if the cache is full.
+
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        :param value: dict The raw entity.
+        :param validators: Optional[Dict[str, str]] The ETag and Last-Modified headers of the response.
+        """
+
+    @abstractmethod
+    def peek(self, entity: str, entity_id: str) -> Optional[Tuple[dict, Dict[str, str]]]:
+        """
+        Returns the cached entity and its validators, expired or not, without
+        updating the stats or the recency. The entity must not be modified.
+
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        :return: Optional[Tuple[dict, Dict[str, str]]] The entity and validators.
+        """
+
+    @abstractmethod
+    def revalidated(self, entity: str, entity_id: str, validators: Optional[Dict[str, str]] = None) -> Optional[dict]:
+        """
+        Renews the time to live of the given entity after a 304 Not Modified.
+
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        :param validators: Optional[Dict[str, str]] The validators of the 304 response, they replace the stored ones.
+        :return: Optional[dict] A copy of the cached entity, None if it was removed meanwhile.
+        """
+
+    @abstractmethod
+    def invalidate(self, entity: str, entity_id: Optional[str]) -> None:
+        """
+        Removes the given entity from the cache.
+
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def conditional_headers(self, entity: str, entity_id: str) -> Dict[str, str]:
+        """
+        Builds the conditional request headers of the given expired entity, empty
+        if revalidation is disabled or the entity is not cached.
+
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        :return: Dict[str, str] The If-None-Match and If-Modified-Since headers.
+        """
+        if not self.revalidate:
+            return {}
+
+        entry = self.peek(entity, entity_id)
+        if entry is None:
+            return {}
+        value, validators = entry
+
+        headers = {}
+        if validators.get(ETAG):
+            headers[IF_NONE_MATCH] = validators[ETAG]
+        modified = validators.get(LAST_MODIFIED) or updated_at(value)
+        if modified:
+            headers[IF_MODIFIED_SINCE] = modified
+        return headers
+
+    def _ttl(self, entity: str) -> float:
+        return self.ttls.get(entity, self.ttl)
+
+
+class EntityCache(Cache):
+    """
+    Bounded, thread safe, LRU cache with per entity TTL for the raw Connect
+    entities retrieved by the facades.
+
+    Entries are stored and returned as deep copies, so the Business Objects
+    built on top of them can be freely mutated by the callers.
+
+    With revalidation enabled, the expired entries are kept with their
+    validators (ETag, Last-Modified or the entity update timestamp), so the
+    facades can revalidate them with conditional requests.
+    """
+
+    def __init__(
+            self,
+            max_size: int = 1024,
+            ttl: float = 60.0,
+            ttls: Optional[Dict[str, float]] = None,
+            clock: Callable[[], float] = time.monotonic,
+            revalidate: bool = False,
+    ):
+        """
+        :param max_size: int Max number of entries, the least recently used is evicted first.
+        :param ttl: float Default time to live in seconds.
+        :param ttls: Dict[str, float] Time to live by entity (asset, asset_request...).
+        :param clock: Callable Monotonic clock, mainly for testing purposes.
+        :param revalidate: bool Keep the expired entries to revalidate them with conditional requests.
+        """
+        if max_size <= 0:
+            raise ValueError('`max_size` must be a positive, non-zero integer.')
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.revalidate = revalidate
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[Tuple[str, str], Tuple[float, dict, Dict[str, str]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, entity: str, entity_id: str) -> Optional[dict]:
+        """
+        Returns a copy of the cached entity or None if it is missing or expired.
+
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        :return: Optional[dict] The cached entity.
+        """
+        key = (entity, entity_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            expires_at, value, _ = entry
+            if expires_at <= self._clock():
+                if not self.revalidate:
+                    del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+
+        return copy.deepcopy(value)
+
+    def set(self, entity: str, entity_id: str, value: dict, validators: Optional[Dict[str, str]] = None) -> None:
+        """
+        Stores a copy of the given entity, evicting the least recently used
+        entries if the cache is full.
+
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        :param value: dict The raw entity.
+        :param validators: Optional[Dict[str, str]] The ETag and Last-Modified headers of the response.
+        """
+        if entity_id is None:
+            return
+
+        key = (entity, entity_id)
+        entry = (self._clock() + self._ttl(entity), copy.deepcopy(value), dict(validators or {}))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def peek(self, entity: str, entity_id: str) -> Optional[Tuple[dict, Dict[str, str]]]:
+        with self._lock:
+            entry = self._entries.get((entity, entity_id))
+        if entry is None:
+            return None
+        return entry[1], entry[2]
+
+    def revalidated(self, entity: str, entity_id: str, validators: Optional[Dict[str, str]] = None) -> Optional[dict]:
+        """
+        Renews the time to live of the given entity after a 304 Not Modified.
+
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        :param validators: Optional[Dict[str, str]] The validators of the 304 response, they replace the stored ones.
+        :return: Optional[dict] A copy of the cached entity, None if it was removed meanwhile.
+        """
+        key = (entity, entity_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            _, value, current = entry
+            expires_at = self._clock() + self._ttl(entity)
+            self._entries[key] = (expires_at, value, {**current, **(validators or {})})
+            self._entries.move_to_end(key)
+            self.stats.revalidations += 1
+
+        return copy.deepcopy(value)
+
+    def invalidate(self, entity: str, entity_id: Optional[str]) -> None:
+        """
+        Removes the given entity from the cache.
+
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        """
+        with self._lock:
+            if self._entries.pop((entity, entity_id), None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteEntityCache(Cache):
+    """
+    Persistent entity cache stored in the given SQLite file, every worker
+    process using the same file shares the entries, so restarted or forked
+    workers start warm and one worker fetch serves the others.
+
+    The LRU order is approximate: the last access time of an entry is only
+    written when it is older than the touch interval, so most reads do not
+    take the database write lock. The stats are kept per process.
+    """
+
+    blocking = True
+
+    def __init__(
+            self,
+            path: str,
+            max_size: int = 10000,
+            ttl: float = 60.0,
+            ttls: Optional[Dict[str, float]] = None,
+            clock: Callable[[], float] = time.time,
+            revalidate: bool = False,
+            touch_interval: float = 1.0,
+            timeout: float = 30.0,
+    ):
+        """
+        :param path: str The SQLite database file, shared by the processes.
+        :param max_size: int Max number of entries, the least recently used is evicted first.
+        :param ttl: float Default time to live in seconds.
+        :param ttls: Dict[str, float] Time to live by entity (asset, asset_request...).
+        :param clock: Callable The wall clock, it must be shared by the processes.
+        :param revalidate: bool Keep the expired entries to revalidate them with conditional requests.
+        :param touch_interval: float Min seconds between two updates of the last access time of an entry.
+        :param timeout: float Seconds to wait for the database lock.
+        """
+        if max_size <= 0:
+            raise ValueError('`max_size` must be a positive, non-zero integer.')
+
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.revalidate = revalidate
+        self.touch_interval = touch_interval
+        self.timeout = timeout
+        self.stats = CacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        connection = self._connect()
+        try:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS entities ('
+                'entity TEXT NOT NULL, '
+                'entity_id TEXT NOT NULL, '
+                'value TEXT NOT NULL, '
+                'validators TEXT NOT NULL, '
+                'expires_at REAL NOT NULL, '
+                'accessed_at REAL NOT NULL, '
+                'PRIMARY KEY (entity, entity_id))',
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS entities_accessed_at ON entities (accessed_at)')
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            setattr(self.stats, stat, getattr(self.stats, stat) + 1)
+
+    def __len__(self) -> int:
+        connection = self._connect()
+        try:
+            return connection.execute('SELECT COUNT(*) FROM entities').fetchone()[0]
+        finally:
+            connection.close()
+
+    def get(self, entity: str, entity_id: str) -> Optional[dict]:
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                'SELECT value, expires_at, accessed_at FROM entities WHERE entity = ? AND entity_id = ?',
+                (entity, entity_id),
+            ).fetchone()
+            if row is None:
+                self._count('misses')
+                return None
+
+            value, expires_at, accessed_at = row
+            now = self._clock()
+            if expires_at <= now:
+                if not self.revalidate:
+                    connection.execute(
+                        'DELETE FROM entities WHERE entity = ? AND entity_id = ? AND expires_at <= ?',
+                        (entity, entity_id, now),
+                    )
+                self._count('expirations')
+                self._count('misses')
+                return None
+
+            if now - accessed_at >= self.touch_interval:
+                connection.execute(
+                    'UPDATE entities SET accessed_at = ? WHERE entity = ? AND entity_id = ?',
+                    (now, entity, entity_id),
+                )
+        finally:
+            connection.close()
+
+        self._count('hits')
+        return json.loads(value)
+
+    def set(self, entity: str, entity_id: str, value: dict, validators: Optional[Dict[str, str]] = None) -> None:
+        if entity_id is None:
+            return
+
+        now = self._clock()
+        row = (json.dumps(value), json.dumps(validators or {}), now + self._ttl(entity), now, entity, entity_id)
+        connection = self._connect()
+        try:
+            updated = connection.execute(
+                'UPDATE entities SET value = ?, validators = ?, expires_at = ?, accessed_at = ? '
+                'WHERE entity = ? AND entity_id = ?',
+                row,
+            ).rowcount
+            if updated:
+                # a replaced entry does not change the size, the entries are only counted on inserts.
+                return
+
+            connection.execute(
+                'INSERT OR REPLACE INTO entities (value, validators, expires_at, accessed_at, entity, entity_id) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                row,
+            )
+            overflow = connection.execute('SELECT COUNT(*) FROM entities').fetchone()[0] - self.max_size
+            if overflow > 0:
+                evicted = connection.execute(
+                    'DELETE FROM entities WHERE rowid IN (SELECT rowid FROM entities ORDER BY accessed_at LIMIT ?)',
+                    (overflow,),
+                ).rowcount
+                with self._lock:
+                    self.stats.evictions += evicted
+        finally:
+            connection.close()
+
+    def peek(self, entity: str, entity_id: str) -> Optional[Tuple[dict, Dict[str, str]]]:
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                'SELECT value, validators FROM entities WHERE entity = ? AND entity_id = ?',
+                (entity, entity_id),
+            ).fetchone()
+        finally:
+            connection.close()
+
+        if row is None:
+            return None
+        return json.loads(row[0]), json.loads(row[1])
+
+    def revalidated(self, entity: str, entity_id: str, validators: Optional[Dict[str, str]] = None) -> Optional[dict]:
+        now = self._clock()
+        connection = self._connect()
+        try:
+            # the immediate transaction takes the write lock, the entry can not change between the read and the update.
+            connection.execute('BEGIN IMMEDIATE')
+            row = connection.execute(
+                'SELECT value, validators FROM entities WHERE entity = ? AND entity_id = ?',
+                (entity, entity_id),
+            ).fetchone()
+            if row is None:
+                connection.execute('COMMIT')
+                return None
+
+            value, current = row
+            current = json.dumps({**json.loads(current), **(validators or {})})
+            connection.execute(
+                'UPDATE entities SET validators = ?, expires_at = ?, accessed_at = ? '
+                'WHERE entity = ? AND entity_id = ?',
+                (current, now + self._ttl(entity), now, entity, entity_id),
+            )
+            connection.execute('COMMIT')
+        except Exception:
+            if connection.in_transaction:
+                connection.execute('ROLLBACK')
+            raise
+        finally:
+            connection.close()
+
+        self._count('revalidations')
+        return json.loads(value)
+
+    def invalidate(self, entity: str, entity_id: Optional[str]) -> None:
+        connection = self._connect()
+        try:
+            deleted = connection.execute(
+                'DELETE FROM entities WHERE entity = ? AND entity_id = ?',
+                (entity, entity_id),
+            ).rowcount
+        finally:
+            connection.close()
+
+        if deleted:
+            self._count('invalidations')
+
+    def clear(self) -> None:
+        connection = self._connect()
+        try:
+            connection.execute('DELETE FROM entities')
+        finally:
+            connection.close()
@@ -0,0 +1,192 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from connect.client import ClientError
+
+
+class _Waiter:
+    def __init__(
+            self,
+            future: Future,
+            complete: Callable[[Any], Any],
+            fail: Callable[[ClientError], Any],
+    ):
+        self.future = future
+        self.complete = complete
+        self.fail = fail
+
+
+class _Batch:
+    def __init__(self, send: Callable[[List[Dict[str, Any]]], Any]):
+        self.send = send
+        self.parameters: OrderedDict[Any, Dict[str, Any]] = OrderedDict()
+        self.waiters: List[_Waiter] = []
+
+
+class ParameterUpdateCoalescer:
+    """
+    Buffers the parameter updates by key (usually the request id) during the
+    given window, or until an explicit flush, merging them by parameter id
+    (last write wins) to send them in one single call. The expired windows
+    are flushed by one long-lived flusher thread, so the callbacks of those
+    updates run on that thread; explicit flushes run on the calling thread.
+    """
+
+    def __init__(self, window: Optional[float] = 0.05, clock: Callable[[], float] = time.monotonic):
+        """
+        :param window: Optional[float] Seconds to buffer the updates, None to only flush explicitly.
+        :param clock: Callable The monotonic clock used by the windows.
+        """
+        self.window = window
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._batches: Dict[Hashable, _Batch] = {}
+        self._sending: Dict[Hashable, list] = {}
+        self._due: List[tuple] = []
+        self._sequence = itertools.count()
+        self._wake = threading.Condition(self._lock)
+        self._flusher: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._batches)
+
+    def pending(self, key: Hashable) -> List[Dict[str, Any]]:
+        """
+        :param key: Hashable The buffer key.
+        :return: List[Dict[str, Any]] The merged parameters buffered and not sent yet.
+        """
+        with self._lock:
+            batch = self._batches.get(key)
+            return [] if batch is None else [dict(parameter) for parameter in batch.parameters.values()]
+
+    def submit(
+            self,
+            key: Hashable,
+            parameters: List[Dict[str, Any]],
+            send: Callable[[List[Dict[str, Any]]], Any],
+            complete: Callable[[Any], Any],
+            fail: Callable[[ClientError], Any],
+    ) -> Future:
+        """
+        Buffers the given parameters update.
+
+        :param key: Hashable The buffer key, usually (entity, request id).
+        :param parameters: List[Dict[str, Any]] The parameters to update.
+        :param send: Callable Sends the merged parameters, the latest submitted one is used.
+        :param complete: Callable Receives the send result, its result resolves the future.
+        :param fail: Callable Receives the send error, its result resolves the future.
+        :return: Future Resolved once the buffered updates are flushed.
+        """
+        future = Future()
+        with self._lock:
+            batch = self._batches.get(key)
+            if batch is None:
+                batch = self._batches[key] = _Batch(send)
+                if self.window is not None:
+                    heapq.heappush(self._due, (self.clock() + self.window, next(self._sequence), key, batch))
+                    self._start_flusher()
+                    self._wake.notify()
+
+            batch.send = send
+            batch.waiters.append(_Waiter(future, complete, fail))
+            for parameter in parameters:
+                batch.parameters.setdefault(parameter.get('id'), {}).update(parameter)
+
+        return future
+
+    def _start_flusher(self) -> None:
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(
+                target=self._flush_expired,
+                name='connect-parameter-coalescer',
+                daemon=True,
+            )
+            self._flusher.start()
+
+    def _flush_expired(self) -> None:
+        while True:
+            with self._lock:
+                while not self._due or self._due[0][0] > self.clock():
+                    self._wake.wait(None if not self._due else self._due[0][0] - self.clock())
+                _, _, key, batch = heapq.heappop(self._due)
+                if self._batches.get(key) is not batch:
+                    # flushed explicitly meanwhile.
+                    continue
+            try:
+                self._flush(key, batch)
+            except Exception:
+                # the waiters already received the error.
+                pass
+
+    def flush(self, key: Optional[Hashable] = None) -> None:
+        """
+        Sends the buffered updates of the given key, or of every key if None.
+        Waits for any in-flight send of the same key to keep the order.
+
+        :param key: Optional[Hashable] The buffer key.
+        """
+        if key is None:
+            with self._lock:
+                keys = list(self._batches.keys())
+        else:
+            keys = [key]
+        for key_ in keys:
+            self._flush(key_)
+
+    def _flush(self, key: Hashable, expected: Optional[_Batch] = None) -> None:
+        with self._lock:
+            sending = self._sending.setdefault(key, [threading.Lock(), 0])
+            sending[1] += 1
+
+        resolutions: List[tuple] = []
+        try:
+            with sending[0]:
+                with self._lock:
+                    batch = self._batches.get(key)
+                    if batch is not None and (expected is None or batch is expected):
+                        del self._batches[key]
+                    else:
+                        batch = None
+                if batch is not None:
+                    resolutions = self._send(batch)
+        finally:
+            with self._lock:
+                sending[1] -= 1
+                if sending[1] == 0:
+                    del self._sending[key]
+
+        # the callbacks run once the key is released, they may update or transition the same request.
+        for future, callback, value in resolutions:
+            _resolve(future, callback, value)
+
+    @staticmethod
+    def _send(batch: _Batch) -> List[tuple]:
+        try:
+            result = batch.send(list(batch.parameters.values()))
+        except ClientError as e:
+            return [(waiter.future, waiter.fail, e) for waiter in batch.waiters]
+        except Exception as e:
+            for waiter in batch.waiters:
+                waiter.future.set_exception(e)
+            raise
+
+        return [(waiter.future, waiter.complete, result) for waiter in batch.waiters]
+
+
+def _resolve(future: Future, callback: Callable[[Any], Any], value: Any) -> None:
+    try:
+        future.set_result(callback(value))
+    except Exception as e:
+        future.set_exception(e)
@@ -0,0 +1,171 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import json
+from typing import Any, Dict, List, Optional, Union
+
+from connect.client import AsyncConnectClient, ConnectClient
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+JSON_CONTENT_TYPE = 'application/json'
+
+
+class JSONCodec(ABC):
+    """
+    Encodes the facade payloads and decodes the Connect responses. Once bound to
+    a client, every JSON response of the client is decoded through the codec.
+    """
+
+    name: str = 'json'
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """
+        :param value: Any The JSON serializable value.
+        :return: bytes The UTF-8 JSON document.
+        """
+
+    @abstractmethod
+    def _loads(self, data: Union[bytes, str]) -> Any:
+        pass
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        :param data: Union[bytes, str] The JSON document.
+        :return: Any The decoded value.
+        :raise json.JSONDecodeError: If the document is not valid JSON, whatever the codec.
+        """
+        try:
+            return self._loads(data)
+        except json.JSONDecodeError:
+            raise
+        except ValueError as e:
+            text = data.decode('utf-8', 'replace') if isinstance(data, bytes) else data
+            raise json.JSONDecodeError(str(e), text, 0) from e
+
+    def payload(self, value: Optional[Dict[str, Any]], content: str = 'data') -> Dict[str, Any]:
+        """
+        Builds the client call keyword arguments sending the given payload
+        encoded by the codec.
+
+        :param value: Optional[Dict[str, Any]] The payload.
+        :param content: str The body keyword argument: data (requests) or content (httpx).
+        :return: Dict[str, Any] The call keyword arguments.
+        """
+        if not value:
+            return {'payload': value}
+        return {content: self.dumps(value), 'headers': {'Content-Type': JSON_CONTENT_TYPE}}
+
+    def _decode_response(self, response: Any, *args: Any, **kwargs: Any) -> Any:
+        response.json = lambda **_: self.loads(response.content)
+        return response
+
+    async def _decode_async_response(self, response: Any) -> None:
+        await response.aread()
+        response.json = lambda **_: self.loads(response.content)
+
+    def bind(self, client: Union[ConnectClient, AsyncConnectClient]) -> Union[ConnectClient, AsyncConnectClient]:
+        """
+        Makes the given client (its session in the current thread) decode the
+        responses through the codec.
+
+        :param client: Union[ConnectClient, AsyncConnectClient] The client.
+        :return: Union[ConnectClient, AsyncConnectClient] The same client.
+        """
+        if isinstance(client, AsyncConnectClient):
+            hooks = client._session.event_hooks
+            if self._decode_async_response not in hooks['response']:
+                hooks['response'] = hooks['response'] + [self._decode_async_response]
+                client._session.event_hooks = hooks
+        else:
+            hooks: List[Any] = client._session.hooks['response']
+            if self._decode_response not in hooks:
+                hooks.append(self._decode_response)
+        return client
+
+
+class StdlibJSONCodec(JSONCodec):
+    name = 'json'
+
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+    def _loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('OrjsonCodec requires the orjson package: pip install orjson')
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def _loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    name = 'msgspec'
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError('MsgspecCodec requires the msgspec package: pip install msgspec')
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def _loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+CODECS = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    StdlibJSONCodec.name: StdlibJSONCodec,
+}
+
+
+def available_codecs() -> List[str]:
+    """
+    :return: List[str] The names of the installed codecs, fastest first.
+    """
+    installed = {'orjson': orjson is not None, 'msgspec': msgspec is not None, 'json': True}
+    return [name for name in CODECS if installed[name]]
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Builds the codec with the given name, or the fastest installed one: orjson,
+    msgspec and the standard library json as fallback.
+
+    :param name: Optional[str] The codec name: orjson, msgspec or json.
+    :return: JSONCodec The codec.
+    """
+    if name is None:
+        name = available_codecs()[0]
+    if name not in CODECS:
+        raise ValueError(f'Unknown JSON codec `{name}`, expected one of {", ".join(CODECS)}.')
+    return CODECS[name]()
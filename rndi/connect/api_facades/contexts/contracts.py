@@ -0,0 +1,92 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from rndi.connect.business_objects.adapters import Asset, Request, TierConfiguration
+
+
+class AssetRequestContext:
+    def __init__(
+            self,
+            request: Request,
+            asset: Optional[Asset] = None,
+            tier1: Optional[TierConfiguration] = None,
+            tier2: Optional[TierConfiguration] = None,
+    ):
+        """
+        :param request: Request The Asset Request.
+        :param asset: Optional[Asset] The full Asset of the request.
+        :param tier1: Optional[TierConfiguration] The tier 1 configuration of the asset product (if any).
+        :param tier2: Optional[TierConfiguration] The tier 2 configuration of the asset product (if any).
+        """
+        self.request = request
+        self.asset = asset
+        self.tier1 = tier1
+        self.tier2 = tier2
+
+
+class TierConfigurationRequestContext:
+    def __init__(
+            self,
+            request: Request,
+            tier_configuration: Optional[TierConfiguration] = None,
+            parent: Optional[TierConfiguration] = None,
+    ):
+        """
+        :param request: Request The Tier Configuration Request.
+        :param tier_configuration: Optional[TierConfiguration] The full Tier Configuration of the request.
+        :param parent: Optional[TierConfiguration] The tier 1 configuration of a tier 2 request (if any).
+        """
+        self.request = request
+        self.tier_configuration = tier_configuration
+        self.parent = parent
+
+
+class RequestContextService(ABC):
+    @abstractmethod
+    def find_asset_request_context(self, request_id: str) -> AssetRequestContext:
+        """
+        Retrieves the Asset Request and then, concurrently, its Asset and the tier 1
+        and tier 2 configurations of the asset product.
+
+        :param request_id: str The unique Asset Request id: PR-XXXX-XXXX-XXXX-XXX
+        :return: AssetRequestContext The request context.
+        """
+
+    @abstractmethod
+    def find_tier_configuration_request_context(self, request_id: str) -> TierConfigurationRequestContext:
+        """
+        Retrieves the Tier Configuration Request and then, concurrently, its Tier
+        Configuration and the tier 1 configuration of tier 2 requests.
+
+        :param request_id: str The unique Tier Configuration Request id: TCR-XXX-XXX-XXX-XXX
+        :return: TierConfigurationRequestContext The request context.
+        """
+
+
+class AsyncRequestContextService(ABC):
+    @abstractmethod
+    async def find_asset_request_context(self, request_id: str) -> AssetRequestContext:
+        """
+        Retrieves the Asset Request and then, concurrently, its Asset and the tier 1
+        and tier 2 configurations of the asset product.
+
+        :param request_id: str The unique Asset Request id: PR-XXXX-XXXX-XXXX-XXX
+        :return: AssetRequestContext The request context.
+        """
+
+    @abstractmethod
+    async def find_tier_configuration_request_context(self, request_id: str) -> TierConfigurationRequestContext:
+        """
+        Retrieves the Tier Configuration Request and then, concurrently, its Tier
+        Configuration and the tier 1 configuration of tier 2 requests.
+
+        :param request_id: str The unique Tier Configuration Request id: TCR-XXX-XXX-XXX-XXX
+        :return: TierConfigurationRequestContext The request context.
+        """
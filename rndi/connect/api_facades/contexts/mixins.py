@@ -0,0 +1,132 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from rndi.connect.business_objects.adapters import TierConfiguration
+from rndi.connect.api_facades.contexts.contracts import (
+    AssetRequestContext,
+    AsyncRequestContextService,
+    RequestContextService,
+    TierConfigurationRequestContext,
+)
+from rndi.connect.api_facades.mixins import AsyncWithFacadeSupport, WithFacadeSupport
+
+TIER_2 = 2
+
+
+def _id(value: Optional[dict]) -> Optional[str]:
+    return (value or {}).get('id')
+
+
+def _asset_request_ids(raw: dict) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """
+    :return: Tuple The asset, product, tier 1 account and tier 2 account ids of the given raw Asset Request.
+    """
+    asset = raw.get('asset') or {}
+    tiers = asset.get('tiers') or {}
+    return _id(asset), _id(asset.get('product')), _id(tiers.get('tier1')), _id(tiers.get('tier2'))
+
+
+def _tier_configuration_request_ids(raw: dict) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    :return: Tuple The tier configuration, product and parent tier 1 account (tier 2 requests only) ids
+    of the given raw Tier Configuration Request.
+    """
+    configuration = raw.get('configuration') or {}
+    parent = _id((raw.get('tiers') or {}).get('tier1')) if configuration.get('tier_level') == TIER_2 else None
+    return _id(configuration), _id(configuration.get('product')), parent
+
+
+class WithRequestContextFacade(RequestContextService, WithFacadeSupport):
+    def find_asset_request_context(self, request_id: str) -> AssetRequestContext:
+        request = self.find_asset_request(request_id)
+        asset_id, product_id, tier1_id, tier2_id = _asset_request_ids(request.raw())
+
+        executor = self._fan_out_pool()
+        asset = executor.submit(self._find_optional, self.find_asset, asset_id)
+        tier1 = executor.submit(self._find_tier_configuration_by_account, product_id, tier1_id)
+        tier2 = executor.submit(self._find_tier_configuration_by_account, product_id, tier2_id)
+
+        return AssetRequestContext(request, asset.result(), tier1.result(), tier2.result())
+
+    def find_tier_configuration_request_context(self, request_id: str) -> TierConfigurationRequestContext:
+        request = self.find_tier_configuration_request(request_id)
+        tier_configuration_id, product_id, parent_id = _tier_configuration_request_ids(request.raw())
+
+        executor = self._fan_out_pool()
+        tier_configuration = executor.submit(self._find_optional, self.find_tier_configuration, tier_configuration_id)
+        parent = executor.submit(self._find_tier_configuration_by_account, product_id, parent_id)
+
+        return TierConfigurationRequestContext(request, tier_configuration.result(), parent.result())
+
+    def _find_optional(self, find: Callable[[str], Any], entity_id: Optional[str]) -> Optional[Any]:
+        return None if entity_id is None else find(entity_id)
+
+    def _find_tier_configuration_by_account(
+            self,
+            product_id: Optional[str],
+            account_id: Optional[str],
+    ) -> Optional[TierConfiguration]:
+        if product_id is None or account_id is None:
+            return None
+
+        configurations = self.iter_tier_configurations(
+            product__id=product_id,
+            account__id=account_id,
+            page_size=1,
+            prefetch=False,
+        )
+        return next(configurations, None)
+
+
+class AsyncWithRequestContextFacade(AsyncRequestContextService, AsyncWithFacadeSupport):
+    async def find_asset_request_context(self, request_id: str) -> AssetRequestContext:
+        request = await self.find_asset_request(request_id)
+        asset_id, product_id, tier1_id, tier2_id = _asset_request_ids(request.raw())
+
+        asset, tier1, tier2 = await asyncio.gather(
+            self._find_optional(self.find_asset, asset_id),
+            self._find_tier_configuration_by_account(product_id, tier1_id),
+            self._find_tier_configuration_by_account(product_id, tier2_id),
+        )
+        return AssetRequestContext(request, asset, tier1, tier2)
+
+    async def find_tier_configuration_request_context(self, request_id: str) -> TierConfigurationRequestContext:
+        request = await self.find_tier_configuration_request(request_id)
+        tier_configuration_id, product_id, parent_id = _tier_configuration_request_ids(request.raw())
+
+        tier_configuration, parent = await asyncio.gather(
+            self._find_optional(self.find_tier_configuration, tier_configuration_id),
+            self._find_tier_configuration_by_account(product_id, parent_id),
+        )
+        return TierConfigurationRequestContext(request, tier_configuration, parent)
+
+    async def _find_optional(self, find: Callable[[str], Awaitable[Any]], entity_id: Optional[str]) -> Optional[Any]:
+        return None if entity_id is None else await find(entity_id)
+
+    async def _find_tier_configuration_by_account(
+            self,
+            product_id: Optional[str],
+            account_id: Optional[str],
+    ) -> Optional[TierConfiguration]:
+        if product_id is None or account_id is None:
+            return None
+
+        configurations = self.iter_tier_configurations(
+            product__id=product_id,
+            account__id=account_id,
+            page_size=1,
+            prefetch=False,
+        )
+        try:
+            async for configuration in configurations:
+                return configuration
+            return None
+        finally:
+            await configurations.aclose()
@@ -0,0 +1,262 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import as_completed, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+import pickle
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import zlib
+
+from rndi.connect.api_facades.bulk import BulkItemResult, BulkReport
+from rndi.connect.api_facades.views import RequestView
+from rndi.connect.business_objects.adapters import Request
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_PENDING = 4
+
+# the facade of the current worker process, built once by the pool initializer.
+_worker_api: Any = None
+
+
+def find_asset_request(api: Any, request_id: str) -> Any:
+    return api.find_asset_request(request_id)
+
+
+def find_tier_configuration_request(api: Any, request_id: str) -> Any:
+    return api.find_tier_configuration_request(request_id)
+
+
+def shard_of(request_id: str, shards: int) -> int:
+    """
+    :param request_id: str The request id.
+    :param shards: int The number of shards.
+    :return: int The shard of the request id, stable across processes and runs.
+    """
+    return zlib.crc32(request_id.encode('utf-8')) % shards
+
+
+def _initialize_worker(facade_factory: Callable[[], Any]) -> None:
+    global _worker_api
+    _worker_api = facade_factory()
+
+
+def _portable(error: Exception) -> Exception:
+    # the error travels back to the parent process, keep it only if it can be pickled.
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f'{type(error).__name__}: {error}')
+
+
+def _sendable(result: Any) -> Any:
+    # an item result that cannot be pickled must not fail the results of the whole chunk.
+    try:
+        pickle.dumps(result)
+        return result
+    except Exception as e:
+        raise RuntimeError(f'The request was handled but its result cannot be sent back: {e}') from None
+
+
+def _run_chunk(
+        handler: Callable[[Any, Request], Any],
+        loader: Callable[[Any, str], Any],
+        chunk: List[Tuple[int, str, Optional[dict]]],
+) -> List[Tuple[int, BulkItemResult]]:
+    results = []
+    for index, request_id, raw in chunk:
+        try:
+            request = Request(raw) if raw is not None else loader(_worker_api, request_id)
+            results.append((index, BulkItemResult(request_id, result=_sendable(handler(_worker_api, request)))))
+        except Exception as e:
+            results.append((index, BulkItemResult(request_id, error=_portable(e))))
+    return results
+
+
+class ShardedEngine:
+    """
+    Processes a stream of requests across a pool of processes, each one with
+    its own facade and client. The requests are sharded by request id, every
+    shard is owned by a single process, so the requests of the same id are
+    handled one at a time and in input order.
+    """
+
+    def __init__(
+            self,
+            facade_factory: Callable[[], Any],
+            handler: Callable[[Any, Request], Any],
+            processes: Optional[int] = None,
+            batch_size: int = DEFAULT_BATCH_SIZE,
+            max_pending: int = DEFAULT_MAX_PENDING,
+            loader: Callable[[Any, str], Any] = find_asset_request,
+            mp_context: Optional[Any] = None,
+    ):
+        """
+        :param facade_factory: Callable Builds the facade of a worker process, it must be picklable.
+        :param handler: Callable Processes one request, it receives the worker facade and the Request.
+        :param processes: Optional[int] The number of worker processes, defaults to the number of cores.
+        :param batch_size: int Max number of requests sent to a worker at once.
+        :param max_pending: int Max number of batches in flight per worker (shard).
+        :param loader: Callable Reads the request of the given id through the worker facade.
+        :param mp_context: Optional[Any] The multiprocessing context: fork, spawn or forkserver.
+        """
+        processes = (os.cpu_count() or 1) if processes is None else processes
+        if processes <= 0:
+            raise ValueError('`processes` must be a positive, non-zero integer.')
+        if batch_size <= 0:
+            raise ValueError('`batch_size` must be a positive, non-zero integer.')
+        if max_pending <= 0:
+            raise ValueError('`max_pending` must be a positive, non-zero integer.')
+
+        self.facade_factory = facade_factory
+        self.handler = handler
+        self.processes = processes
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.loader = loader
+        self.mp_context = mp_context or multiprocessing.get_context()
+        self._executors: List[ProcessPoolExecutor] = []
+
+    def start(self) -> None:
+        """
+        Starts the worker processes, one single process pool per shard.
+        """
+        if self._executors:
+            return
+        self._executors = [self._executor() for _ in range(self.processes)]
+
+    def _executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=self.mp_context,
+            initializer=_initialize_worker,
+            initargs=(self.facade_factory,),
+        )
+
+    def close(self) -> None:
+        """
+        Stops the worker processes once the submitted requests are processed.
+        """
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+        self._executors = []
+
+    def __enter__(self) -> ShardedEngine:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def shard(self, request_id: str) -> int:
+        return shard_of(request_id, self.processes)
+
+    def _submit(self, shard: int, chunk: List[Tuple[int, str, Optional[dict]]]) -> Tuple[Future, list]:
+        try:
+            return self._executors[shard].submit(_run_chunk, self.handler, self.loader, chunk), chunk
+        except BrokenProcessPool:
+            # the worker of the shard died: its in-flight chunks fail, the next ones go to a new worker.
+            self._executors[shard].shutdown(wait=False)
+            self._executors[shard] = self._executor()
+
+        try:
+            return self._executors[shard].submit(_run_chunk, self.handler, self.loader, chunk), chunk
+        except Exception as e:
+            failed = Future()
+            failed.set_exception(e)
+            return failed, chunk
+
+    @staticmethod
+    def _collect(future: Future, chunk: List[Tuple[int, str, Optional[dict]]]) -> List[Tuple[int, BulkItemResult]]:
+        try:
+            return future.result()
+        except Exception as e:
+            # the worker died or the chunk could not be sent: the whole chunk fails.
+            return [(index, BulkItemResult(request_id, error=e)) for index, request_id, _ in chunk]
+
+    @staticmethod
+    def _identify(request: Union[str, dict, RequestView, Request]) -> Tuple[str, Optional[dict]]:
+        # the views only carry the id, the worker loads the full request through the loader.
+        if isinstance(request, str):
+            request_id, raw = request, None
+        elif isinstance(request, RequestView):
+            request_id, raw = request.id, None
+        elif isinstance(request, dict):
+            request_id, raw = request.get('id'), request
+        elif callable(getattr(request, 'raw', None)):
+            raw = request.raw()
+            request_id = raw.get('id')
+        else:
+            raise TypeError(f'Unsupported request type `{type(request).__name__}`.')
+
+        if not isinstance(request_id, str) or not request_id:
+            raise ValueError('The request has no id.')
+        return request_id, raw
+
+    def _stream(
+            self,
+            requests: Iterable[Union[str, dict, RequestView, Request]],
+    ) -> Iterator[Tuple[int, BulkItemResult]]:
+        self.start()
+
+        buffers: Dict[int, List[Tuple[int, str, Optional[dict]]]] = {}
+        pending: Dict[int, Deque[Tuple[Future, list]]] = {}
+
+        for index, request in enumerate(requests):
+            try:
+                request_id, raw = self._identify(request)
+            except (TypeError, ValueError) as e:
+                # a bad input fails on its own, the rest of the stream goes on.
+                yield index, BulkItemResult(None, error=e)
+                continue
+
+            shard = self.shard(request_id)
+            buffer = buffers.setdefault(shard, [])
+            buffer.append((index, request_id, raw))
+            if len(buffer) < self.batch_size:
+                continue
+
+            queue = pending.setdefault(shard, deque())
+            queue.append(self._submit(shard, buffers.pop(shard)))
+            # the back pressure applies per shard, a slow worker does not hold the results of the others.
+            for other in pending.values():
+                while other and other[0][0].done():
+                    yield from self._collect(*other.popleft())
+            while len(queue) > self.max_pending:
+                yield from self._collect(*queue.popleft())
+
+        for shard, buffer in buffers.items():
+            pending.setdefault(shard, deque()).append(self._submit(shard, buffer))
+        chunks = {future: chunk for queue in pending.values() for future, chunk in queue}
+        for future in as_completed(chunks):
+            yield from self._collect(future, chunks[future])
+
+    def process(self, requests: Iterable[Union[str, dict, RequestView, Request]]) -> Iterator[BulkItemResult]:
+        """
+        Processes the given requests, yielding the results as the batches are
+        completed. The input is consumed lazily, with at most max_pending
+        batches in flight per worker. The inputs without a request id are
+        reported as failed items.
+
+        :param requests: Iterable The request ids, raw requests, request views or Request objects.
+        :return: Iterator[BulkItemResult] The per request results.
+        """
+        for _, item in self._stream(requests):
+            yield item
+
+    def run(self, requests: Iterable[Union[str, dict, RequestView, Request]]) -> BulkReport:
+        """
+        Processes the given requests and waits for all of them.
+
+        :param requests: Iterable The request ids, raw requests, request views or Request objects.
+        :return: BulkReport The per request report, in input order.
+        """
+        results = sorted(self._stream(requests), key=lambda result: result[0])
+        return BulkReport([item for _, item in results])
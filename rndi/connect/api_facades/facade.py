@@ -3,20 +3,137 @@
 #
 # Copyright (c) 2023 Ingram Micro. All Rights Reserved.
 #
-from typing import Union
+from typing import Optional, Union
+import warnings
 
 from connect.client import AsyncConnectClient, ConnectClient
-from rndi.connect.api_facades.assets.mixins import WithAssetFacade
-from rndi.connect.api_facades.tier_configurations.mixins import WithTierConfigurationFacade
+from rndi.connect.api_facades.assets.mixins import AsyncWithAssetFacade, WithAssetFacade
+from rndi.connect.api_facades.cache import Cache
+from rndi.connect.api_facades.coalescing import ParameterUpdateCoalescer
+from rndi.connect.api_facades.codec import JSONCodec
+from rndi.connect.api_facades.contexts.mixins import AsyncWithRequestContextFacade, WithRequestContextFacade
+from rndi.connect.api_facades.metrics import Metrics
+from rndi.connect.api_facades.mixins import TRANSITION_GUARDS
+from rndi.connect.api_facades.outbox import SQLiteOutbox
+from rndi.connect.api_facades.rate_limit import RateLimiter
+from rndi.connect.api_facades.retry import RetryPolicy
+from rndi.connect.api_facades.scheduler import OperationScheduler
+from rndi.connect.api_facades.singleflight import AsyncSingleFlight, SingleFlight
+from rndi.connect.api_facades.tier_configurations.mixins import (
+    AsyncWithTierConfigurationFacade,
+    WithTierConfigurationFacade,
+)
+from rndi.connect.api_facades.transport import AsyncHTTPTransport, HTTPTransport
+
+
+def _validate_transition_guard(transition_guard: Optional[str]) -> None:
+    if transition_guard is not None and transition_guard not in TRANSITION_GUARDS:
+        raise ValueError(f'`transition_guard` must be one of {", ".join(TRANSITION_GUARDS)} or None.')
+
+
+def _validate_retry_policy(
+        client: Union[ConnectClient, AsyncConnectClient],
+        retry_policy: Optional[RetryPolicy],
+) -> None:
+    if retry_policy is not None and getattr(client, 'max_retries', 0):
+        warnings.warn(
+            'The client retries the failed calls on its own (max_retries), build it with max_retries=0 '
+            'when a retry policy is set, otherwise each attempt of the policy can be several HTTP calls.',
+            RuntimeWarning,
+            stacklevel=3,
+        )
 
 
 class ConnectOpenAPIFacade(
     WithAssetFacade,
     WithTierConfigurationFacade,
+    WithRequestContextFacade,
 ):
-    def __init__(self, client: Union[ConnectClient, AsyncConnectClient]):
+    def __init__(
+            self,
+            client: Union[ConnectClient, AsyncConnectClient],
+            cache: Optional[Cache] = None,
+            coalesce_reads: bool = True,
+            diff_parameter_updates: bool = False,
+            parameter_coalescer: Optional[ParameterUpdateCoalescer] = None,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            metrics: Optional[Metrics] = None,
+            transition_guard: Optional[str] = None,
+            outbox: Optional[SQLiteOutbox] = None,
+            transport: Optional[HTTPTransport] = None,
+            lazy: bool = False,
+            codec: Optional[JSONCodec] = None,
+            scheduler: Optional[OperationScheduler] = None,
+    ):
+        _validate_transition_guard(transition_guard)
+        _validate_retry_policy(client, retry_policy)
+
         self._client = client
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce_reads else None
+        self.diff_parameter_updates = diff_parameter_updates
+        self.parameter_coalescer = parameter_coalescer
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        self.transition_guard = transition_guard
+        self.outbox = outbox
+        self.transport = transport
+        self.lazy = lazy
+        self.codec = codec
+        self.scheduler = scheduler
 
     @property
     def client(self) -> ConnectClient:
-        return self._client
+        client = self._client
+        if self.transport is not None:
+            # the client is thread local, bind the shared session in the current thread.
+            client = self.transport.bind(client)
+        if self.codec is not None:
+            client = self.codec.bind(client)
+        return client
+
+
+class AsyncConnectOpenAPIFacade(
+    AsyncWithAssetFacade,
+    AsyncWithTierConfigurationFacade,
+    AsyncWithRequestContextFacade,
+):
+    def __init__(
+            self,
+            client: AsyncConnectClient,
+            cache: Optional[Cache] = None,
+            coalesce_reads: bool = True,
+            diff_parameter_updates: bool = False,
+            retry_policy: Optional[RetryPolicy] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            metrics: Optional[Metrics] = None,
+            transition_guard: Optional[str] = None,
+            transport: Optional[AsyncHTTPTransport] = None,
+            lazy: bool = False,
+            codec: Optional[JSONCodec] = None,
+    ):
+        _validate_transition_guard(transition_guard)
+        _validate_retry_policy(client, retry_policy)
+
+        self._client = client
+        self.cache = cache
+        self.single_flight = AsyncSingleFlight() if coalesce_reads else None
+        self.diff_parameter_updates = diff_parameter_updates
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        self.transition_guard = transition_guard
+        self.transport = transport
+        self.lazy = lazy
+        self.codec = codec
+
+    @property
+    def client(self) -> AsyncConnectClient:
+        client = self._client
+        if self.transport is not None:
+            client = self.transport.bind(client)
+        if self.codec is not None:
+            client = self.codec.bind(client)
+        return client
@@ -0,0 +1,90 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import inspect
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def return_request(request: Any) -> Any:
+    """
+    Default on_success callback, returns the given request.
+    """
+    return request
+
+
+def raise_error(error: Exception) -> Any:
+    """
+    Default on_error callback, re-raises the given error.
+    """
+    raise error
+
+
+async def resolve(value: Any) -> Any:
+    """
+    Awaits the given value if it is awaitable, this allows the async facades to
+    accept both sync and async on_success and on_error callbacks.
+
+    :param value: Any The value returned by a callback.
+    :return: Any The resolved value.
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def rql_select(select: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    Builds the RQL select() fields from the given included and excluded fields.
+
+    :param select: Optional[Iterable[str]] The fields to include.
+    :param exclude: Optional[Iterable[str]] The fields to exclude.
+    :return: List[str] The RQL select fields, excluded ones prefixed by "-".
+    """
+    return list(select or []) + [f'-{field}' for field in exclude or []]
+
+
+def with_select(path: str, fields: List[str]) -> str:
+    """
+    Appends the RQL select() operator to the given resource path.
+
+    :param path: str The resource path: assets/AS-XXXX-XXXX-XXXX
+    :param fields: List[str] The RQL select fields.
+    :return: str The resource path with the select operator.
+    """
+    return f'{path}?select({",".join(fields)})' if fields else path
+
+
+def merge_parameters(current: List[Dict[str, Any]], updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Returns the current parameters with the given updates applied, merged by
+    parameter id.
+
+    :param current: List[Dict[str, Any]] The current parameters of the asset or tier configuration.
+    :param updates: List[Dict[str, Any]] The parameter updates not sent yet.
+    :return: List[Dict[str, Any]] The parameters as they will be once the updates are sent.
+    """
+    merged: Dict[Any, Dict[str, Any]] = {parameter.get('id'): dict(parameter) for parameter in current}
+    for parameter in updates:
+        merged.setdefault(parameter.get('id'), {}).update(parameter)
+    return list(merged.values())
+
+
+def changed_parameters(current: List[Dict[str, Any]], parameters: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Returns the parameters whose values differ from the current ones.
+
+    :param current: List[Dict[str, Any]] The current parameters of the asset or tier configuration.
+    :param parameters: List[Dict[str, Any]] The parameters to update.
+    :return: List[Dict[str, Any]] The parameters that actually change.
+    """
+    current = {parameter.get('id'): parameter for parameter in current}
+
+    return [
+        parameter for parameter in parameters
+        if any(
+            current.get(parameter.get('id'), {}).get(key) != value
+            for key, value in parameter.items() if key != 'id'
+        )
+    ]
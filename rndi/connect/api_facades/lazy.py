@@ -0,0 +1,94 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+_MISSING = object()
+
+
+class LazyEntity:
+    """
+    Deferred business object, it keeps the raw entity returned by Connect and
+    builds the business object (Asset, Request, TierConfiguration) only when a
+    method other than id(), status(), raw() or field() is first accessed.
+    """
+
+    __slots__ = ('_factory', '_raw', '_entity')
+
+    def __init__(self, factory: Callable[[dict], Any], raw: dict):
+        """
+        :param factory: Callable The business object class: Asset, Request...
+        :param raw: dict The raw entity.
+        """
+        self._factory = factory
+        self._raw = raw
+        self._entity = None
+
+    @property
+    def materialized(self) -> bool:
+        return self._entity is not None
+
+    def materialize(self) -> Any:
+        """
+        :return: Any The business object, built on first call.
+        """
+        if self._entity is None:
+            self._entity = self._factory(self._raw)
+            self._raw = None
+        return self._entity
+
+    def raw(self) -> dict:
+        if self._entity is not None:
+            return self._entity.raw()
+        return self._raw
+
+    def id(self) -> Optional[str]:
+        return self.field('id')
+
+    def status(self) -> Optional[str]:
+        return self.field('status')
+
+    def field(self, *path: str, default: Any = None) -> Any:
+        """
+        Reads a (nested) field of the raw entity without building the business
+        object or the nested sections: field('asset', 'product', 'id').
+
+        :param path: str The field names from the entity root.
+        :param default: Any The value returned if the field is missing.
+        :return: Any The field value.
+        """
+        value = self.raw()
+        for name in path:
+            value = value.get(name, _MISSING) if isinstance(value, dict) else _MISSING
+            if value is _MISSING:
+                return default
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def __repr__(self) -> str:
+        state = 'materialized' if self._entity is not None else 'lazy'
+        return f'<LazyEntity {getattr(self._factory, "__name__", "entity")} {self.id()} ({state})>'
+
+
+def materialize(value: Any, factory: Callable[[dict], Any]) -> Any:
+    """
+    Normalizes the given value (raw dict, lazy entity or business object) into
+    the business object built by the given factory.
+
+    :param value: Any The raw entity, the lazy entity or the business object.
+    :param factory: Callable The business object class: Asset, Request...
+    :return: Any The business object.
+    """
+    if isinstance(value, LazyEntity):
+        return value.materialize()
+    if isinstance(factory, type) and isinstance(value, factory):
+        return value
+    return factory(value)
@@ -0,0 +1,228 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from bisect import bisect_left
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from connect.client import ClientError
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0, 30.0,
+)
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def http_sizes(response: Any) -> Tuple[int, int]:
+    """
+    Computes the request and response body sizes of the given requests or
+    httpx response.
+
+    :param response: Any The last HTTP response of the client (if any).
+    :return: Tuple[int, int] The request and response bytes.
+    """
+    if response is None:
+        return 0, 0
+
+    request = getattr(response, 'request', None)
+    body = getattr(request, 'body', None)
+    if body is None:
+        try:
+            body = getattr(request, 'content', None)
+        except Exception:
+            body = None
+
+    try:
+        content = response.content
+    except Exception:
+        content = None
+
+    return len(body or b''), len(content or b'')
+
+
+class Histogram:
+    """
+    Fixed buckets histogram, the quantiles are estimated by linear
+    interpolation inside the bucket that contains them.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        :param q: float The quantile to estimate, between 0 and 1.
+        :return: Optional[float] The estimated value, None if there are no observations.
+        """
+        if self.count == 0:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                if i == len(self.buckets):
+                    # the value is above the last bucket, its upper bound is unknown.
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - cumulative) / count
+            cumulative += count
+
+        return self.buckets[-1]
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """
+        :return: List[Tuple[float, int]] The (upper bound, cumulative count) pairs, +Inf included.
+        """
+        pairs = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            cumulative += count
+            pairs.append((bound, cumulative))
+        return pairs
+
+
+class OperationStats:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.calls = 0
+        self.successes = 0
+        self.errors: Dict[str, int] = {}
+        self.latency = Histogram(buckets)
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'calls': self.calls,
+            'successes': self.successes,
+            'errors': dict(self.errors),
+            'latency': {
+                'count': self.latency.count,
+                'sum': self.latency.sum,
+                **{f'p{int(q * 100)}': self.latency.quantile(q) for q in QUANTILES},
+            },
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+        }
+
+
+class Metrics:
+    """
+    Per operation counters (calls, successes, errors by status code), latency
+    histograms and transferred bytes. Each HTTP attempt is one observation.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        :param buckets: Sequence[float] The latency histogram buckets in seconds.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._operations: Dict[str, OperationStats] = {}
+
+    def observe(
+            self,
+            operation: str,
+            seconds: float,
+            error: Optional[ClientError] = None,
+            request_bytes: int = 0,
+            response_bytes: int = 0,
+    ) -> None:
+        """
+        Records one call of the given operation.
+
+        :param operation: str The operation name, usually the facade method name.
+        :param seconds: float The call latency.
+        :param error: Optional[ClientError] The error raised by the call (if any).
+        :param request_bytes: int The request body size.
+        :param response_bytes: int The response body size.
+        """
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                stats = self._operations[operation] = OperationStats(self.buckets)
+
+            stats.calls += 1
+            if error is None:
+                stats.successes += 1
+            else:
+                status = str(error.status_code) if error.status_code is not None else 'none'
+                stats.errors[status] = stats.errors.get(status, 0) + 1
+            stats.latency.observe(seconds)
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: Dict[str, Dict[str, Any]] The stats of each operation.
+        """
+        with self._lock:
+            return {operation: stats.as_dict() for operation, stats in self._operations.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._operations.clear()
+
+    def export_prometheus(self, prefix: str = 'connect_facade') -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format.
+
+        :param prefix: str The metric names prefix.
+        :return: str The Prometheus text.
+        """
+        with self._lock:
+            operations = sorted(self._operations.items())
+            lines = [
+                f'# HELP {prefix}_calls_total Connect calls by operation.',
+                f'# TYPE {prefix}_calls_total counter',
+            ]
+            lines += [f'{prefix}_calls_total{{operation="{op}"}} {s.calls}' for op, s in operations]
+
+            lines += [
+                f'# HELP {prefix}_successes_total Successful Connect calls by operation.',
+                f'# TYPE {prefix}_successes_total counter',
+            ]
+            lines += [f'{prefix}_successes_total{{operation="{op}"}} {s.successes}' for op, s in operations]
+
+            lines += [
+                f'# HELP {prefix}_errors_total Failed Connect calls by operation and status code.',
+                f'# TYPE {prefix}_errors_total counter',
+            ]
+            for op, stats in operations:
+                for status, count in sorted(stats.errors.items()):
+                    lines.append(f'{prefix}_errors_total{{operation="{op}",status="{status}"}} {count}')
+
+            for direction in ('request', 'response'):
+                lines += [
+                    f'# HELP {prefix}_{direction}_bytes_total Connect {direction} body bytes by operation.',
+                    f'# TYPE {prefix}_{direction}_bytes_total counter',
+                ]
+                lines += [
+                    f'{prefix}_{direction}_bytes_total{{operation="{op}"}} {getattr(s, direction + "_bytes")}'
+                    for op, s in operations
+                ]
+
+            lines += [
+                f'# HELP {prefix}_latency_seconds Connect calls latency by operation.',
+                f'# TYPE {prefix}_latency_seconds histogram',
+            ]
+            for op, stats in operations:
+                for bound, count in stats.latency.cumulative():
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{prefix}_latency_seconds_bucket{{operation="{op}",le="{le}"}} {count}')
+                lines.append(f'{prefix}_latency_seconds_sum{{operation="{op}"}} {stats.latency.sum}')
+                lines.append(f'{prefix}_latency_seconds_count{{operation="{op}"}} {stats.latency.count}')
+
+        return '\n'.join(lines) + '\n'
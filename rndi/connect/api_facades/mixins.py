@@ -0,0 +1,509 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+import copy
+from functools import partial
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from connect.client import ClientError
+from rndi.connect.business_objects.adapters import Request
+from rndi.connect.api_facades.bulk import DEFAULT_MAX_WORKERS
+from rndi.connect.api_facades.cache import Cache, InvalidationLog, NOT_MODIFIED, response_validators
+from rndi.connect.api_facades.coalescing import ParameterUpdateCoalescer
+from rndi.connect.api_facades.codec import JSONCodec
+from rndi.connect.api_facades.helpers import with_select
+from rndi.connect.api_facades.lazy import LazyEntity, materialize
+from rndi.connect.api_facades.metrics import http_sizes, Metrics
+from rndi.connect.api_facades.outbox import OutboxEntry, SQLiteOutbox
+from rndi.connect.api_facades.rate_limit import RateLimiter, READ
+from rndi.connect.api_facades.retry import RetryPolicy
+from rndi.connect.api_facades.scheduler import OperationScheduler
+from rndi.connect.api_facades.singleflight import AsyncSingleFlight, SingleFlight
+from rndi.connect.api_facades.unit_of_work import AsyncUnitOfWork, UnitOfWork
+
+
+KNOWN = 'known'
+STRICT = 'strict'
+TRANSITION_GUARDS = (KNOWN, STRICT)
+
+OUTBOX_OPERATIONS = frozenset({
+    'approve_asset_request',
+    'fail_asset_request',
+    'inquire_asset_request',
+    'update_asset_request_parameters',
+    'approve_tier_configuration_request',
+    'fail_tier_configuration_request',
+    'inquire_tier_configuration_request',
+    'update_tier_configuration_request_parameters',
+})
+
+
+_FAN_OUT_LOCK = threading.Lock()
+_INVALIDATIONS_LOCK = threading.Lock()
+
+
+def _flight_key(entity: str, entity_id: str, fields: Optional[List[str]]) -> tuple:
+    return (entity, entity_id, tuple(fields)) if fields else (entity, entity_id)
+
+
+class WithFacadeSupport:
+    cache: Optional[Cache] = None
+    single_flight: Optional[Union[SingleFlight, AsyncSingleFlight]] = None
+    diff_parameter_updates: bool = False
+    parameter_coalescer: Optional[ParameterUpdateCoalescer] = None
+    retry_policy: Optional[RetryPolicy] = None
+    rate_limiter: Optional[RateLimiter] = None
+    metrics: Optional[Metrics] = None
+    transition_guard: Optional[str] = None
+    outbox: Optional[SQLiteOutbox] = None
+    lazy: bool = False
+    codec: Optional[JSONCodec] = None
+    scheduler: Optional[OperationScheduler] = None
+    fan_out_workers: int = DEFAULT_MAX_WORKERS
+    _fan_out: Optional[ThreadPoolExecutor] = None
+    _invalidations: Optional[InvalidationLog] = None
+
+    def _fan_out_pool(self) -> ThreadPoolExecutor:
+        """
+        The long-lived thread pool of the facade concurrent reads and flushes,
+        created on first use. Its threads keep their thread local client (and
+        HTTP session), so the connections are reused between the calls.
+
+        :return: ThreadPoolExecutor The facade thread pool.
+        """
+        with _FAN_OUT_LOCK:
+            if self._fan_out is None:
+                self._fan_out = ThreadPoolExecutor(
+                    max_workers=self.fan_out_workers,
+                    thread_name_prefix='connect-facade',
+                )
+            return self._fan_out
+
+    def _invalidation_log(self) -> InvalidationLog:
+        # shared by the facade copies (unit of work, outbox delivery), created on first use.
+        with _INVALIDATIONS_LOCK:
+            if self._invalidations is None:
+                self._invalidations = InvalidationLog()
+            return self._invalidations
+
+    def _page_call(self, operation: str) -> Callable[[Callable[[], Any]], Any]:
+        """
+        The page call of the iterators. The next page is prefetched on the
+        facade thread pool, so the shared transport and the codec are bound
+        to the client of the thread running the call first.
+
+        :param operation: str The operation name used by the metrics.
+        :return: Callable Executes the given page call.
+        """
+        def call(fn: Callable[[], Any]) -> Any:
+            # the client property binds the transport and the codec in the current thread.
+            self.client
+            return self._call(fn, operation=operation)
+
+        return call
+
+    def deliver_outbox_entry(self, entry: OutboxEntry) -> Any:
+        """
+        Sends the given outbox entry to Connect, bypassing the outbox and the
+        parameter updates coalescing.
+
+        :param entry: OutboxEntry The journal entry.
+        :return: Any The operation result.
+        """
+        if entry.operation not in OUTBOX_OPERATIONS:
+            raise ValueError(f'Unsupported outbox operation `{entry.operation}`.')
+
+        delivery = copy.copy(self)
+        delivery.outbox = None
+        delivery.parameter_coalescer = None
+
+        arguments = dict(entry.arguments)
+        request = Request(arguments.pop('request'))
+        return getattr(delivery, entry.operation)(request, **arguments)
+
+    def drain_outbox(self) -> int:
+        """
+        Sends one batch of the pending outbox entries (if outbox enabled).
+
+        :return: int The number of entries sent.
+        """
+        return 0 if self.outbox is None else self.outbox.drain(self.deliver_outbox_entry)
+
+    def start_outbox(self) -> None:
+        """
+        Starts the background outbox drainer (if outbox enabled).
+        """
+        if self.outbox is not None:
+            self.outbox.start(self.deliver_outbox_entry)
+
+    def stop_outbox(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the background outbox drainer (if outbox enabled).
+        """
+        if self.outbox is not None:
+            self.outbox.stop(timeout)
+
+    def _enqueue(
+            self,
+            operation: str,
+            request: Union[dict, Request],
+            on_error: Optional[Callable] = None,
+            on_success: Optional[Callable] = None,
+            **arguments: Any,
+    ) -> int:
+        """
+        Records the given operation in the outbox, it is sent later by the drainer.
+
+        :param operation: str The facade operation name.
+        :param request: Union[dict, Request] The request.
+        :param on_error: Optional[Callable] Not supported in outbox mode, the operation is not sent yet.
+        :param on_success: Optional[Callable] Not supported in outbox mode, the operation is not sent yet.
+        :return: int The outbox entry sequence number.
+        """
+        if on_error is not None or on_success is not None:
+            raise ValueError(
+                f'`{operation}` does not support the on_success and on_error callbacks in outbox mode, '
+                'the operation is only recorded, it returns the outbox entry sequence number.',
+            )
+
+        request = materialize(request, Request)
+        return self.outbox.enqueue(request.id(), operation, {'request': request.raw(), **arguments})
+
+    def flush_parameter_updates(self) -> None:
+        """
+        Sends every buffered parameter update (if parameter updates coalescing enabled).
+        """
+        if self.parameter_coalescer is not None:
+            self.parameter_coalescer.flush()
+
+    def submit(
+            self,
+            operation: str,
+            *args: Any,
+            priority: Optional[str] = None,
+            deadline: Optional[float] = None,
+            **kwargs: Any,
+    ) -> Future:
+        """
+        Queues the given facade operation in the scheduler, it is sent by the
+        scheduler workers by priority class and earliest deadline first.
+
+        :param operation: str The facade method name: fail_asset_request, approve_asset_request...
+        :param priority: Optional[str] The priority class: critical, interactive or bulk.
+        :param deadline: Optional[float] Seconds from now the operation must be sent within, dropped otherwise.
+        :return: Future The operation result, DeadlineExceeded if dropped.
+        """
+        if self.scheduler is None:
+            raise ValueError('The facade has no scheduler.')
+        return self.scheduler.submit(getattr(self, operation), *args, priority=priority, deadline=deadline, **kwargs)
+
+    def unit_of_work(self, max_workers: int = DEFAULT_MAX_WORKERS) -> UnitOfWork:
+        """
+        Records the parameter updates and transitions made through the returned
+        unit of work, they are collapsed and sent on exit of the with block.
+
+        :param max_workers: int The max number of requests flushed concurrently.
+        :return: UnitOfWork The unit of work.
+        """
+        return UnitOfWork(self, max_workers)
+
+    def _read(
+            self,
+            entity: str,
+            entity_id: str,
+            fetch: Callable[..., dict],
+            fields: Optional[List[str]] = None,
+    ) -> dict:
+        """
+        Reads the given entity through the cache (if any), concurrent reads of
+        the same entity are coalesced into one call (if single flight enabled).
+        Projected reads (RQL select) are partial representations of the entity,
+        they are coalesced by projection but never cached. Expired entities are
+        revalidated with a conditional request if the cache keeps validators.
+
+        :param entity: str The entity type: asset, asset_request...
+        :param entity_id: str The entity id.
+        :param fetch: Callable The function that retrieves the raw entity from Connect, it receives the
+            conditional request headers (if any) as keyword argument.
+        :param fields: Optional[List[str]] The RQL select fields used by the fetch function.
+        :return: dict The raw entity.
+        """
+        cacheable = self.cache is not None and not fields
+        headers = {}
+        if cacheable:
+            cached = self.cache.get(entity, entity_id)
+            if cached is not None:
+                return cached
+            headers = self.cache.conditional_headers(entity, entity_id)
+
+        log = self._invalidation_log()
+
+        def call() -> Tuple[int, Tuple[Any, Optional[int], Dict[str, str]]]:
+            # the sequence is captured by the fetch itself, the coalesced callers share its staleness.
+            started = log.current()
+            return started, self._call(partial(self._fetch, fetch, headers), operation=f'find_{entity}')
+
+        if self.single_flight is None:
+            started, (value, status, validators) = call()
+        else:
+            started, (value, status, validators) = self.single_flight.do(_flight_key(entity, entity_id, fields), call)
+
+        if cacheable:
+            if status == NOT_MODIFIED:
+                revalidated = self.cache.revalidated(entity, entity_id, validators)
+                if revalidated is not None:
+                    return revalidated
+                # the entry was removed meanwhile, the full entity must be read again.
+                started = log.current()
+                value, _, validators = self._call(partial(self._fetch, fetch, {}), operation=f'find_{entity}')
+            # a write invalidated the entity during the fetch, the value may predate it.
+            if not log.changed_since(entity, entity_id, started):
+                self.cache.set(entity, entity_id, value, validators)
+        return value
+
+    def _fetch(self, fetch: Callable[..., Any], headers: Dict[str, str]) -> Tuple[Any, Optional[int], Dict[str, str]]:
+        """
+        Retrieves the raw entity, conditionally if any headers.
+
+        :param fetch: Callable The function that retrieves the raw entity from Connect.
+        :param headers: Dict[str, str] The conditional request headers.
+        :return: Tuple The raw entity, the response status code and the response validators.
+        """
+        value = fetch(headers=headers) if headers else fetch()
+        response = getattr(self.client, 'response', None)
+        return value, getattr(response, 'status_code', None), response_validators(response)
+
+    def _in_status(self, request: Any, status: str, read_status: Callable[[], str]) -> bool:
+        """
+        Checks if the given request is already in the given status (if transition
+        guard enabled), using the known status, or re-reading it if strict.
+
+        :param request: Request The request to transition.
+        :param status: str The target status.
+        :param read_status: Callable Reads the current status from Connect.
+        :return: bool True if the transition can be skipped.
+        """
+        if self.transition_guard is None:
+            return False
+        if self.transition_guard == STRICT:
+            return read_status() == status
+        return request.status() == status
+
+    def _call(
+            self,
+            fn: Callable[[], Any],
+            idempotent: bool = True,
+            kind: str = READ,
+            operation: Optional[str] = None,
+    ) -> Any:
+        """
+        Executes the given Connect call through the retry policy (if any),
+        taking a token of the given budget before each attempt (if rate limited),
+        and measuring each attempt under the given operation (if metrics).
+
+        :param fn: Callable The function that performs the call.
+        :param idempotent: bool True if the call can be safely repeated.
+        :param kind: str The rate limit budget: read or write.
+        :param operation: Optional[str] The operation name used by the metrics.
+        :return: Any The call result.
+        """
+        if self.metrics is not None and operation is not None:
+            metrics, client, measured = self.metrics, self.client, fn
+
+            def fn() -> Any:
+                started = time.perf_counter()
+                try:
+                    result = measured()
+                except ClientError as e:
+                    metrics.observe(operation, time.perf_counter() - started, e, *http_sizes(client.response))
+                    raise
+                metrics.observe(operation, time.perf_counter() - started, None, *http_sizes(client.response))
+                return result
+
+        if self.rate_limiter is not None:
+            limiter, call = self.rate_limiter, fn
+
+            def fn() -> Any:
+                limiter.acquire(kind)
+                return call()
+
+        if self.retry_policy is None:
+            return fn()
+        return self.retry_policy.call(fn, idempotent)
+
+    def _wrap(self, factory: Callable[[dict], Any], value: dict) -> Any:
+        """
+        Builds the business object from the given raw entity, deferred until
+        first use if lazy mode enabled.
+
+        :param factory: Callable The business object class: Asset, Request...
+        :param value: dict The raw entity.
+        :return: Any The business object or the lazy entity.
+        """
+        return LazyEntity(factory, value) if self.lazy else factory(value)
+
+    def _payload(self, payload: Optional[dict]) -> dict:
+        """
+        Builds the client call keyword arguments of the given payload, encoded by
+        the codec (if any).
+        """
+        if self.codec is None:
+            return {'payload': payload}
+        return self.codec.payload(payload)
+
+    def _get(self, resource: Any, fields: Optional[List[str]] = None, **kwargs: Any) -> Any:
+        """
+        Retrieves the given client resource applying the RQL select (if any fields).
+
+        :param resource: Union[Resource, AsyncResource] The client resource.
+        :param fields: Optional[List[str]] The RQL select fields.
+        :param kwargs: Any The client call keyword arguments, e.g. headers.
+        :return: Any The raw entity (or the coroutine for async clients).
+        """
+        if not fields:
+            return resource.get(**kwargs)
+        return self.client.get(with_select(resource.path, fields), **kwargs)
+
+    def _invalidate(self, *keys: Tuple[str, Optional[str]]) -> None:
+        """
+        Removes the given (entity, id) pairs from the cache (if any).
+        """
+        for entity, entity_id in keys:
+            if self.cache is not None and entity_id is not None:
+                self._invalidation_log().invalidate(entity, entity_id)
+                self.cache.invalidate(entity, entity_id)
+
+    def _refresh(self, entity: str, entity_id: str, value: dict) -> None:
+        """
+        Replaces the cached entity with the given fresh value (if any cache).
+        """
+        if self.cache is not None:
+            self._invalidation_log().invalidate(entity, entity_id)
+            self.cache.set(entity, entity_id, value)
+
+
+class AsyncWithFacadeSupport(WithFacadeSupport):
+    def unit_of_work(self, max_workers: int = DEFAULT_MAX_WORKERS) -> AsyncUnitOfWork:
+        return AsyncUnitOfWork(self, max_workers)
+
+    def _payload(self, payload: Optional[dict]) -> dict:
+        if self.codec is None:
+            return {'payload': payload}
+        return self.codec.payload(payload, content='content')
+
+    async def _in_status(self, request: Any, status: str, read_status: Callable[[], Awaitable[str]]) -> bool:
+        if self.transition_guard is None:
+            return False
+        if self.transition_guard == STRICT:
+            return await read_status() == status
+        return request.status() == status
+
+    async def _call(
+            self,
+            fn: Callable[[], Awaitable[Any]],
+            idempotent: bool = True,
+            kind: str = READ,
+            operation: Optional[str] = None,
+    ) -> Any:
+        if self.metrics is not None and operation is not None:
+            metrics, client, measured = self.metrics, self.client, fn
+
+            async def fn() -> Any:
+                started = time.perf_counter()
+                try:
+                    result = await measured()
+                except ClientError as e:
+                    metrics.observe(operation, time.perf_counter() - started, e, *http_sizes(client.response))
+                    raise
+                metrics.observe(operation, time.perf_counter() - started, None, *http_sizes(client.response))
+                return result
+
+        if self.rate_limiter is not None:
+            limiter, call = self.rate_limiter, fn
+
+            async def fn() -> Any:
+                await limiter.acquire_async(kind)
+                return await call()
+
+        if self.retry_policy is None:
+            return await fn()
+        return await self.retry_policy.call_async(fn, idempotent)
+
+    async def _read(
+            self,
+            entity: str,
+            entity_id: str,
+            fetch: Callable[..., Awaitable[dict]],
+            fields: Optional[List[str]] = None,
+    ) -> dict:
+        cacheable = self.cache is not None and not fields
+        headers = {}
+        if cacheable:
+            cached = await self._cached('get', entity, entity_id)
+            if cached is not None:
+                return cached
+            headers = await self._cached('conditional_headers', entity, entity_id)
+
+        log = self._invalidation_log()
+
+        async def call() -> Tuple[int, Tuple[Any, Optional[int], Dict[str, str]]]:
+            started = log.current()
+            return started, await self._call(partial(self._fetch, fetch, headers), operation=f'find_{entity}')
+
+        if self.single_flight is None:
+            started, (value, status, validators) = await call()
+        else:
+            key = _flight_key(entity, entity_id, fields)
+            started, (value, status, validators) = await self.single_flight.do(key, call)
+
+        if cacheable:
+            if status == NOT_MODIFIED:
+                revalidated = await self._cached('revalidated', entity, entity_id, validators)
+                if revalidated is not None:
+                    return revalidated
+                started = log.current()
+                value, _, validators = await self._call(partial(self._fetch, fetch, {}), operation=f'find_{entity}')
+            if not log.changed_since(entity, entity_id, started):
+                await self._cached('set', entity, entity_id, value, validators)
+        return value
+
+    async def _cached(self, method: str, *args: Any) -> Any:
+        """
+        Calls the given cache method, in the default executor if the cache
+        blocks on I/O, so the event loop is never held by the cache.
+
+        :param method: str The cache method name.
+        :return: Any The cache method result.
+        """
+        call = partial(getattr(self.cache, method), *args)
+        if not self.cache.blocking:
+            return call()
+        return await asyncio.get_running_loop().run_in_executor(None, call)
+
+    async def _invalidate(self, *keys: Tuple[str, Optional[str]]) -> None:
+        for entity, entity_id in keys:
+            if self.cache is not None and entity_id is not None:
+                self._invalidation_log().invalidate(entity, entity_id)
+                await self._cached('invalidate', entity, entity_id)
+
+    async def _refresh(self, entity: str, entity_id: str, value: dict) -> None:
+        if self.cache is not None:
+            self._invalidation_log().invalidate(entity, entity_id)
+            await self._cached('set', entity, entity_id, value)
+
+    async def _fetch(
+            self,
+            fetch: Callable[..., Awaitable[Any]],
+            headers: Dict[str, str],
+    ) -> Tuple[Any, Optional[int], Dict[str, str]]:
+        value = await (fetch(headers=headers) if headers else fetch())
+        response = getattr(self.client, 'response', None)
+        return value, getattr(response, 'status_code', None), response_validators(response)
@@ -0,0 +1,340 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from connect.client import ClientError
+from rndi.connect.api_facades.retry import DEFAULT_RETRYABLE_STATUS_CODES, retry_after
+
+PENDING = 'pending'
+SENDING = 'sending'
+DONE = 'done'
+FAILED = 'failed'
+BLOCKED = 'blocked'
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = {
+    'next_attempt_at': 'REAL NOT NULL DEFAULT 0',
+    'claimed_at': 'REAL',
+}
+
+
+class OutboxEntry:
+    def __init__(self, seq: int, request_id: str, operation: str, arguments: Dict[str, Any], attempts: int = 0):
+        self.seq = seq
+        self.request_id = request_id
+        self.operation = operation
+        self.arguments = arguments
+        self.attempts = attempts
+
+
+class SQLiteOutbox:
+    """
+    Durable journal of the Connect write operations. The entries are sent in
+    order per request id, with concurrency across request ids, and marked as
+    done once Connect accepts them, so the delivery is at least once.
+
+    The entries are claimed (pending to sending) in one write transaction
+    before being sent, so concurrent drainers, threads or processes sharing
+    the file, never send the same entry twice. A retryable error postpones
+    the entry with a capped exponential backoff, a permanent one fails it and
+    blocks the following entries of the same request.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            max_workers: int = 4,
+            batch_size: int = 100,
+            max_attempts: int = 5,
+            poll_interval: float = 0.5,
+            timeout: float = 30.0,
+            backoff_base: float = 1.0,
+            backoff_cap: float = 60.0,
+            claim_timeout: float = 300.0,
+            clock: Callable[[], float] = time.time,
+    ):
+        """
+        :param path: str The SQLite database file.
+        :param max_workers: int Number of request ids drained concurrently.
+        :param batch_size: int Max number of entries read on each drain pass.
+        :param max_attempts: int Attempts before a retryable entry is marked as failed.
+        :param poll_interval: float Seconds between drain passes of the background drainer.
+        :param timeout: float Seconds to wait for the database lock.
+        :param backoff_base: float Seconds to wait before the first retry of an entry, doubled on each attempt.
+        :param backoff_cap: float Max seconds to wait before retrying an entry.
+        :param claim_timeout: float Seconds after which an entry claimed by a crashed drainer is pending again.
+        :param clock: Callable The wall clock, it must be shared by the processes.
+        """
+        if max_workers <= 0:
+            raise ValueError('`max_workers` must be a positive, non-zero integer.')
+
+        self.path = path
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.claim_timeout = claim_timeout
+        self.clock = clock
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._drainer: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        connection = self._connect()
+        try:
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS outbox ('
+                'seq INTEGER PRIMARY KEY AUTOINCREMENT, '
+                'request_id TEXT NOT NULL, '
+                'operation TEXT NOT NULL, '
+                'arguments TEXT NOT NULL, '
+                'status TEXT NOT NULL, '
+                'attempts INTEGER NOT NULL DEFAULT 0, '
+                'error TEXT, '
+                'created_at REAL NOT NULL, '
+                'updated_at REAL NOT NULL)',
+            )
+            # journals created by previous versions lack the scheduling columns.
+            existing = {row[1] for row in connection.execute('PRAGMA table_info(outbox)')}
+            for column, definition in _COLUMNS.items():
+                if column not in existing:
+                    connection.execute(f'ALTER TABLE outbox ADD COLUMN {column} {definition}')
+            connection.execute('CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, seq)')
+            connection.execute('CREATE INDEX IF NOT EXISTS outbox_request ON outbox (request_id, status)')
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> sqlite3.Cursor:
+        connection = self._connect()
+        try:
+            return connection.execute(sql, parameters)
+        finally:
+            connection.close()
+
+    def enqueue(self, request_id: str, operation: str, arguments: Dict[str, Any]) -> int:
+        """
+        Records the given operation in the journal.
+
+        :param request_id: str The request id, the entries of the same id are sent in order.
+        :param operation: str The facade operation name.
+        :param arguments: Dict[str, Any] The JSON serializable operation arguments.
+        :return: int The entry sequence number.
+        """
+        now = self.clock()
+        seq = self._execute(
+            'INSERT INTO outbox (request_id, operation, arguments, status, created_at, updated_at) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (request_id, operation, json.dumps(arguments), PENDING, now, now),
+        ).lastrowid
+        self._wake.set()
+        return seq
+
+    def pending(self, limit: Optional[int] = None) -> List[OutboxEntry]:
+        """
+        :param limit: Optional[int] Max number of entries, defaults to the batch size.
+        :return: List[OutboxEntry] The pending entries in enqueue order, due or postponed.
+        """
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                'SELECT seq, request_id, operation, arguments, attempts FROM outbox '
+                'WHERE status = ? ORDER BY seq LIMIT ?',
+                (PENDING, limit or self.batch_size),
+            ).fetchall()
+        finally:
+            connection.close()
+
+        return [OutboxEntry(seq, request_id, operation, json.loads(arguments), attempts)
+                for seq, request_id, operation, arguments, attempts in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        :return: Dict[str, int] The number of entries by status.
+        """
+        connection = self._connect()
+        try:
+            return dict(connection.execute('SELECT status, COUNT(*) FROM outbox GROUP BY status').fetchall())
+        finally:
+            connection.close()
+
+    def _claim(self) -> List[OutboxEntry]:
+        """
+        Moves the due pending entries to sending, skipping the requests with an
+        earlier entry being sent or postponed, so the per request order holds.
+
+        :return: List[OutboxEntry] The claimed entries in enqueue order.
+        """
+        connection = self._connect()
+        try:
+            # the immediate transaction takes the write lock, serializing the claims of every drainer.
+            connection.execute('BEGIN IMMEDIATE')
+            now = self.clock()
+            connection.execute(
+                'UPDATE outbox SET status = ?, claimed_at = NULL WHERE status = ? AND claimed_at < ?',
+                (PENDING, SENDING, now - self.claim_timeout),
+            )
+            # the busy and postponed requests are filtered before the limit, they never starve the others.
+            rows = connection.execute(
+                'SELECT seq, request_id, operation, arguments, attempts FROM outbox AS entry '
+                'WHERE status = ? AND next_attempt_at <= ? AND NOT EXISTS ('
+                'SELECT 1 FROM outbox AS other WHERE other.request_id = entry.request_id AND ('
+                'other.status = ? OR (other.status = ? AND other.seq < entry.seq AND other.next_attempt_at > ?))) '
+                'ORDER BY seq LIMIT ?',
+                (PENDING, now, SENDING, PENDING, now, self.batch_size),
+            ).fetchall()
+
+            entries = [OutboxEntry(seq, request_id, operation, json.loads(arguments), attempts)
+                       for seq, request_id, operation, arguments, attempts in rows]
+
+            connection.executemany(
+                'UPDATE outbox SET status = ?, claimed_at = ? WHERE seq = ? AND status = ?',
+                [(SENDING, now, entry.seq, PENDING) for entry in entries],
+            )
+            connection.execute('COMMIT')
+        except Exception:
+            if connection.in_transaction:
+                connection.execute('ROLLBACK')
+            raise
+        finally:
+            connection.close()
+
+        return entries
+
+    def _mark(self, entry: OutboxEntry, status: str, error: Optional[str] = None, next_attempt_at: float = 0) -> None:
+        self._execute(
+            'UPDATE outbox SET status = ?, attempts = ?, error = ?, next_attempt_at = ?, claimed_at = NULL, '
+            'updated_at = ? WHERE seq = ?',
+            (status, entry.attempts, error, next_attempt_at, self.clock(), entry.seq),
+        )
+
+    def _release(self, entries: List[OutboxEntry]) -> None:
+        # the claimed entries behind a postponed one go back to pending, untouched.
+        for entry in entries:
+            self._execute(
+                'UPDATE outbox SET status = ?, claimed_at = NULL WHERE seq = ? AND status = ?',
+                (PENDING, entry.seq, SENDING),
+            )
+
+    def _block(self, failed: OutboxEntry) -> None:
+        self._execute(
+            'UPDATE outbox SET status = ?, error = ?, claimed_at = NULL, updated_at = ? '
+            'WHERE request_id = ? AND seq > ? AND status IN (?, ?)',
+            (BLOCKED, f'Blocked by the failed entry {failed.seq}.', self.clock(), failed.request_id, failed.seq,
+             PENDING, SENDING),
+        )
+
+    def _backoff(self, entry: OutboxEntry, error: ClientError) -> float:
+        backoff = min(self.backoff_cap, self.backoff_base * 2 ** (entry.attempts - 1))
+        return max(backoff, retry_after(error) or 0.0)
+
+    def _send(self, entries: List[OutboxEntry], deliver: Callable[[OutboxEntry], Any]) -> int:
+        sent = 0
+        for i, entry in enumerate(entries):
+            entry.attempts += 1
+            try:
+                deliver(entry)
+            except Exception as e:
+                # only the Connect errors may be transient, anything else fails the entry for good.
+                retryable = isinstance(e, ClientError) and (
+                    e.status_code is None or e.status_code in DEFAULT_RETRYABLE_STATUS_CODES
+                )
+                if retryable and entry.attempts < self.max_attempts:
+                    # postpone the entry, the next entries of the request must wait for it.
+                    self._mark(entry, PENDING, str(e), self.clock() + self._backoff(entry, e))
+                    self._release(entries[i + 1:])
+                    return sent
+                # the next entries of the request depend on this one, they must not be sent.
+                self._mark(entry, FAILED, str(e))
+                self._block(entry)
+                return sent
+
+            self._mark(entry, DONE)
+            sent += 1
+        return sent
+
+    def drain(self, deliver: Callable[[OutboxEntry], Any]) -> int:
+        """
+        Claims and sends one batch of due entries, in order per request id and
+        concurrently across request ids.
+
+        :param deliver: Callable Sends the given entry to Connect, raising an error on failure.
+        :return: int The number of entries sent.
+        """
+        groups: Dict[str, List[OutboxEntry]] = OrderedDict()
+        for entry in self._claim():
+            groups.setdefault(entry.request_id, []).append(entry)
+
+        if not groups:
+            return 0
+        if len(groups) == 1 or self.max_workers == 1:
+            return sum(self._send(entries, deliver) for entries in groups.values())
+
+        return sum(self._pool().map(lambda entries: self._send(entries, deliver), groups.values()))
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # long-lived senders, the thread local client sessions are reused between the passes.
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='connect-outbox')
+            return self._executor
+
+    def start(self, deliver: Callable[[OutboxEntry], Any]) -> None:
+        """
+        Starts the background drainer thread.
+
+        :param deliver: Callable Sends the given entry to Connect, raising an error on failure.
+        """
+        if self._drainer is not None and self._drainer.is_alive():
+            return
+
+        self._stop.clear()
+
+        def run() -> None:
+            while not self._stop.is_set():
+                try:
+                    sent = self.drain(deliver)
+                except Exception:
+                    # the drainer must survive, e.g. a locked database, the next pass retries.
+                    logger.exception('The outbox drain pass failed.')
+                    sent = 0
+                if sent == 0:
+                    self._wake.wait(self.poll_interval)
+                    self._wake.clear()
+
+        self._drainer = threading.Thread(target=run, name='connect-outbox-drainer', daemon=True)
+        self._drainer.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the background drainer thread, the current drain pass is completed.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._drainer is not None:
+            self._drainer.join(timeout)
+            self._drainer = None
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
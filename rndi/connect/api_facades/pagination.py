@@ -0,0 +1,124 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional
+
+from connect.client.models import AsyncResourceSet, ResourceSet
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def _validate_page_size(page_size: int) -> None:
+    if page_size <= 0:
+        raise ValueError('`page_size` must be a positive, non-zero integer.')
+
+
+def iterate(
+        resource_set: ResourceSet,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+        call: Optional[Callable[[Callable[[], Any]], Any]] = None,
+        executor: Optional[Executor] = None,
+) -> Iterator[dict]:
+    """
+    Lazily iterates the given ResourceSet page by page, only the current page,
+    and the next one if prefetch is enabled, are kept in memory.
+
+    :param resource_set: ResourceSet The (filtered) ResourceSet to iterate.
+    :param page_size: int The number of items to fetch on each HTTP call.
+    :param prefetch: bool Fetch the page N+1 in background while the page N is consumed.
+    :param call: Optional[Callable] Executes each page call, e.g. through a retry policy.
+    :param executor: Optional[Executor] Runs the prefetch calls, defaults to a thread of this iteration only.
+    :return: Iterator[dict] The raw items.
+    """
+    _validate_page_size(page_size)
+    resource_set = resource_set.limit(page_size)
+
+    def fetch(offset: int) -> List[dict]:
+        if call is None:
+            return list(resource_set[offset:offset + page_size])
+        return call(lambda: list(resource_set[offset:offset + page_size]))
+
+    owned = ThreadPoolExecutor(max_workers=1) if prefetch and executor is None else None
+    executor = (executor or owned) if prefetch else None
+    offset = 0
+    following = None
+    page = fetch(offset)
+    try:
+        while True:
+            has_more = len(page) == page_size
+            following = None
+            if has_more and executor is not None:
+                following = executor.submit(fetch, offset + page_size)
+
+            yield from page
+
+            if not has_more:
+                return
+
+            offset += page_size
+            page = fetch(offset) if following is None else following.result()
+    finally:
+        if following is not None:
+            following.cancel()
+        if owned is not None:
+            owned.shutdown(wait=False)
+
+
+async def aiterate(
+        resource_set: AsyncResourceSet,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+        call: Optional[Callable[[Callable[[], Awaitable[Any]]], Awaitable[Any]]] = None,
+) -> AsyncIterator[dict]:
+    """
+    Lazily iterates the given AsyncResourceSet page by page, only the current
+    page, and the next one if prefetch is enabled, are kept in memory.
+
+    :param resource_set: AsyncResourceSet The (filtered) AsyncResourceSet to iterate.
+    :param page_size: int The number of items to fetch on each HTTP call.
+    :param prefetch: bool Fetch the page N+1 in a task while the page N is consumed.
+    :param call: Optional[Callable] Awaits each page call, e.g. through a retry policy.
+    :return: AsyncIterator[dict] The raw items.
+    """
+    _validate_page_size(page_size)
+    resource_set = resource_set.limit(page_size)
+
+    async def slice_(offset: int) -> List[dict]:
+        return [item async for item in resource_set[offset:offset + page_size]]
+
+    async def fetch(offset: int) -> List[dict]:
+        if call is None:
+            return await slice_(offset)
+        return await call(lambda: slice_(offset))
+
+    offset = 0
+    following = None
+    page = await fetch(offset)
+    try:
+        while True:
+            has_more = len(page) == page_size
+            if has_more and prefetch:
+                following = asyncio.ensure_future(fetch(offset + page_size))
+
+            for item in page:
+                yield item
+
+            if not has_more:
+                return
+
+            offset += page_size
+            if following is None:
+                page = await fetch(offset)
+            else:
+                page = await following
+                following = None
+    finally:
+        if following is not None:
+            following.cancel()
@@ -0,0 +1,218 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+READ = 'read'
+WRITE = 'write'
+
+
+class Bucket(ABC):
+    """
+    Token bucket contract, the tokens are reserved in advance: a reservation
+    always succeeds, returning the time to wait until the tokens are
+    available, so waiting callers are served in order without busy loops.
+    """
+
+    @abstractmethod
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Reserves the given tokens.
+
+        :param tokens: float The number of tokens to take.
+        :return: float The seconds to wait before using the reserved tokens.
+        """
+
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Takes the given tokens, blocking the current thread until available.
+
+        :param tokens: float The number of tokens to take.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1) -> None:
+        """
+        Takes the given tokens, suspending the current task until available.
+
+        :param tokens: float The number of tokens to take.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def _validate(rate: float, capacity: float) -> None:
+    if rate <= 0:
+        raise ValueError('`rate` must be a positive, non-zero number.')
+    if capacity <= 0:
+        raise ValueError('`capacity` must be a positive, non-zero number.')
+
+
+class TokenBucket(Bucket):
+    """
+    In process token bucket, shared by every thread and task of the process.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            capacity: Optional[float] = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param rate: float The tokens added per second.
+        :param capacity: Optional[float] The max burst of tokens, defaults to the rate.
+        """
+        capacity = rate if capacity is None else capacity
+        _validate(rate, capacity)
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated_at = clock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class SQLiteTokenBucket(Bucket):
+    """
+    Cross process token bucket, its state is stored in the given SQLite file
+    so every worker process using the same file (and name) shares the budget.
+    """
+
+    def __init__(
+            self,
+            path: str,
+            rate: float,
+            capacity: Optional[float] = None,
+            name: str = 'default',
+            clock: Callable[[], float] = time.time,
+            timeout: float = 30.0,
+    ):
+        """
+        :param path: str The SQLite database file, shared by the processes.
+        :param rate: float The tokens added per second.
+        :param capacity: Optional[float] The max burst of tokens, defaults to the rate.
+        :param name: str The bucket name, several buckets can live in the same file.
+        :param clock: Callable The wall clock, it must be shared by the processes.
+        :param timeout: float Seconds to wait for the database lock.
+        """
+        capacity = rate if capacity is None else capacity
+        _validate(rate, capacity)
+
+        self.path = path
+        self.rate = rate
+        self.capacity = capacity
+        self.name = name
+        self.timeout = timeout
+        self._clock = clock
+
+        connection = self._connect()
+        try:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS token_buckets '
+                '(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)',
+            )
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    def reserve(self, tokens: float = 1) -> float:
+        connection = self._connect()
+        try:
+            # the immediate transaction takes the write lock, serializing the reservations.
+            connection.execute('BEGIN IMMEDIATE')
+            row = connection.execute(
+                'SELECT tokens, updated_at FROM token_buckets WHERE name = ?',
+                (self.name,),
+            ).fetchone()
+
+            now = self._clock()
+            available = self.capacity if row is None else min(
+                self.capacity,
+                row[0] + max(0.0, now - row[1]) * self.rate,
+            )
+            available -= tokens
+
+            connection.execute(
+                'INSERT OR REPLACE INTO token_buckets (name, tokens, updated_at) VALUES (?, ?, ?)',
+                (self.name, available, now),
+            )
+            connection.execute('COMMIT')
+        except Exception:
+            if connection.in_transaction:
+                connection.execute('ROLLBACK')
+            raise
+        finally:
+            connection.close()
+
+        return 0.0 if available >= 0 else -available / self.rate
+
+    async def acquire_async(self, tokens: float = 1) -> None:
+        """
+        Takes the given tokens, suspending the current task until available.
+        The reservation (a SQLite write transaction that may wait for the
+        database lock) runs in the default executor, off the event loop.
+
+        :param tokens: float The number of tokens to take.
+        """
+        wait = await asyncio.get_running_loop().run_in_executor(None, self.reserve, tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """
+    Rate limiter with separate read and write budgets, a missing bucket
+    means no limit for that kind of call.
+    """
+
+    def __init__(self, read: Optional[Bucket] = None, write: Optional[Bucket] = None):
+        """
+        :param read: Optional[Bucket] The bucket of the read calls (find, search).
+        :param write: Optional[Bucket] The bucket of the write calls (transitions, parameter updates).
+        """
+        self.buckets = {READ: read, WRITE: write}
+
+    def acquire(self, kind: str = READ) -> None:
+        """
+        Takes one token of the given budget, blocking until available.
+
+        :param kind: str The call kind: read or write.
+        """
+        bucket = self.buckets[kind]
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, kind: str = READ) -> None:
+        """
+        Takes one token of the given budget, suspending until available.
+
+        :param kind: str The call kind: read or write.
+        """
+        bucket = self.buckets[kind]
+        if bucket is not None:
+            await bucket.acquire_async()
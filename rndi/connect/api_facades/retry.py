@@ -0,0 +1,167 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+from connect.client import ClientError
+
+TOO_MANY_REQUESTS = 429
+DEFAULT_RETRYABLE_STATUS_CODES = frozenset({TOO_MANY_REQUESTS, 500, 502, 503, 504})
+
+
+def retry_after(error: ClientError) -> Optional[float]:
+    """
+    Extracts the Retry-After header (seconds or HTTP date) of the response
+    that raised the given error.
+
+    :param error: ClientError The client error.
+    :return: Optional[float] The seconds to wait, None if not provided.
+    """
+    response = getattr(error.__cause__, 'response', None)
+    value = response.headers.get('Retry-After') if response is not None else None
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Retries the calls failing with a retryable ClientError using a capped
+    exponential backoff with full jitter, honoring the Retry-After header.
+    Non idempotent calls (status transitions) are only retried on 429, the
+    throttled call never reached the server, unless retry_non_idempotent.
+
+    The ConnectClient retries the 5xx responses on its own (max_retries), so
+    the client used with a policy must be built with max_retries=0, otherwise
+    one attempt of the policy can be several HTTP calls.
+    """
+
+    def __init__(
+            self,
+            max_attempts: int = 3,
+            backoff_base: float = 0.5,
+            backoff_cap: float = 30.0,
+            jitter: bool = True,
+            respect_retry_after: bool = True,
+            retryable_status_codes: Iterable[int] = DEFAULT_RETRYABLE_STATUS_CODES,
+            retry_connection_errors: bool = True,
+            retry_non_idempotent: bool = False,
+            sleep: Callable[[float], Any] = time.sleep,
+            async_sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+            uniform: Callable[[float, float], float] = random.uniform,
+    ):
+        """
+        :param max_attempts: int Total number of attempts, including the first one.
+        :param backoff_base: float Seconds of the first backoff, doubled on each attempt.
+        :param backoff_cap: float Max seconds to wait between attempts.
+        :param jitter: bool Wait a random time between 0 and the backoff (full jitter).
+        :param respect_retry_after: bool Wait the Retry-After seconds if the response provides them.
+        :param retryable_status_codes: Iterable[int] The HTTP status codes to retry.
+        :param retry_connection_errors: bool Retry the errors raised without any HTTP response.
+        :param retry_non_idempotent: bool Retry the non idempotent calls as the idempotent ones.
+        """
+        if max_attempts <= 0:
+            raise ValueError('`max_attempts` must be a positive, non-zero integer.')
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.retryable_status_codes = frozenset(retryable_status_codes)
+        self.retry_connection_errors = retry_connection_errors
+        self.retry_non_idempotent = retry_non_idempotent
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._uniform = uniform
+
+    def should_retry(self, error: ClientError, attempt: int, idempotent: bool = True) -> bool:
+        """
+        :param error: ClientError The error raised by the given attempt.
+        :param attempt: int The failed attempt number, starting at 1.
+        :param idempotent: bool True if the call can be safely repeated.
+        :return: bool True if a new attempt must be done.
+        """
+        if attempt >= self.max_attempts:
+            return False
+
+        if error.status_code is None:
+            # errors without response: connection errors and timeouts (or client side validations).
+            return self.retry_connection_errors and error.__cause__ is not None and idempotent
+
+        if not idempotent and not self.retry_non_idempotent:
+            return error.status_code == TOO_MANY_REQUESTS and error.status_code in self.retryable_status_codes
+
+        return error.status_code in self.retryable_status_codes
+
+    def delay(self, error: ClientError, attempt: int) -> float:
+        """
+        :param error: ClientError The error raised by the given attempt.
+        :param attempt: int The failed attempt number, starting at 1.
+        :return: float The seconds to wait before the next attempt.
+        """
+        if self.respect_retry_after:
+            seconds = retry_after(error)
+            if seconds is not None:
+                return min(seconds, self.backoff_cap)
+
+        backoff = min(self.backoff_cap, self.backoff_base * (2 ** (attempt - 1)))
+        return self._uniform(0, backoff) if self.jitter else backoff
+
+    def call(self, fn: Callable[[], Any], idempotent: bool = True) -> Any:
+        """
+        Executes the given function retrying it according to the policy.
+
+        :param fn: Callable The function to execute.
+        :param idempotent: bool True if the call can be safely repeated.
+        :return: Any The function result.
+        """
+        attempt = 1
+        while True:
+            try:
+                return fn()
+            except ClientError as e:
+                if not self.should_retry(e, attempt, idempotent):
+                    raise
+                self._sleep(self.delay(e, attempt))
+                attempt += 1
+
+    async def call_async(self, fn: Callable[[], Awaitable[Any]], idempotent: bool = True) -> Any:
+        """
+        Awaits the given coroutine function retrying it according to the policy.
+
+        :param fn: Callable The coroutine function to execute.
+        :param idempotent: bool True if the call can be safely repeated.
+        :return: Any The coroutine result.
+        """
+        attempt = 1
+        while True:
+            try:
+                return await fn()
+            except ClientError as e:
+                if not self.should_retry(e, attempt, idempotent):
+                    raise
+                await self._async_sleep(self.delay(e, attempt))
+                attempt += 1
@@ -0,0 +1,233 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from concurrent.futures import Future
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from rndi.connect.api_facades.metrics import Histogram, QUANTILES
+
+CRITICAL = 'critical'
+INTERACTIVE = 'interactive'
+BULK = 'bulk'
+
+DEFAULT_PRIORITY_CLASSES = (CRITICAL, INTERACTIVE, BULK)
+DEFAULT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class ClassStats:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_WAIT_BUCKETS):
+        self.queued = 0
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.wait = Histogram(buckets)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'queued': self.queued,
+            'running': self.running,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'dropped': self.dropped,
+            'wait': {
+                'count': self.wait.count,
+                'sum': self.wait.sum,
+                **{f'p{int(q * 100)}': self.wait.quantile(q) for q in QUANTILES},
+            },
+        }
+
+
+class _Job:
+    __slots__ = ('priority', 'deadline', 'submitted_at', 'fn', 'future')
+
+    def __init__(self, priority: str, deadline: Optional[float], submitted_at: float, fn: Callable[[], Any]):
+        self.priority = priority
+        self.deadline = deadline
+        self.submitted_at = submitted_at
+        self.fn = fn
+        self.future: Future = Future()
+
+
+class OperationScheduler:
+    """
+    Bounded worker pool dispatching the facade operations by priority class
+    first and earliest deadline first inside each class (submission order
+    for the operations without deadline). Operations whose deadline passed
+    while queued are dropped, their future fails with DeadlineExceeded.
+    """
+
+    def __init__(
+            self,
+            max_workers: int = 4,
+            classes: Sequence[str] = DEFAULT_PRIORITY_CLASSES,
+            default_class: Optional[str] = None,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param max_workers: int The max number of operations sent at the same time.
+        :param classes: Sequence[str] The priority classes, highest priority first.
+        :param default_class: Optional[str] The class of the operations submitted without one, defaults to the last.
+        :param clock: Callable The monotonic clock used by the deadlines.
+        """
+        if max_workers <= 0:
+            raise ValueError('`max_workers` must be a positive, non-zero integer.')
+        if not classes:
+            raise ValueError('`classes` must contain at least one priority class.')
+        if default_class is not None and default_class not in classes:
+            raise ValueError(f'Unknown priority class `{default_class}`.')
+
+        self.max_workers = max_workers
+        self.classes = tuple(classes)
+        self.default_class = default_class or self.classes[-1]
+        self.clock = clock
+        self._ranks = {name: rank for rank, name in enumerate(self.classes)}
+        self._stats = {name: ClassStats() for name in self.classes}
+        self._queue: List[Tuple[int, float, int, _Job]] = []
+        self._sequence = itertools.count()
+        self._worker_ids = itertools.count()
+        self._condition = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._shutdown = False
+
+    def submit(
+            self,
+            fn: Callable[..., Any],
+            *args: Any,
+            priority: Optional[str] = None,
+            deadline: Optional[float] = None,
+            **kwargs: Any,
+    ) -> Future:
+        """
+        Queues the given operation.
+
+        :param fn: Callable The operation, usually a facade method.
+        :param priority: Optional[str] The priority class, defaults to the default class.
+        :param deadline: Optional[float] Seconds from now the operation must be dispatched within.
+        :return: Future The operation result.
+        """
+        priority = priority or self.default_class
+        if priority not in self._ranks:
+            raise ValueError(f'Unknown priority class `{priority}`.')
+
+        now = self.clock()
+        job = _Job(priority, None if deadline is None else now + deadline, now, lambda: fn(*args, **kwargs))
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('Cannot submit operations after shutdown.')
+
+            stats = self._stats[priority]
+            stats.submitted += 1
+            stats.queued += 1
+            key = float('inf') if job.deadline is None else job.deadline
+            heapq.heappush(self._queue, (self._ranks[priority], key, next(self._sequence), job))
+            # a worker stopped by a BaseException is replaced on the next submission.
+            self._workers = [worker for worker in self._workers if worker.is_alive()]
+            if len(self._workers) < self.max_workers:
+                self._start_worker()
+            self._condition.notify()
+
+        return job.future
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(
+            target=self._work,
+            name=f'connect-scheduler-{next(self._worker_ids)}',
+            daemon=True,
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _next(self) -> Optional[_Job]:
+        with self._condition:
+            while True:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if not self._queue:
+                    return None
+
+                job = heapq.heappop(self._queue)[3]
+                now = self.clock()
+                stats = self._stats[job.priority]
+                stats.queued -= 1
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                if job.deadline is not None and now > job.deadline:
+                    stats.dropped += 1
+                    job.future.set_exception(DeadlineExceeded(
+                        f'The operation deadline passed {now - job.deadline:.3f}s before dispatch.',
+                    ))
+                    continue
+
+                stats.running += 1
+                stats.wait.observe(now - job.submitted_at)
+                return job
+
+    def _work(self) -> None:
+        while True:
+            job = self._next()
+            if job is None:
+                return
+
+            try:
+                job.future.set_result(job.fn())
+            except BaseException as e:
+                job.future.set_exception(e)
+                if not isinstance(e, Exception):
+                    self._retire()
+                    raise
+            finally:
+                with self._condition:
+                    stats = self._stats[job.priority]
+                    stats.running -= 1
+                    stats.completed += 1
+
+    def _retire(self) -> None:
+        # the current worker is stopping, the queued operations must not wait for the next submission.
+        with self._condition:
+            self._workers = [worker for worker in self._workers if worker is not threading.current_thread()]
+            if self._queue:
+                self._start_worker()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        :return: Dict[str, Dict[str, Any]] The queue depth, counters and wait times of each priority class.
+        """
+        with self._condition:
+            return {name: stats.as_dict() for name, stats in self._stats.items()}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the workers once the queued operations are dispatched.
+
+        :param wait: bool Wait for the workers to finish.
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+        while wait:
+            # a retiring worker may start a replacement while the others are joined.
+            with self._condition:
+                workers = [worker for worker in self._workers if worker.is_alive()]
+            if not workers:
+                return
+            for worker in workers:
+                worker.join()
+
+    def __enter__(self) -> OperationScheduler:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
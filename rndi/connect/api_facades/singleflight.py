@@ -0,0 +1,115 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Union
+
+
+class _Call:
+    def __init__(self, future: Union[Future, asyncio.Future]):
+        self.future = future
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share the same key into one in-flight call,
+    every caller receives the result, or the raised error, of that call.
+
+    Waiters receive a deep copy of the result, so the returned values can be
+    mutated independently.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Executes the given function unless there is already an in-flight call
+        for the same key, in which case it waits for its result.
+
+        :param key: Hashable The call key, usually (entity, id).
+        :param fn: Callable The function to execute.
+        :return: Any The function result.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call(Future())
+            else:
+                call.waiters += 1
+
+        if not leader:
+            return copy.deepcopy(call.future.result())
+
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                del self._calls[key]
+            call.future.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._calls[key]
+        call.future.set_result(result)
+
+        return copy.deepcopy(result) if call.waiters else result
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio version of the SingleFlight, concurrent tasks that share the same
+    key await the same in-flight coroutine.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Awaits the given coroutine function unless there is already an in-flight
+        call for the same key, in which case it waits for its result.
+
+        :param key: Hashable The call key, usually (entity, id).
+        :param fn: Callable The coroutine function to await.
+        :return: Any The coroutine result.
+        """
+        call = self._calls.get(key)
+        if call is not None:
+            call.waiters += 1
+            return copy.deepcopy(await asyncio.shield(call.future))
+
+        call = self._calls[key] = _Call(asyncio.get_running_loop().create_future())
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            del self._calls[key]
+            call.future.cancel()
+            raise
+        except BaseException as e:
+            del self._calls[key]
+            call.future.set_exception(e)
+            # mark the exception as retrieved, the leader re-raises it anyway.
+            call.future.exception()
+            raise
+
+        del self._calls[key]
+        call.future.set_result(result)
+
+        return copy.deepcopy(result) if call.waiters else result
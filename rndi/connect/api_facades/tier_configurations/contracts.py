@@ -6,31 +6,114 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
 
+from connect.client import R
+from rndi.connect.api_facades.bulk import BulkReport, DEFAULT_MAX_WORKERS
 from rndi.connect.api_facades.contracts import OnError, OnSuccess
+from rndi.connect.api_facades.pagination import DEFAULT_PAGE_SIZE
 from rndi.connect.business_objects.adapters import Request, TierConfiguration
+from rndi.connect.api_facades.views import RequestView
 
 
 class TierConfigurationManagementService(ABC):
     @abstractmethod
-    def find_tier_configuration(self, tier_configuration_id: str) -> TierConfiguration:
+    def find_tier_configuration(
+            self,
+            tier_configuration_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+    ) -> TierConfiguration:
         """
         Returns the required TierConfiguration Business Object by id.
 
         :param tier_configuration_id: str The unique Tier Configuration id: TC-XXXX-XXXX-XXXX
+        :param select: Optional[List[str]] Fields to include using the RQL select, e.g. ['status'].
+        :param exclude: Optional[List[str]] Fields to exclude using the RQL select, e.g. ['asset.params'].
         :return: TierConfiguration The required TierConfiguration.
         """
 
     @abstractmethod
-    def find_tier_configuration_request(self, request_id: str) -> Request:
+    def find_tier_configuration_request(
+            self,
+            request_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+    ) -> Request:
         """
         Returns the required TierConfiguration Request Business Object by id.
 
         :param request_id: str The unique Request id: TCR-XXXX-XXXX-XXXX-NNN
+        :param select: Optional[List[str]] Fields to include using the RQL select, e.g. ['status'].
+        :param exclude: Optional[List[str]] Fields to exclude using the RQL select, e.g. ['asset.params'].
         :return: Request The required Request
         """
 
+    @abstractmethod
+    def iter_tier_configurations(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> Iterator[TierConfiguration]:
+        """
+        Lazily iterates the Tier Configurations that match the given filters.
+
+        :param rql: RQL filter expressions as strings or R objects.
+        :param page_size: int The number of items fetched on each HTTP call.
+        :param prefetch: bool Fetch the next page in background while the current one is consumed.
+        :param select: Optional[List[str]] Fields to include using the RQL select, e.g. ['status'].
+        :param exclude: Optional[List[str]] Fields to exclude using the RQL select, e.g. ['asset.params'].
+        :param filters: Keyword filters using the double underscore notation: status='pending'.
+        :return: Iterator[TierConfiguration] The matching Tier Configurations.
+        """
+
+    @abstractmethod
+    def iter_tier_configuration_requests(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> Iterator[Request]:
+        """
+        Lazily iterates the Tier Configuration Requests that match the given filters.
+
+        :param rql: RQL filter expressions as strings or R objects.
+        :param page_size: int The number of items fetched on each HTTP call.
+        :param prefetch: bool Fetch the next page in background while the current one is consumed.
+        :param select: Optional[List[str]] Fields to include using the RQL select, e.g. ['status'].
+        :param exclude: Optional[List[str]] Fields to exclude using the RQL select, e.g. ['asset.params'].
+        :param filters: Keyword filters using the double underscore notation: status='pending'.
+        :return: Iterator[Request] The matching Tier Configuration Requests.
+        """
+
+    @abstractmethod
+    def iter_tier_configuration_request_views(
+            self,
+            *rql: Union[str, R],
+            parameters: Optional[Iterable[str]] = None,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            **filters,
+    ) -> Iterator[RequestView]:
+        """
+        Lazily iterates the Tier Configuration Requests that match the given filters as compact
+        read-only views, the full Request can be read back with view.to_request(api).
+
+        :param rql: RQL filter expressions as strings or R objects.
+        :param parameters: Optional[Iterable[str]] The ids of the parameters to keep, e.g. ['my_ordering_parameter'].
+        :param page_size: int The number of items fetched on each HTTP call.
+        :param prefetch: bool Fetch the next page in background while the current one is consumed.
+        :param filters: Keyword filters using the double underscore notation: status='pending'.
+        :return: Iterator[RequestView] The matching Tier Configuration Request views.
+        """
+
     @abstractmethod
     def approve_tier_configuration_request(
             self,
@@ -76,6 +159,7 @@ class TierConfigurationManagementService(ABC):
             parameters: List[Dict[str, Any]],
             on_error: Optional[OnError] = None,
             on_success: Optional[OnSuccess] = None,
+            diff: Optional[bool] = None,
     ) -> Union[Any, Request]:
         """
         Updates the given request parameters.
@@ -84,7 +168,10 @@ class TierConfigurationManagementService(ABC):
         :param parameters: The parameters to update.
         :param on_error: Callback to execute when we got an error.
         :param on_success: Callback to execute when action finished successfully.
-        :return: The updated Request.
+        :param diff: Send only the parameters that change, skipping the call if none, defaults to the facade setting.
+        :return: The updated Request (the callback result), or if parameter updates coalescing enabled a
+            concurrent.futures.Future resolved with the callback result on flush, the callbacks then run on the
+            flushing thread (the coalescer thread once the window expires).
         """
         pass
 
@@ -104,3 +191,296 @@ class TierConfigurationManagementService(ABC):
         :return: The updated Request.
         """
         pass
+
+    @abstractmethod
+    def approve_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            template_id: str,
+            effective_date: Optional[str] = None,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        """
+        Approves the given requests concurrently using the given template id.
+
+        :param requests: The Request objects.
+        :param template_id: The template id to be used to approve.
+        :param effective_date: The effective date.
+        :param max_workers: The max number of concurrent approvals.
+        :param on_error: Callback to execute for each request that got an error.
+        :param on_success: Callback to execute for each request approved successfully.
+        :return: The per request BulkReport.
+        """
+
+    @abstractmethod
+    def fail_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            reason: str,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        """
+        Fail the given requests concurrently using the given reason.
+
+        :param requests: The Request objects.
+        :param reason: The reason to fail the requests.
+        :param max_workers: The max number of concurrent fails.
+        :param on_error: Callback to execute for each request that got an error.
+        :param on_success: Callback to execute for each request failed successfully.
+        :return: The per request BulkReport.
+        """
+
+    @abstractmethod
+    def inquire_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        """
+        Inquires the given requests concurrently.
+
+        :param requests: The Request objects.
+        :param max_workers: The max number of concurrent inquires.
+        :param on_error: Callback to execute for each request that got an error.
+        :param on_success: Callback to execute for each request inquired successfully.
+        :return: The per request BulkReport.
+        """
+
+
+class AsyncTierConfigurationManagementService(ABC):
+    @abstractmethod
+    async def find_tier_configuration(
+            self,
+            tier_configuration_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+    ) -> TierConfiguration:
+        """
+        Returns the required TierConfiguration Business Object by id.
+
+        :param tier_configuration_id: str The unique Tier Configuration id: TC-XXXX-XXXX-XXXX
+        :param select: Optional[List[str]] Fields to include using the RQL select, e.g. ['status'].
+        :param exclude: Optional[List[str]] Fields to exclude using the RQL select, e.g. ['asset.params'].
+        :return: TierConfiguration The required TierConfiguration.
+        """
+
+    @abstractmethod
+    async def find_tier_configuration_request(
+            self,
+            request_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+    ) -> Request:
+        """
+        Returns the required TierConfiguration Request Business Object by id.
+
+        :param request_id: str The unique Request id: TCR-XXXX-XXXX-XXXX-NNN
+        :param select: Optional[List[str]] Fields to include using the RQL select, e.g. ['status'].
+        :param exclude: Optional[List[str]] Fields to exclude using the RQL select, e.g. ['asset.params'].
+        :return: Request The required Request
+        """
+
+    @abstractmethod
+    def iter_tier_configurations(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> AsyncIterator[TierConfiguration]:
+        """
+        Lazily iterates the Tier Configurations that match the given filters.
+
+        :param rql: RQL filter expressions as strings or R objects.
+        :param page_size: int The number of items fetched on each HTTP call.
+        :param prefetch: bool Fetch the next page in a task while the current one is consumed.
+        :param select: Optional[List[str]] Fields to include using the RQL select, e.g. ['status'].
+        :param exclude: Optional[List[str]] Fields to exclude using the RQL select, e.g. ['asset.params'].
+        :param filters: Keyword filters using the double underscore notation: status='pending'.
+        :return: AsyncIterator[TierConfiguration] The matching Tier Configurations.
+        """
+
+    @abstractmethod
+    def iter_tier_configuration_requests(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> AsyncIterator[Request]:
+        """
+        Lazily iterates the Tier Configuration Requests that match the given filters.
+
+        :param rql: RQL filter expressions as strings or R objects.
+        :param page_size: int The number of items fetched on each HTTP call.
+        :param prefetch: bool Fetch the next page in a task while the current one is consumed.
+        :param select: Optional[List[str]] Fields to include using the RQL select, e.g. ['status'].
+        :param exclude: Optional[List[str]] Fields to exclude using the RQL select, e.g. ['asset.params'].
+        :param filters: Keyword filters using the double underscore notation: status='pending'.
+        :return: AsyncIterator[Request] The matching Tier Configuration Requests.
+        """
+
+    @abstractmethod
+    async def iter_tier_configuration_request_views(
+            self,
+            *rql: Union[str, R],
+            parameters: Optional[Iterable[str]] = None,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            **filters,
+    ) -> AsyncIterator[RequestView]:
+        """
+        Lazily iterates the Tier Configuration Requests that match the given filters as compact
+        read-only views, the full Request can be read back with view.to_request(api).
+
+        :param rql: RQL filter expressions as strings or R objects.
+        :param parameters: Optional[Iterable[str]] The ids of the parameters to keep, e.g. ['my_ordering_parameter'].
+        :param page_size: int The number of items fetched on each HTTP call.
+        :param prefetch: bool Fetch the next page in a task while the current one is consumed.
+        :param filters: Keyword filters using the double underscore notation: status='pending'.
+        :return: AsyncIterator[RequestView] The matching Tier Configuration Request views.
+        """
+
+    @abstractmethod
+    async def approve_tier_configuration_request(
+            self,
+            request: Union[dict, Request],
+            template_id: str,
+            effective_date: Optional[str] = None,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> Union[Any, Request]:
+        """
+        Approves the given request using the given template id.
+
+        :param request: The Request object.
+        :param template_id: The template id to be used to approve.
+        :param effective_date: The effective date.
+        :param on_error: Sync or async callback to execute when we got an error.
+        :param on_success: Sync or async callback to execute when action finished successfully.
+        :return: The approved Request.
+        """
+
+    @abstractmethod
+    async def fail_tier_configuration_request(
+            self,
+            request: Union[dict, Request],
+            reason: str,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> Union[Any, Request]:
+        """
+        Fail the given request using the given reason.
+
+        :param request: The Request object.
+        :param reason: The reason to fail the request.
+        :param on_error: Sync or async callback to execute when we got an error.
+        :param on_success: Sync or async callback to execute when action finished successfully.
+        :return: The failed Request.
+        """
+
+    @abstractmethod
+    async def update_tier_configuration_request_parameters(
+            self,
+            request: Union[dict, Request],
+            parameters: List[Dict[str, Any]],
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+            diff: Optional[bool] = None,
+    ) -> Union[Any, Request]:
+        """
+        Updates the given request parameters.
+
+        :param request: The Request object.
+        :param parameters: The parameters to update.
+        :param on_error: Sync or async callback to execute when we got an error.
+        :param on_success: Sync or async callback to execute when action finished successfully.
+        :param diff: Send only the parameters that change, skipping the call if none, defaults to the facade setting.
+        :return: The updated Request.
+        """
+
+    @abstractmethod
+    async def inquire_tier_configuration_request(
+            self,
+            request: Union[dict, Request],
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> Union[Any, Request]:
+        """
+        Inquires the given request.
+
+        :param request: The Request object.
+        :param on_error: Sync or async callback to execute when we got an error.
+        :param on_success: Sync or async callback to execute when action finished successfully.
+        :return: The updated Request.
+        """
+
+    @abstractmethod
+    async def approve_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            template_id: str,
+            effective_date: Optional[str] = None,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        """
+        Approves the given requests concurrently using the given template id.
+
+        :param requests: The Request objects.
+        :param template_id: The template id to be used to approve.
+        :param effective_date: The effective date.
+        :param max_workers: The max number of concurrent approvals.
+        :param on_error: Sync or async callback to execute for each request that got an error.
+        :param on_success: Sync or async callback to execute for each request approved successfully.
+        :return: The per request BulkReport.
+        """
+
+    @abstractmethod
+    async def fail_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            reason: str,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        """
+        Fail the given requests concurrently using the given reason.
+
+        :param requests: The Request objects.
+        :param reason: The reason to fail the requests.
+        :param max_workers: The max number of concurrent fails.
+        :param on_error: Sync or async callback to execute for each request that got an error.
+        :param on_success: Sync or async callback to execute for each request failed successfully.
+        :return: The per request BulkReport.
+        """
+
+    @abstractmethod
+    async def inquire_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        """
+        Inquires the given requests concurrently.
+
+        :param requests: The Request objects.
+        :param max_workers: The max number of concurrent inquires.
+        :param on_error: Sync or async callback to execute for each request that got an error.
+        :param on_success: Sync or async callback to execute for each request inquired successfully.
+        :return: The per request BulkReport.
+        """
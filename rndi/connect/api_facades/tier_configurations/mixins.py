@@ -5,14 +5,30 @@
 #
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Union
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Union
 
-from connect.client import AsyncConnectClient, ClientError, ConnectClient
+from connect.client import AsyncConnectClient, ClientError, ConnectClient, R
 from rndi.connect.business_objects.adapters import Request, TierConfiguration
+from rndi.connect.api_facades.bulk import BulkReport, DEFAULT_MAX_WORKERS, run_bulk, run_bulk_async
+from rndi.connect.api_facades.cache import TIER_CONFIGURATION, TIER_CONFIGURATION_REQUEST
 from rndi.connect.api_facades.contracts import OnError, OnSuccess
+from rndi.connect.api_facades.helpers import (
+    changed_parameters,
+    merge_parameters,
+    raise_error,
+    resolve,
+    return_request,
+    rql_select,
+)
+from rndi.connect.api_facades.mixins import AsyncWithFacadeSupport, WithFacadeSupport
+from rndi.connect.api_facades.pagination import aiterate, DEFAULT_PAGE_SIZE, iterate
+from rndi.connect.api_facades.rate_limit import WRITE
 from rndi.connect.api_facades.tier_configurations.contracts import (
+    AsyncTierConfigurationManagementService,
     TierConfigurationManagementService,
 )
+from rndi.connect.api_facades.views import RequestView
 
 ID = 'id'
 TIER = 'tier'
@@ -20,19 +36,103 @@ APPROVE = 'approve'
 TEMPLATE = 'template'
 FAIL = 'fail'
 INQUIRE = 'inquire'
+VIEW_EXCLUDED_FIELDS = ['params', 'configuration.params']
+
+STATUSES = {
+    APPROVE: 'approved',
+    INQUIRE: 'inquiring',
+    FAIL: 'failed',
+}
 
 
-class WithTierConfigurationFacade(TierConfigurationManagementService):
+class WithTierConfigurationFacade(TierConfigurationManagementService, WithFacadeSupport):
     client: Union[ConnectClient, AsyncConnectClient]
 
-    def find_tier_configuration(self, tier_id: str) -> TierConfiguration:
-        return TierConfiguration(self.client.tiers[tier_id].get())
+    def find_tier_configuration(
+            self,
+            tier_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+    ) -> TierConfiguration:
+        fields = rql_select(select, exclude)
+
+        return self._wrap(TierConfiguration, self._read(
+            TIER_CONFIGURATION,
+            tier_id,
+            lambda **kwargs: self._get(self.client.tiers[tier_id], fields, **kwargs),
+            fields,
+        ))
 
     def find_tier_configuration_request(
             self,
             request_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
     ) -> Request:
-        return Request(self.client.requests[request_id].get())
+        fields = rql_select(select, exclude)
+
+        return self._wrap(Request, self._read(
+            TIER_CONFIGURATION_REQUEST,
+            request_id,
+            lambda **kwargs: self._get(self.client.ns(TIER).config_requests[request_id], fields, **kwargs),
+            fields,
+        ))
+
+    def iter_tier_configurations(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> Iterator[TierConfiguration]:
+        for item in iterate(
+            self.client.ns(TIER).configs.filter(*rql, **filters).select(*rql_select(select, exclude)),
+            page_size,
+            prefetch,
+            self._page_call('iter_tier_configurations'),
+            self._fan_out_pool(),
+        ):
+            yield self._wrap(TierConfiguration, item)
+
+    def iter_tier_configuration_requests(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> Iterator[Request]:
+        for item in iterate(
+            self.client.ns(TIER).config_requests.filter(*rql, **filters).select(*rql_select(select, exclude)),
+            page_size,
+            prefetch,
+            self._page_call('iter_tier_configuration_requests'),
+            self._fan_out_pool(),
+        ):
+            yield self._wrap(Request, item)
+
+    def iter_tier_configuration_request_views(
+            self,
+            *rql: Union[str, R],
+            parameters: Optional[Iterable[str]] = None,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            **filters,
+    ) -> Iterator[RequestView]:
+        parameters = list(parameters or [])
+        # the parameters are only transferred if any of them is kept.
+        fields = rql_select(exclude=None if parameters else VIEW_EXCLUDED_FIELDS)
+        for item in iterate(
+            self.client.ns(TIER).config_requests.filter(*rql, **filters).select(*fields),
+            page_size,
+            prefetch,
+            self._page_call('iter_tier_configuration_request_views'),
+            self._fan_out_pool(),
+        ):
+            yield RequestView.from_tier_configuration_request(item, parameters)
 
     def update_tier_configuration_request_parameters(
             self,
@@ -40,28 +140,65 @@ class WithTierConfigurationFacade(TierConfigurationManagementService):
             parameters: List[Dict[str, Any]],
             on_error: Optional[OnError] = None,
             on_success: Optional[OnSuccess] = None,
+            diff: Optional[bool] = None,
     ) -> Union[Any, Request]:
-        if on_success is None:
-            def on_success(req: Request):
-                return req
+        if self.outbox is not None:
+            return self._enqueue(
+                'update_tier_configuration_request_parameters',
+                request,
+                parameters=parameters,
+                diff=diff,
+                on_error=on_error,
+                on_success=on_success,
+            )
+
+        on_success = return_request if on_success is None else on_success
+        on_error = raise_error if on_error is None else on_error
+
+        if (self.diff_parameter_updates if diff is None else diff):
+            current = request.tier_configuration().raw().get('params', [])
+            if self.parameter_coalescer is not None:
+                # the buffered updates will overwrite the server values, the diff must see them.
+                pending = self.parameter_coalescer.pending((TIER_CONFIGURATION_REQUEST, request.id()))
+                current = merge_parameters(current, pending)
+            parameters = changed_parameters(current, parameters)
+            if not parameters:
+                return on_success(request)
 
-        if on_error is None:
-            def on_error(error: ClientError):
-                raise error
+        if self.parameter_coalescer is not None:
+            return self.parameter_coalescer.submit(
+                (TIER_CONFIGURATION_REQUEST, request.id()),
+                parameters,
+                lambda parameters_: self._put_tier_configuration_request_parameters(request.id(), parameters_),
+                lambda updated_: on_success(request.with_tier_configuration(updated_.tier_configuration())),
+                on_error,
+            )
 
         try:
+            updated = self._put_tier_configuration_request_parameters(request.id(), parameters)
+
             return on_success(
-                request.with_tier_configuration(
-                    Request(
-                        self.client.ns(TIER).config_requests[request.id()].update({
-                            "params": parameters,
-                        }),
-                    ).tier_configuration(),
-                ),
+                request.with_tier_configuration(updated.tier_configuration()),
             )
         except ClientError as e:
             return on_error(e)
 
+    def _put_tier_configuration_request_parameters(
+            self,
+            request_id: str,
+            parameters: List[Dict[str, Any]],
+    ) -> Request:
+        response = self._call(lambda: self.client.ns(TIER).config_requests[request_id].update(**self._payload({
+            "params": parameters,
+        })), kind=WRITE, operation='update_tier_configuration_request_parameters')
+        self._refresh(TIER_CONFIGURATION_REQUEST, request_id, response)
+
+        updated = Request(response)
+        if self.cache is not None:
+            self._invalidate((TIER_CONFIGURATION, updated.tier_configuration().id()))
+
+        return updated
+
     def approve_tier_configuration_request(
             self,
             request: Union[dict, Request],
@@ -70,6 +207,16 @@ class WithTierConfigurationFacade(TierConfigurationManagementService):
             on_error: Optional[OnError] = None,
             on_success: Optional[OnSuccess] = None,
     ) -> Union[Any, Request]:
+        if self.outbox is not None:
+            return self._enqueue(
+                'approve_tier_configuration_request',
+                request,
+                template_id=template_id,
+                effective_date=effective_date,
+                on_error=on_error,
+                on_success=on_success,
+            )
+
         template = {
             ID: template_id,
             "effective_date": effective_date,
@@ -85,6 +232,15 @@ class WithTierConfigurationFacade(TierConfigurationManagementService):
             on_error: Optional[OnError] = None,
             on_success: Optional[OnSuccess] = None,
     ) -> Union[Any, Request]:
+        if self.outbox is not None:
+            return self._enqueue(
+                'fail_tier_configuration_request',
+                request,
+                reason=reason,
+                on_error=on_error,
+                on_success=on_success,
+            )
+
         payload = {'reason': reason}
 
         if on_success is None:
@@ -101,24 +257,34 @@ class WithTierConfigurationFacade(TierConfigurationManagementService):
             on_error: Optional[Callable[[ClientError], Any]] = None,
             on_success: Optional[Callable[[Request], Any]] = None,
     ) -> Union[Any, Request]:
-        if on_success is None:
-            def on_success(req: Request):
-                return req
-
-        if on_error is None:
-            def on_error(error: ClientError):
-                raise error
-        statuses = {
-            "approve": "approved",
-            "inquire": "inquiring",
-            "fail": "failed",
-        }
+        on_success = return_request if on_success is None else on_success
+        on_error = raise_error if on_error is None else on_error
+        if self.parameter_coalescer is not None:
+            # pending parameter updates must reach Connect before the transition.
+            self.parameter_coalescer.flush((TIER_CONFIGURATION_REQUEST, request.id()))
         try:
-            self.client.ns(TIER).config_requests[request.id()](status).post(
-                payload=payload,
+            if self._in_status(
+                request,
+                STATUSES.get(status),
+                partial(self._read_tier_configuration_request_status, request),
+            ):
+                return on_success(request.with_status(STATUSES.get(status)))
+
+            self._call(
+                lambda: self.client.ns(TIER).config_requests[request.id()](status).post(
+                    **self._payload(payload),
+                ),
+                idempotent=False,
+                kind=WRITE,
+                operation=f'{status}_tier_configuration_request',
             )
+            if self.cache is not None:
+                self._invalidate(
+                    (TIER_CONFIGURATION_REQUEST, request.id()),
+                    (TIER_CONFIGURATION, request.tier_configuration().id()),
+                )
             return on_success(
-                request.with_status(statuses.get(status)),
+                request.with_status(STATUSES.get(status)),
             )
         except ClientError as e:
             return on_error(e)
@@ -129,9 +295,328 @@ class WithTierConfigurationFacade(TierConfigurationManagementService):
             on_error: Optional[OnError] = None,
             on_success: Optional[OnSuccess] = None,
     ) -> Union[Any, Request]:
+        if self.outbox is not None:
+            return self._enqueue(
+                'inquire_tier_configuration_request',
+                request,
+                on_error=on_error,
+                on_success=on_success,
+            )
+
         return self._update_request_status(
             request,
             INQUIRE,
             on_error=on_error,
             on_success=on_success,
         )
+
+    def approve_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            template_id: str,
+            effective_date: Optional[str] = None,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return run_bulk(
+            lambda request: self.approve_tier_configuration_request(
+                request,
+                template_id,
+                effective_date,
+                on_error,
+                on_success,
+            ),
+            requests,
+            max_workers,
+        )
+
+    def fail_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            reason: str,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return run_bulk(
+            lambda request: self.fail_tier_configuration_request(request, reason, on_error, on_success),
+            requests,
+            max_workers,
+        )
+
+    def inquire_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return run_bulk(
+            lambda request: self.inquire_tier_configuration_request(request, on_error, on_success),
+            requests,
+            max_workers,
+        )
+
+    def _read_tier_configuration_request_status(self, request: Request) -> str:
+        return self.find_tier_configuration_request(request.id(), exclude=['configuration']).status()
+
+
+class AsyncWithTierConfigurationFacade(AsyncTierConfigurationManagementService, AsyncWithFacadeSupport):
+    client: AsyncConnectClient
+
+    async def find_tier_configuration(
+            self,
+            tier_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+    ) -> TierConfiguration:
+        fields = rql_select(select, exclude)
+
+        return self._wrap(TierConfiguration, await self._read(
+            TIER_CONFIGURATION,
+            tier_id,
+            lambda **kwargs: self._get(self.client.tiers[tier_id], fields, **kwargs),
+            fields,
+        ))
+
+    async def find_tier_configuration_request(
+            self,
+            request_id: str,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+    ) -> Request:
+        fields = rql_select(select, exclude)
+
+        return self._wrap(Request, await self._read(
+            TIER_CONFIGURATION_REQUEST,
+            request_id,
+            lambda **kwargs: self._get(self.client.ns(TIER).config_requests[request_id], fields, **kwargs),
+            fields,
+        ))
+
+    async def iter_tier_configurations(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> AsyncIterator[TierConfiguration]:
+        async for item in aiterate(
+            self.client.ns(TIER).configs.filter(*rql, **filters).select(*rql_select(select, exclude)),
+            page_size,
+            prefetch,
+            partial(self._call, operation='iter_tier_configurations'),
+        ):
+            yield self._wrap(TierConfiguration, item)
+
+    async def iter_tier_configuration_requests(
+            self,
+            *rql: Union[str, R],
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            select: Optional[List[str]] = None,
+            exclude: Optional[List[str]] = None,
+            **filters,
+    ) -> AsyncIterator[Request]:
+        async for item in aiterate(
+            self.client.ns(TIER).config_requests.filter(*rql, **filters).select(*rql_select(select, exclude)),
+            page_size,
+            prefetch,
+            partial(self._call, operation='iter_tier_configuration_requests'),
+        ):
+            yield self._wrap(Request, item)
+
+    async def iter_tier_configuration_request_views(
+            self,
+            *rql: Union[str, R],
+            parameters: Optional[Iterable[str]] = None,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            prefetch: bool = True,
+            **filters,
+    ) -> AsyncIterator[RequestView]:
+        parameters = list(parameters or [])
+        # the parameters are only transferred if any of them is kept.
+        fields = rql_select(exclude=None if parameters else VIEW_EXCLUDED_FIELDS)
+        async for item in aiterate(
+            self.client.ns(TIER).config_requests.filter(*rql, **filters).select(*fields),
+            page_size,
+            prefetch,
+            partial(self._call, operation='iter_tier_configuration_request_views'),
+        ):
+            yield RequestView.from_tier_configuration_request(item, parameters)
+
+    async def update_tier_configuration_request_parameters(
+            self,
+            request: Union[dict, Request],
+            parameters: List[Dict[str, Any]],
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+            diff: Optional[bool] = None,
+    ) -> Union[Any, Request]:
+        on_success = return_request if on_success is None else on_success
+        on_error = raise_error if on_error is None else on_error
+
+        if (self.diff_parameter_updates if diff is None else diff):
+            parameters = changed_parameters(request.tier_configuration().raw().get('params', []), parameters)
+            if not parameters:
+                return await resolve(on_success(request))
+
+        try:
+            updated = await self._put_tier_configuration_request_parameters(request.id(), parameters)
+
+            return await resolve(on_success(
+                request.with_tier_configuration(updated.tier_configuration()),
+            ))
+        except ClientError as e:
+            return await resolve(on_error(e))
+
+    async def _put_tier_configuration_request_parameters(
+            self,
+            request_id: str,
+            parameters: List[Dict[str, Any]],
+    ) -> Request:
+        response = await self._call(lambda: self.client.ns(TIER).config_requests[request_id].update(**self._payload({
+            "params": parameters,
+        })), kind=WRITE, operation='update_tier_configuration_request_parameters')
+        await self._refresh(TIER_CONFIGURATION_REQUEST, request_id, response)
+
+        updated = Request(response)
+        if self.cache is not None:
+            await self._invalidate((TIER_CONFIGURATION, updated.tier_configuration().id()))
+
+        return updated
+
+    async def approve_tier_configuration_request(
+            self,
+            request: Union[dict, Request],
+            template_id: str,
+            effective_date: Optional[str] = None,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> Union[Any, Request]:
+        template = {
+            ID: template_id,
+            "effective_date": effective_date,
+        }
+        payload = {TEMPLATE: {k: v for k, v in template.items() if v is not None}}
+
+        return await self._update_request_status(request, APPROVE, payload, on_error, on_success)
+
+    async def fail_tier_configuration_request(
+            self,
+            request: Union[dict, Request],
+            reason: str,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> Union[Any, Request]:
+        payload = {'reason': reason}
+
+        if on_success is None:
+            def on_success(req: Request):
+                return req.with_reason(reason)
+
+        return await self._update_request_status(request, FAIL, payload, on_error, on_success)
+
+    async def _update_request_status(
+            self,
+            request: Request,
+            status: str,
+            payload: Dict[str, Any] = None,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> Union[Any, Request]:
+        on_success = return_request if on_success is None else on_success
+        on_error = raise_error if on_error is None else on_error
+        try:
+            if await self._in_status(
+                request,
+                STATUSES.get(status),
+                partial(self._read_tier_configuration_request_status, request),
+            ):
+                return await resolve(on_success(request.with_status(STATUSES.get(status))))
+
+            await self._call(
+                lambda: self.client.ns(TIER).config_requests[request.id()](status).post(
+                    **self._payload(payload),
+                ),
+                idempotent=False,
+                kind=WRITE,
+                operation=f'{status}_tier_configuration_request',
+            )
+            if self.cache is not None:
+                await self._invalidate(
+                    (TIER_CONFIGURATION_REQUEST, request.id()),
+                    (TIER_CONFIGURATION, request.tier_configuration().id()),
+                )
+            return await resolve(on_success(
+                request.with_status(STATUSES.get(status)),
+            ))
+        except ClientError as e:
+            return await resolve(on_error(e))
+
+    async def inquire_tier_configuration_request(
+            self,
+            request: Union[dict, Request],
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> Union[Any, Request]:
+        return await self._update_request_status(
+            request,
+            INQUIRE,
+            on_error=on_error,
+            on_success=on_success,
+        )
+
+    async def approve_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            template_id: str,
+            effective_date: Optional[str] = None,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return await run_bulk_async(
+            lambda request: self.approve_tier_configuration_request(
+                request,
+                template_id,
+                effective_date,
+                on_error,
+                on_success,
+            ),
+            requests,
+            max_workers,
+        )
+
+    async def fail_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            reason: str,
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return await run_bulk_async(
+            lambda request: self.fail_tier_configuration_request(request, reason, on_error, on_success),
+            requests,
+            max_workers,
+        )
+
+    async def inquire_tier_configuration_requests(
+            self,
+            requests: Iterable[Union[dict, Request]],
+            max_workers: int = DEFAULT_MAX_WORKERS,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> BulkReport:
+        return await run_bulk_async(
+            lambda request: self.inquire_tier_configuration_request(request, on_error, on_success),
+            requests,
+            max_workers,
+        )
+
+    async def _read_tier_configuration_request_status(self, request: Request) -> str:
+        return (await self.find_tier_configuration_request(request.id(), exclude=['configuration'])).status()
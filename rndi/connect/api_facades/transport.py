@@ -0,0 +1,216 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, Optional
+
+from connect.client import AsyncConnectClient, ConnectClient
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class TransportSettings:
+    def __init__(
+            self,
+            pool_size: int = 10,
+            max_connections: Optional[int] = None,
+            keep_alive: bool = True,
+            keep_alive_expiry: float = 5.0,
+            connect_timeout: float = 10.0,
+            read_timeout: float = 180.0,
+            pool_timeout: Optional[float] = None,
+    ):
+        """
+        :param pool_size: int Max number of persistent connections per host.
+        :param max_connections: Optional[int] Hard limit of connections, callers wait for a free one when reached.
+        :param keep_alive: bool Reuse the connections between calls.
+        :param keep_alive_expiry: float Seconds to keep an idle connection (async transport).
+        :param connect_timeout: float Seconds to establish a connection.
+        :param read_timeout: float Seconds to wait for the response.
+        :param pool_timeout: Optional[float] Seconds to wait for a free connection (async transport).
+        """
+        if pool_size <= 0:
+            raise ValueError('`pool_size` must be a positive, non-zero integer.')
+        if max_connections is not None and max_connections <= 0:
+            raise ValueError('`max_connections` must be a positive, non-zero integer.')
+
+        self.pool_size = pool_size
+        self.max_connections = max_connections
+        self.keep_alive = keep_alive
+        self.keep_alive_expiry = keep_alive_expiry
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.pool_timeout = pool_timeout
+
+
+class PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.in_use = 0
+        self.max_in_use = 0
+        self.waits = 0
+
+    def checkout(self, exhausted: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            if exhausted:
+                self.waits += 1
+
+    def checkin(self) -> None:
+        with self._lock:
+            self.in_use = max(0, self.in_use - 1)
+
+    def connected(self) -> None:
+        with self._lock:
+            self.new_connections += 1
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'new_connections': self.new_connections,
+                'in_use': self.in_use,
+                'max_in_use': self.max_in_use,
+                'waits': self.waits,
+            }
+
+
+class _InstrumentedPool:
+    stats: PoolStats
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        # the pool queue is empty when every connection is checked out: the caller waits
+        # for a free connection (blocking pool) or opens an extra one (non blocking pool).
+        exhausted = self.pool is not None and self.pool.empty()
+        conn = super()._get_conn(timeout)
+        self.stats.checkout(exhausted)
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        self.stats.checkin()
+        super()._put_conn(conn)
+
+    def _new_conn(self) -> Any:
+        self.stats.connected()
+        return super()._new_conn()
+
+
+class _InstrumentedAdapter(HTTPAdapter):
+    def __init__(self, stats: PoolStats, **kwargs: Any):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': type('InstrumentedHTTPConnectionPool', (_InstrumentedPool, HTTPConnectionPool), {
+                'stats': self.stats,
+            }),
+            'https': type('InstrumentedHTTPSConnectionPool', (_InstrumentedPool, HTTPSConnectionPool), {
+                'stats': self.stats,
+            }),
+        }
+
+
+class HTTPTransport:
+    """
+    Shared requests session with the given pool settings, bound to every
+    thread of the ConnectClient (it creates one session per thread otherwise).
+    """
+
+    def __init__(self, settings: Optional[TransportSettings] = None):
+        self.settings = settings or TransportSettings()
+        self._stats = PoolStats()
+
+        pool_size = self.settings.pool_size
+        if self.settings.max_connections is not None:
+            pool_size = self.settings.max_connections
+
+        adapter = _InstrumentedAdapter(
+            self._stats,
+            pool_connections=4,
+            pool_maxsize=pool_size,
+            pool_block=self.settings.max_connections is not None,
+        )
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if not self.settings.keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+    @property
+    def timeout(self) -> tuple:
+        return self.settings.connect_timeout, self.settings.read_timeout
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Dict[str, int] The calls, new connections (handshakes), connections in use and pool waits.
+        """
+        return self._stats.as_dict()
+
+    def bind(self, client: ConnectClient) -> ConnectClient:
+        """
+        Makes the given client (in the current thread) use the shared session.
+
+        :param client: ConnectClient The client.
+        :return: ConnectClient The same client.
+        """
+        if client._session is not self.session:
+            client._session = self.session
+            client.timeout = self.timeout
+        return client
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class AsyncHTTPTransport:
+    """
+    Shared httpx client with the given pool limits for the AsyncConnectClient.
+    """
+
+    def __init__(self, settings: Optional[TransportSettings] = None):
+        self.settings = settings or TransportSettings()
+        self.transport = httpx.AsyncHTTPTransport(limits=httpx.Limits(
+            max_connections=self.settings.max_connections,
+            max_keepalive_connections=self.settings.pool_size if self.settings.keep_alive else 0,
+            keepalive_expiry=self.settings.keep_alive_expiry if self.settings.keep_alive else 0,
+        ))
+        self.session = httpx.AsyncClient(transport=self.transport)
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            self.settings.read_timeout,
+            connect=self.settings.connect_timeout,
+            pool=self.settings.pool_timeout,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Dict[str, int] The open connections and the connections in use.
+        """
+        connections = getattr(getattr(self.transport, '_pool', None), 'connections', [])
+        return {
+            'connections': len(connections),
+            'in_use': sum(1 for connection in connections if not connection.is_idle()),
+        }
+
+    def bind(self, client: AsyncConnectClient) -> AsyncConnectClient:
+        if client._session is not self.session:
+            client._session = self.session
+            client.timeout = self.timeout
+        return client
+
+    async def close(self) -> None:
+        await self.session.aclose()
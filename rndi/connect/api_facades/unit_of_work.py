@@ -0,0 +1,434 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from rndi.connect.business_objects.adapters import Request
+from rndi.connect.api_facades.bulk import DEFAULT_MAX_WORKERS
+from rndi.connect.api_facades.cache import ASSET_REQUEST, TIER_CONFIGURATION_REQUEST
+from rndi.connect.api_facades.contracts import OnError, OnSuccess
+from rndi.connect.api_facades.lazy import materialize
+
+
+class PlannedOperation:
+    def __init__(self, entity: str, operation: str, request: Request, arguments: Dict[str, Any], recorded: int = 1):
+        """
+        :param entity: str The request entity: asset_request or tier_configuration_request.
+        :param operation: str The facade method name.
+        :param request: Request The request.
+        :param arguments: Dict[str, Any] The facade method keyword arguments.
+        :param recorded: int The number of recorded calls collapsed into this operation.
+        """
+        self.entity = entity
+        self.operation = operation
+        self.request = request
+        self.arguments = arguments
+        self.recorded = recorded
+
+    @property
+    def request_id(self) -> str:
+        return self.request.id()
+
+    def __repr__(self) -> str:
+        return f'<PlannedOperation {self.operation} {self.request_id}>'
+
+
+class OperationResult:
+    def __init__(
+            self,
+            operation: PlannedOperation,
+            result: Any = None,
+            error: Optional[Exception] = None,
+            skipped: bool = False,
+    ):
+        """
+        :param operation: PlannedOperation The planned operation.
+        :param result: Any The facade method result.
+        :param error: Optional[Exception] The error of the operation, or of the operation it depends on.
+        :param skipped: bool True if not sent because the previous operation of the request failed.
+        """
+        self.operation = operation
+        self.result = result
+        self.error = error
+        self.skipped = skipped
+
+    @property
+    def request_id(self) -> str:
+        return self.operation.request_id
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        state = 'ok' if self.succeeded else ('skipped' if self.skipped else repr(self.error))
+        return f'<OperationResult {self.operation.operation} {self.request_id}: {state}>'
+
+
+class UnitOfWorkReport:
+    """
+    Per operation report of a unit of work flush, the operations are kept in
+    plan order: requests in first recorded order, parameter updates before
+    the transition of the same request.
+    """
+
+    def __init__(self, items: List[OperationResult]):
+        self.items = items
+
+    def __iter__(self) -> Iterator[OperationResult]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def succeeded(self) -> List[OperationResult]:
+        return [item for item in self.items if item.succeeded]
+
+    @property
+    def failed(self) -> List[OperationResult]:
+        return [item for item in self.items if not item.succeeded]
+
+    def of(self, request_id: str) -> List[OperationResult]:
+        """
+        :param request_id: str The request id.
+        :return: List[OperationResult] The results of the operations of the given request.
+        """
+        return [item for item in self.items if item.request_id == request_id]
+
+
+class _RequestPlan:
+    def __init__(self, entity: str, request: Request):
+        self.entity = entity
+        self.request = request
+        self.parameters: OrderedDict[Any, Dict[str, Any]] = OrderedDict()
+        self.update_options: Optional[Dict[str, Any]] = None
+        self.updates = 0
+        self.transition: Optional[Tuple[str, Dict[str, Any]]] = None
+        self.transitions = 0
+
+    def operations(self) -> List[PlannedOperation]:
+        operations = []
+        if self.updates:
+            operations.append(PlannedOperation(
+                self.entity,
+                f'update_{self.entity}_parameters',
+                self.request,
+                {'parameters': list(self.parameters.values()), **(self.update_options or {})},
+                self.updates,
+            ))
+        if self.transition is not None:
+            operation, arguments = self.transition
+            operations.append(PlannedOperation(self.entity, operation, self.request, arguments, self.transitions))
+        return operations
+
+
+class UnitOfWork:
+    """
+    Records the parameter updates and the status transitions of many requests
+    without sending them. On flush the recorded calls are collapsed per
+    request (parameter updates merged by parameter id, last write wins, and
+    only the last transition kept) and sent: the parameter update before the
+    transition of each request, the requests concurrently.
+    """
+
+    def __init__(self, api: Any, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        :param api: Union[ConnectOpenAPIFacade, AsyncConnectOpenAPIFacade] The facade.
+        :param max_workers: int The max number of requests flushed concurrently.
+        """
+        if max_workers <= 0:
+            raise ValueError('`max_workers` must be a positive, non-zero integer.')
+
+        # the plan already merges the parameter updates, the coalescer would only delay them.
+        self.api = copy.copy(api)
+        self.api.parameter_coalescer = None
+        self.max_workers = max_workers
+        self.report: Optional[UnitOfWorkReport] = None
+        self._requests: Dict[Tuple[str, str], _RequestPlan] = OrderedDict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def _plan_of(self, entity: str, request: Union[dict, Request]) -> _RequestPlan:
+        request = materialize(request, Request)
+        plan = self._requests.get((entity, request.id()))
+        if plan is None:
+            plan = self._requests[(entity, request.id())] = _RequestPlan(entity, request)
+        else:
+            plan.request = request
+        return plan
+
+    def _update(
+            self,
+            entity: str,
+            request: Union[dict, Request],
+            parameters: List[Dict[str, Any]],
+            **options: Any,
+    ) -> None:
+        plan = self._plan_of(entity, request)
+        options = {name: value for name, value in options.items() if value is not None}
+        # the merged update is sent once, so every recorded call must agree on its callbacks and diff mode.
+        if plan.update_options is not None and plan.update_options != options:
+            raise ValueError(
+                f'The parameter updates of `{plan.request.id()}` must use the same callbacks and diff mode.',
+            )
+        plan.update_options = options
+        plan.updates += 1
+        for parameter in parameters:
+            plan.parameters.setdefault(parameter.get('id'), {}).update(parameter)
+
+    def _transition(self, entity: str, request: Union[dict, Request], operation: str, **arguments: Any) -> None:
+        plan = self._plan_of(entity, request)
+        plan.transitions += 1
+        for callback in ('on_error', 'on_success'):
+            if arguments.get(callback) is None:
+                arguments.pop(callback, None)
+        plan.transition = (operation, arguments)
+
+    def update_asset_request_parameters(
+            self,
+            request: Union[dict, Request],
+            parameters: List[Dict[str, Any]],
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+            diff: Optional[bool] = None,
+    ) -> None:
+        self._update(ASSET_REQUEST, request, parameters, on_error=on_error, on_success=on_success, diff=diff)
+
+    def approve_asset_request(
+            self,
+            request: Union[dict, Request],
+            template_id: str,
+            activation_tile: Optional[str] = None,
+            effective_date: Optional[str] = None,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> None:
+        self._transition(
+            ASSET_REQUEST,
+            request,
+            'approve_asset_request',
+            template_id=template_id,
+            activation_tile=activation_tile,
+            effective_date=effective_date,
+            on_error=on_error,
+            on_success=on_success,
+        )
+
+    def fail_asset_request(
+            self,
+            request: Union[dict, Request],
+            reason: str,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> None:
+        self._transition(
+            ASSET_REQUEST,
+            request,
+            'fail_asset_request',
+            reason=reason,
+            on_error=on_error,
+            on_success=on_success,
+        )
+
+    def inquire_asset_request(
+            self,
+            request: Union[dict, Request],
+            template_id: str,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> None:
+        self._transition(
+            ASSET_REQUEST,
+            request,
+            'inquire_asset_request',
+            template_id=template_id,
+            on_error=on_error,
+            on_success=on_success,
+        )
+
+    def update_tier_configuration_request_parameters(
+            self,
+            request: Union[dict, Request],
+            parameters: List[Dict[str, Any]],
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+            diff: Optional[bool] = None,
+    ) -> None:
+        self._update(
+            TIER_CONFIGURATION_REQUEST,
+            request,
+            parameters,
+            on_error=on_error,
+            on_success=on_success,
+            diff=diff,
+        )
+
+    def approve_tier_configuration_request(
+            self,
+            request: Union[dict, Request],
+            template_id: str,
+            effective_date: Optional[str] = None,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> None:
+        self._transition(
+            TIER_CONFIGURATION_REQUEST,
+            request,
+            'approve_tier_configuration_request',
+            template_id=template_id,
+            effective_date=effective_date,
+            on_error=on_error,
+            on_success=on_success,
+        )
+
+    def fail_tier_configuration_request(
+            self,
+            request: Union[dict, Request],
+            reason: str,
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> None:
+        self._transition(
+            TIER_CONFIGURATION_REQUEST,
+            request,
+            'fail_tier_configuration_request',
+            reason=reason,
+            on_error=on_error,
+            on_success=on_success,
+        )
+
+    def inquire_tier_configuration_request(
+            self,
+            request: Union[dict, Request],
+            on_error: Optional[OnError] = None,
+            on_success: Optional[OnSuccess] = None,
+    ) -> None:
+        self._transition(
+            TIER_CONFIGURATION_REQUEST,
+            request,
+            'inquire_tier_configuration_request',
+            on_error=on_error,
+            on_success=on_success,
+        )
+
+    def plan(self) -> List[List[PlannedOperation]]:
+        """
+        :return: List[List[PlannedOperation]] The collapsed operations of each request, in send order.
+        """
+        return [plan.operations() for plan in self._requests.values()]
+
+    def discard(self) -> None:
+        """
+        Forgets every recorded call.
+        """
+        self._requests.clear()
+
+    def _send(self, operations: List[PlannedOperation]) -> List[OperationResult]:
+        results = []
+        for operation in operations:
+            if results and not results[-1].succeeded:
+                results.append(OperationResult(operation, error=results[-1].error, skipped=True))
+                continue
+            try:
+                result = getattr(self.api, operation.operation)(operation.request, **operation.arguments)
+                results.append(OperationResult(operation, result=result))
+            except Exception as e:
+                results.append(OperationResult(operation, error=e))
+        return results
+
+    def flush(self) -> UnitOfWorkReport:
+        """
+        Sends the collapsed plan and forgets the recorded calls.
+
+        :return: UnitOfWorkReport The per operation report.
+        """
+        plan = [operations for operations in self.plan() if operations]
+        self.discard()
+
+        results = self._pool().map(self._send, plan) if plan else []
+        self.report = UnitOfWorkReport([item for items in results for item in items])
+        return self.report
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # own senders, the callbacks may block on the facade pool; reused (with their sessions) between the flushes.
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='connect-unit-of-work')
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Stops the sender threads, a later flush starts new ones.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> UnitOfWork:
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        # nothing is sent if the recording block failed.
+        try:
+            if exc_type is None:
+                self.flush()
+            else:
+                self.discard()
+        finally:
+            self.close()
+
+
+class AsyncUnitOfWork(UnitOfWork):
+    """
+    Unit of work of the async facade, the requests are flushed as concurrent
+    tasks, at most max_workers at the same time.
+    """
+
+    async def _send(self, operations: List[PlannedOperation]) -> List[OperationResult]:
+        results = []
+        for operation in operations:
+            if results and not results[-1].succeeded:
+                results.append(OperationResult(operation, error=results[-1].error, skipped=True))
+                continue
+            try:
+                result = await getattr(self.api, operation.operation)(operation.request, **operation.arguments)
+                results.append(OperationResult(operation, result=result))
+            except Exception as e:
+                results.append(OperationResult(operation, error=e))
+        return results
+
+    async def flush(self) -> UnitOfWorkReport:
+        plan = [operations for operations in self.plan() if operations]
+        self.discard()
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def _run(operations: List[PlannedOperation]) -> List[OperationResult]:
+            async with semaphore:
+                return await self._send(operations)
+
+        results = await asyncio.gather(*[_run(operations) for operations in plan])
+        self.report = UnitOfWorkReport([item for items in results for item in items])
+        return self.report
+
+    def __enter__(self) -> UnitOfWork:
+        raise TypeError('Use `async with` with the async facade unit of work.')
+
+    async def __aenter__(self) -> AsyncUnitOfWork:
+        return self
+
+    async def __aexit__(self, exc_type: Any, *args: Any) -> None:
+        if exc_type is None:
+            await self.flush()
+        else:
+            self.discard()
@@ -0,0 +1,157 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import sys
+from typing import Any, Iterable, Optional, Tuple
+
+ASSET_REQUEST = 'asset_request'
+TIER_CONFIGURATION_REQUEST = 'tier_configuration_request'
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    # status, type and product ids repeat across the whole result set.
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _parameter_values(params: Optional[list], parameters: Iterable[str]) -> Tuple[Tuple[str, Any], ...]:
+    wanted = set(parameters)
+    if not wanted:
+        return ()
+    return tuple((param.get('id'), param.get('value')) for param in params or [] if param.get('id') in wanted)
+
+
+class RequestView:
+    """
+    Compact read-only projection of an Asset Request or a Tier Configuration
+    Request: id, status, type, asset id, product id, tier ids and the selected
+    parameter values. The full Request can be read back with to_request().
+    """
+
+    __slots__ = ('kind', 'id', 'status', 'type', 'asset_id', 'product_id', 'tier_ids', 'parameters')
+
+    def __init__(
+            self,
+            kind: str,
+            id: str,
+            status: Optional[str] = None,
+            type: Optional[str] = None,
+            asset_id: Optional[str] = None,
+            product_id: Optional[str] = None,
+            tier_ids: Tuple[Tuple[str, str], ...] = (),
+            parameters: Tuple[Tuple[str, Any], ...] = (),
+    ):
+        """
+        :param kind: str The request kind: asset_request or tier_configuration_request.
+        :param id: str The request id.
+        :param status: Optional[str] The request status.
+        :param type: Optional[str] The request type: purchase, change, suspend...
+        :param asset_id: Optional[str] The asset id (or the tier configuration id).
+        :param product_id: Optional[str] The product id.
+        :param tier_ids: Tuple[Tuple[str, str], ...] The (tier, account id) pairs: (('customer', 'TA-XXX'),).
+        :param parameters: Tuple[Tuple[str, Any], ...] The selected (parameter id, value) pairs.
+        """
+        setter = super().__setattr__
+        setter('kind', kind)
+        setter('id', id)
+        setter('status', _intern(status))
+        setter('type', _intern(type))
+        setter('asset_id', asset_id)
+        setter('product_id', _intern(product_id))
+        setter('tier_ids', tuple(tier_ids))
+        setter('parameters', tuple(parameters))
+
+    @classmethod
+    def from_asset_request(cls, raw: dict, parameters: Iterable[str] = ()) -> RequestView:
+        """
+        :param raw: dict The raw Asset Request.
+        :param parameters: Iterable[str] The ids of the parameters to keep.
+        :return: RequestView The projection.
+        """
+        asset = raw.get('asset') or {}
+        tiers = asset.get('tiers') or {}
+        return cls(
+            ASSET_REQUEST,
+            raw.get('id'),
+            raw.get('status'),
+            raw.get('type'),
+            asset.get('id'),
+            (asset.get('product') or {}).get('id'),
+            tuple((tier, account.get('id')) for tier, account in tiers.items() if account),
+            _parameter_values(asset.get('params'), parameters),
+        )
+
+    @classmethod
+    def from_tier_configuration_request(cls, raw: dict, parameters: Iterable[str] = ()) -> RequestView:
+        """
+        :param raw: dict The raw Tier Configuration Request.
+        :param parameters: Iterable[str] The ids of the parameters to keep.
+        :return: RequestView The projection.
+        """
+        configuration = raw.get('configuration') or {}
+        tiers = raw.get('tiers') or {}
+        return cls(
+            TIER_CONFIGURATION_REQUEST,
+            raw.get('id'),
+            raw.get('status'),
+            raw.get('type'),
+            configuration.get('id'),
+            (configuration.get('product') or {}).get('id'),
+            tuple((tier, account.get('id')) for tier, account in tiers.items() if account),
+            _parameter_values(raw.get('params'), parameters),
+        )
+
+    def tier_id(self, tier: str) -> Optional[str]:
+        """
+        :param tier: str The tier: customer, tier1 or tier2.
+        :return: Optional[str] The tier account id.
+        """
+        for name, account_id in self.tier_ids:
+            if name == tier:
+                return account_id
+        return None
+
+    def parameter(self, parameter_id: str, default: Any = None) -> Any:
+        """
+        :param parameter_id: str The parameter id.
+        :param default: Any The value returned if the parameter was not selected.
+        :return: Any The parameter value.
+        """
+        for name, value in self.parameters:
+            if name == parameter_id:
+                return value
+        return default
+
+    def to_request(self, api: Any) -> Any:
+        """
+        Reads the full Request back through the given facade.
+
+        :param api: Union[ConnectOpenAPIFacade, AsyncConnectOpenAPIFacade] The facade.
+        :return: Request The full Request (the coroutine on the async facade).
+        """
+        if self.kind == TIER_CONFIGURATION_REQUEST:
+            return api.find_tier_configuration_request(self.id)
+        return api.find_asset_request(self.id)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{type(self).__name__} is read-only.')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is read-only.')
+
+    def __reduce__(self) -> tuple:
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, RequestView):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self) -> int:
+        return hash((self.kind, self.id))
+
+    def __repr__(self) -> str:
+        return f'<RequestView {self.id} {self.status}>'
@@ -5,7 +5,8 @@ from types import MethodType
 from typing import Dict, Optional
 from urllib.parse import parse_qs
 
-from connect.client import ConnectClient
+from connect.client import AsyncConnectClient, ConnectClient
+import httpx
 import pytest
 import requests
 import responses
@@ -143,6 +144,32 @@ def sync_client_factory():
     return _create_sync_client
 
 
+@pytest.fixture
+def async_client_factory():
+    def _create_async_client(connect_responses):
+        response_iterator = iter(connect_responses)
+
+        async def _execute_http_call(self, method, url, kwargs):
+            mock_kwargs = _mock_kwargs_generator(response_iterator, url)
+            if isinstance(mock_kwargs.get('body'), Exception):
+                raise mock_kwargs['body']
+
+            self.response = httpx.Response(
+                mock_kwargs.get('status', 200),
+                headers=mock_kwargs.get('headers'),
+                json=mock_kwargs.get('json'),
+                request=httpx.Request(method, url),
+            )
+            if self.response.status_code >= 400:
+                self.response.raise_for_status()
+
+        client = AsyncConnectClient('Key', use_specs=False)
+        client._execute_http_call = MethodType(_execute_http_call, client)
+        return client
+
+    return _create_async_client
+
+
 @pytest.fixture
 def config():
     def _config(configuration: Optional[Dict[str, str]] = None) -> Dict[str, str]:
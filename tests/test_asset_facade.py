@@ -1,9 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
 import os
+import time
 
 import pytest
-from connect.client import ClientError
+from connect.client import ClientError, ConnectClient
+from loadtest.stub_server import StubServer
 from rndi.connect.business_objects.adapters import Asset, Request
+from rndi.connect.api_facades.cache import ASSET, EntityCache
+from rndi.connect.api_facades.coalescing import ParameterUpdateCoalescer
+from rndi.connect.api_facades.codec import StdlibJSONCodec
 from rndi.connect.api_facades.facade import ConnectOpenAPIFacade
+from rndi.connect.api_facades.lazy import LazyEntity
+from rndi.connect.api_facades.metrics import Metrics
+from rndi.connect.api_facades.outbox import SQLiteOutbox
+from rndi.connect.api_facades.rate_limit import RateLimiter, TokenBucket
+from rndi.connect.api_facades.retry import RetryPolicy
+from rndi.connect.api_facades.scheduler import CRITICAL, OperationScheduler
+from rndi.connect.api_facades.transport import HTTPTransport
 
 BAD_REQUEST_400 = "400 Bad Request"
 ASSET_REQUEST_FILE = '/request_asset.json'
@@ -244,3 +258,657 @@ def test_asset_helper_should_raise_exception_on_updating_request_asset_params(
             'id': 'CAT_SUBSCRIPTION_ID',
             'value': 'AS-8790-0160-2196',
         }])
+
+
+def test_asset_helper_should_retrieve_a_cached_asset_without_network_round_trip(
+        sync_client_factory,
+        response_factory,
+):
+    asset = Asset()
+    asset.with_id('AS-9091-4850-9712')
+
+    client = sync_client_factory([
+        response_factory(value=asset.raw(), status=200),
+    ])
+
+    cache = EntityCache()
+    api = ConnectOpenAPIFacade(client, cache=cache)
+
+    assert api.find_asset('AS-9091-4850-9712').id() == 'AS-9091-4850-9712'
+    assert api.find_asset('AS-9091-4850-9712').id() == 'AS-9091-4850-9712'
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_asset_helper_should_invalidate_the_cached_asset_request_on_approve(
+        sync_client_factory,
+        response_factory,
+):
+    asset = Asset()
+    asset.with_id('AS-8027-7606-7082')
+
+    request = Request()
+    request.with_id('PR-8027-7606-7082-001')
+    request.with_status('pending')
+    request.with_asset(asset)
+
+    approved = Request()
+    approved.with_id('PR-8027-7606-7082-001')
+    approved.with_status('approved')
+    approved.with_asset(asset)
+
+    client = sync_client_factory([
+        response_factory(value=request.raw(), status=200),
+        response_factory(value=approved.raw(), status=200),
+        response_factory(value=approved.raw(), status=200),
+    ])
+
+    cache = EntityCache()
+    api = ConnectOpenAPIFacade(client, cache=cache)
+
+    request = api.find_asset_request('PR-8027-7606-7082-001')
+    api.approve_asset_request(request, 'TL-662-440-096')
+
+    assert api.find_asset_request('PR-8027-7606-7082-001').status() == 'approved'
+    assert cache.stats.invalidations == 1
+
+
+def test_asset_helper_should_refresh_the_cached_asset_request_on_parameters_update(
+        sync_client_factory,
+        response_factory,
+        load_json,
+):
+    after_update = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+    asset = after_update.asset()
+    asset.with_param('CAT_SUBSCRIPTION_ID', 'AS-8790-0160-2196')
+    after_update.with_asset(asset)
+
+    client = sync_client_factory([
+        response_factory(value=after_update.raw(), status=200),
+    ])
+
+    api = ConnectOpenAPIFacade(client, cache=EntityCache())
+
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+    api.update_asset_request_parameters(request, [{
+        'id': 'CAT_SUBSCRIPTION_ID',
+        'value': 'AS-8790-0160-2196',
+    }])
+
+    cached = api.find_asset_request(request.id())
+
+    assert cached.asset().param('CAT_SUBSCRIPTION_ID', 'value') == 'AS-8790-0160-2196'
+
+
+def test_asset_helper_should_approve_many_asset_requests_concurrently(response):
+    client = ConnectClient('Key', use_specs=False)
+
+    requests = []
+    for i in range(1, 5):
+        request = Request()
+        request.with_id(f'PR-8027-7606-7082-00{i}')
+        request.with_status('pending')
+        request.with_asset(Asset())
+        requests.append(request)
+
+        response.add(
+            'POST',
+            f'{client.endpoint}/requests/PR-8027-7606-7082-00{i}/approve',
+            json=request.raw(),
+            status=200 if i != 3 else 400,
+        )
+
+    approved = []
+    report = ConnectOpenAPIFacade(client).approve_asset_requests(
+        requests,
+        'TL-662-440-096',
+        max_workers=4,
+        on_success=lambda req: approved.append(req.id()) or req,
+    )
+
+    assert [item.request_id for item in report] == [request.id() for request in requests]
+    assert len(report.succeeded) == 3
+    assert sorted(approved) == ['PR-8027-7606-7082-001', 'PR-8027-7606-7082-002', 'PR-8027-7606-7082-004']
+    assert [item.request_id for item in report.failed] == ['PR-8027-7606-7082-003']
+    assert isinstance(report.failed[0].error, ClientError)
+    assert report.failed[0].error.status_code == 400
+
+
+def test_asset_helper_should_fail_many_asset_requests_using_the_on_error_callback(response):
+    client = ConnectClient('Key', use_specs=False)
+
+    request = Request()
+    request.with_id('PR-8027-7606-7082-001')
+    request.with_asset(Asset())
+
+    response.add(
+        'POST',
+        f'{client.endpoint}/requests/PR-8027-7606-7082-001/fail',
+        json={'error_code': 'REQ_005', 'errors': ['Missed fields: reason.']},
+        status=400,
+    )
+
+    report = ConnectOpenAPIFacade(client).fail_asset_requests(
+        [request],
+        'Not going to work',
+        on_error=lambda error: error.error_code,
+    )
+
+    assert report.items[0].succeeded
+    assert report.items[0].result == 'REQ_005'
+
+
+def test_asset_helper_should_coalesce_concurrent_reads_of_the_same_asset(response):
+    client = ConnectClient('Key', use_specs=False)
+    api = ConnectOpenAPIFacade(client)
+
+    asset = Asset()
+    asset.with_id('AS-9091-4850-9712')
+
+    def callback(_):
+        # hold the in-flight call until every other reader is waiting for it.
+        deadline = time.monotonic() + 5
+        while api.single_flight._calls[('asset', 'AS-9091-4850-9712')].waiters < 4:
+            if time.monotonic() > deadline:
+                break
+        return 200, {}, json.dumps(asset.raw())
+
+    response.add_callback(
+        'GET',
+        f'{client.endpoint}/assets/AS-9091-4850-9712',
+        callback=callback,
+        content_type='application/json',
+    )
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        assets = list(executor.map(lambda _: api.find_asset('AS-9091-4850-9712'), range(5)))
+
+    assert len(response.calls) == 1
+    assert [asset.id() for asset in assets] == ['AS-9091-4850-9712'] * 5
+
+
+def test_asset_helper_should_iterate_asset_requests_lazily(sync_client_factory, response_factory):
+    pages = []
+    for ids in (['PR-0000-0000-0000-001', 'PR-0000-0000-0000-002'], ['PR-0000-0000-0000-003']):
+        page = []
+        for request_id in ids:
+            request = Request()
+            request.with_id(request_id)
+            request.with_status('pending')
+            page.append(request.raw())
+        pages.append(response_factory(value=page))
+
+    client = sync_client_factory(pages)
+
+    requests = ConnectOpenAPIFacade(client).iter_asset_requests(
+        status='pending',
+        page_size=2,
+        prefetch=False,
+    )
+
+    assert [request.id() for request in requests] == [
+        'PR-0000-0000-0000-001',
+        'PR-0000-0000-0000-002',
+        'PR-0000-0000-0000-003',
+    ]
+
+
+def test_asset_helper_should_retrieve_a_projected_asset_request(sync_client_factory, response_factory):
+    request = Request()
+    request.with_id('PR-9091-4850-9712-001')
+    request.with_status('pending')
+
+    client = sync_client_factory([
+        response_factory(value=request.raw(), select=['id', 'status', '-asset.params'], status=200),
+    ])
+
+    request = ConnectOpenAPIFacade(client).find_asset_request(
+        'PR-9091-4850-9712-001',
+        select=['id', 'status'],
+        exclude=['asset.params'],
+    )
+
+    assert request.status() == 'pending'
+
+
+def test_asset_helper_should_not_cache_projected_assets(sync_client_factory, response_factory):
+    asset = Asset()
+    asset.with_id('AS-9091-4850-9712')
+
+    client = sync_client_factory([
+        response_factory(value=asset.raw(), select=['-params'], status=200),
+        response_factory(value=asset.raw(), status=200),
+    ])
+
+    cache = EntityCache()
+    api = ConnectOpenAPIFacade(client, cache=cache)
+
+    api.find_asset('AS-9091-4850-9712', exclude=['params'])
+    api.find_asset('AS-9091-4850-9712')
+
+    assert cache.stats.hits == 0
+    assert len(cache) == 1
+
+
+def test_asset_helper_should_skip_the_parameters_update_when_nothing_changes(
+        sync_client_factory,
+        load_json,
+):
+    client = sync_client_factory([])
+
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+
+    updated = ConnectOpenAPIFacade(client).update_asset_request_parameters(
+        request,
+        [{'id': 'ORDER_TYPE', 'value': 'RANDOM'}],
+        on_success=lambda req: req.id(),
+        diff=True,
+    )
+
+    assert updated == request.id()
+
+
+def test_asset_helper_should_send_only_the_changed_parameters(response, load_json):
+    client = ConnectClient('Key', use_specs=False)
+
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+
+    after_update = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+    asset = after_update.asset()
+    asset.with_param('CAT_SUBSCRIPTION_ID', 'AS-8790-0160-2196')
+    after_update.with_asset(asset)
+
+    response.add('PUT', f'{client.endpoint}/requests/{request.id()}', json=after_update.raw())
+
+    request = ConnectOpenAPIFacade(client, diff_parameter_updates=True).update_asset_request_parameters(request, [
+        {'id': 'ORDER_TYPE', 'value': 'RANDOM'},
+        {'id': 'CAT_SUBSCRIPTION_ID', 'value': 'AS-8790-0160-2196'},
+    ])
+
+    assert json.loads(response.calls[0].request.body) == {
+        'asset': {'params': [{'id': 'CAT_SUBSCRIPTION_ID', 'value': 'AS-8790-0160-2196'}]},
+    }
+    assert request.asset().param('CAT_SUBSCRIPTION_ID', 'value') == 'AS-8790-0160-2196'
+
+
+def test_asset_helper_should_coalesce_parameter_updates_until_the_approval(response, load_json):
+    client = ConnectClient('Key', use_specs=False)
+
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+
+    response.add('PUT', f'{client.endpoint}/requests/{request.id()}', json=request.raw())
+    response.add('POST', f'{client.endpoint}/requests/{request.id()}/approve', json=request.raw())
+
+    api = ConnectOpenAPIFacade(client, parameter_coalescer=ParameterUpdateCoalescer(window=None))
+
+    first = api.update_asset_request_parameters(request, [{'id': 'PARAM_A', 'value': 'A'}], on_success=lambda r: 1)
+    second = api.update_asset_request_parameters(request, [{'id': 'PARAM_B', 'value': 'B'}], on_success=lambda r: 2)
+
+    assert len(response.calls) == 0
+
+    api.approve_asset_request(request, 'TL-662-440-096')
+
+    assert [call.request.method for call in response.calls] == ['PUT', 'POST']
+    assert json.loads(response.calls[0].request.body) == {
+        'asset': {'params': [{'id': 'PARAM_A', 'value': 'A'}, {'id': 'PARAM_B', 'value': 'B'}]},
+    }
+    assert first.result() == 1
+    assert second.result() == 2
+
+
+def test_asset_helper_should_diff_the_parameters_against_the_buffered_updates(response, load_json):
+    client = ConnectClient('Key', use_specs=False)
+
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+
+    response.add('PUT', f'{client.endpoint}/requests/{request.id()}', json=request.raw())
+
+    api = ConnectOpenAPIFacade(client, parameter_coalescer=ParameterUpdateCoalescer(window=None))
+
+    api.update_asset_request_parameters(request, [{'id': 'ORDER_TYPE', 'value': 'OTHER'}], diff=True)
+    # back to the server value, it must overwrite the buffered one.
+    api.update_asset_request_parameters(request, [{'id': 'ORDER_TYPE', 'value': 'RANDOM'}], diff=True)
+    api.parameter_coalescer.flush()
+
+    assert json.loads(response.calls[0].request.body) == {
+        'asset': {'params': [{'id': 'ORDER_TYPE', 'value': 'RANDOM'}]},
+    }
+
+
+def test_asset_helper_should_retry_throttled_reads(response):
+    client = ConnectClient('Key', use_specs=False, max_retries=0)
+
+    asset = Asset()
+    asset.with_id('AS-9091-4850-9712')
+
+    response.add('GET', f'{client.endpoint}/assets/AS-9091-4850-9712', status=429, headers={'Retry-After': '0'})
+    response.add('GET', f'{client.endpoint}/assets/AS-9091-4850-9712', json=asset.raw())
+
+    api = ConnectOpenAPIFacade(client, retry_policy=RetryPolicy(max_attempts=3))
+
+    assert api.find_asset('AS-9091-4850-9712').id() == 'AS-9091-4850-9712'
+    assert len(response.calls) == 2
+
+
+def test_asset_helper_should_not_retry_failed_transitions(response, load_json):
+    client = ConnectClient('Key', use_specs=False, max_retries=0)
+
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+
+    response.add('POST', f'{client.endpoint}/requests/{request.id()}/approve', status=503)
+
+    api = ConnectOpenAPIFacade(client, retry_policy=RetryPolicy(max_attempts=3, sleep=lambda s: None))
+
+    with pytest.raises(ClientError):
+        api.approve_asset_request(request, 'TL-662-440-096')
+
+    assert len(response.calls) == 1
+
+
+def test_asset_helper_should_take_a_token_of_the_matching_budget_before_each_call(
+        sync_client_factory,
+        response_factory,
+        load_json,
+):
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+
+    client = sync_client_factory([
+        response_factory(value=request.raw(), status=200),
+        response_factory(value=request.raw(), status=200),
+    ])
+
+    read, write = TokenBucket(rate=100), TokenBucket(rate=100)
+    api = ConnectOpenAPIFacade(client, rate_limiter=RateLimiter(read=read, write=write))
+
+    api.find_asset_request(request.id())
+    api.approve_asset_request(request, 'TL-662-440-096')
+
+    assert read._tokens == pytest.approx(99, abs=0.1)
+    assert write._tokens == pytest.approx(99, abs=0.1)
+
+
+def test_asset_helper_should_measure_each_connect_call(sync_client_factory, response_factory, load_json):
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+    exception = ClientError(message=BAD_REQUEST_400, status_code=400, error_code="VAL_001", errors=["Bad request."])
+
+    client = sync_client_factory([
+        response_factory(value=request.raw(), status=200),
+        response_factory(exception=exception, status=exception.status_code),
+    ])
+
+    metrics = Metrics()
+    api = ConnectOpenAPIFacade(client, metrics=metrics)
+
+    api.find_asset_request(request.id())
+    api.approve_asset_request(request, 'TL-662-440-096', on_error=lambda e: e)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot['find_asset_request']['successes'] == 1
+    assert snapshot['find_asset_request']['response_bytes'] > 0
+    assert snapshot['approve_asset_request']['calls'] == 1
+    assert snapshot['approve_asset_request']['errors'] == {'400': 1}
+
+
+def test_asset_helper_should_skip_the_approval_of_an_already_approved_request(sync_client_factory):
+    client = sync_client_factory([])
+
+    request = Request()
+    request.with_id('PR-8027-7606-7082-001')
+    request.with_status('approved')
+
+    approved = ConnectOpenAPIFacade(client, transition_guard='known').approve_asset_request(request, 'TL-662-440-096')
+
+    assert approved.status() == 'approved'
+
+
+def test_asset_helper_should_re_read_the_status_before_failing_with_a_strict_guard(
+        sync_client_factory,
+        response_factory,
+):
+    current = Request()
+    current.with_id('PR-8027-7606-7082-001')
+    current.with_status('failed')
+
+    client = sync_client_factory([
+        response_factory(value=current.raw(), status=200, select=['-asset']),
+    ])
+
+    request = Request()
+    request.with_id('PR-8027-7606-7082-001')
+    request.with_status('pending')
+
+    failed = ConnectOpenAPIFacade(client, transition_guard='strict').fail_asset_request(request, 'Failure reason.')
+
+    assert failed.status() == 'failed'
+
+
+def test_asset_helper_should_reject_unknown_transition_guards(sync_client_factory):
+    with pytest.raises(ValueError):
+        ConnectOpenAPIFacade(sync_client_factory([]), transition_guard='always')
+
+
+def test_asset_helper_should_record_the_transitions_in_the_outbox_until_drained(response, load_json, tmp_path):
+    client = ConnectClient('Key', use_specs=False, max_retries=0)
+
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+
+    response.add('PUT', f'{client.endpoint}/requests/{request.id()}', json=request.raw())
+    response.add('POST', f'{client.endpoint}/requests/{request.id()}/approve', json=request.raw())
+
+    api = ConnectOpenAPIFacade(client, outbox=SQLiteOutbox(str(tmp_path / 'outbox.sqlite')))
+
+    api.update_asset_request_parameters(request, [{'id': 'ORDER_TYPE', 'value': 'RANDOM'}])
+    api.approve_asset_request(request, 'TL-662-440-096')
+
+    assert len(response.calls) == 0
+
+    assert api.drain_outbox() == 2
+    assert [call.request.method for call in response.calls] == ['PUT', 'POST']
+    assert json.loads(response.calls[1].request.body) == {'template_id': 'TL-662-440-096'}
+
+
+def test_asset_helper_should_reject_callbacks_in_outbox_mode(sync_client_factory, load_json, tmp_path):
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+    outbox = SQLiteOutbox(str(tmp_path / 'outbox.sqlite'))
+    api = ConnectOpenAPIFacade(sync_client_factory([]), outbox=outbox)
+
+    with pytest.raises(ValueError):
+        api.approve_asset_request(request, 'TL-662-440-096', on_success=lambda r: r)
+
+    assert outbox.counts() == {}
+
+
+def test_asset_helper_should_defer_the_business_object_in_lazy_mode(sync_client_factory, response_factory, load_json):
+    raw = load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE)
+
+    client = sync_client_factory([
+        response_factory(value=raw, status=200),
+        response_factory(value=raw, status=200),
+    ])
+
+    api = ConnectOpenAPIFacade(client, lazy=True)
+    request = api.find_asset_request(raw['id'])
+
+    assert isinstance(request, LazyEntity)
+    assert request.id() == raw['id']
+    assert request.field('asset', 'id') == raw['asset']['id']
+    assert not request.materialized
+
+    assert request.asset().id() == raw['asset']['id']
+    assert request.materialized
+
+    approved = api.approve_asset_request(request, 'TL-662-440-096')
+
+    assert approved.status() == 'approved'
+
+
+def test_asset_helper_should_encode_and_decode_through_the_codec(response, load_json):
+    client = ConnectClient('Key', use_specs=False, max_retries=0)
+
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+
+    response.add('GET', f'{client.endpoint}/requests/{request.id()}', json=request.raw())
+    response.add('POST', f'{client.endpoint}/requests/{request.id()}/approve', json=request.raw())
+
+    api = ConnectOpenAPIFacade(client, codec=StdlibJSONCodec())
+
+    found = api.find_asset_request(request.id())
+    approved = api.approve_asset_request(found, 'TL-662-440-096')
+
+    assert found.id() == request.id()
+    assert approved.status() == 'approved'
+    assert response.calls[1].request.body == b'{"template_id":"TL-662-440-096"}'
+
+
+def test_asset_helper_should_iterate_asset_request_views(sync_client_factory, response_factory, load_json):
+    raw = load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE)
+
+    client = sync_client_factory([
+        response_factory(value=[raw]),
+    ])
+
+    views = list(ConnectOpenAPIFacade(client).iter_asset_request_views(
+        status='pending',
+        parameters=['CATEGORIES'],
+        page_size=2,
+        prefetch=False,
+    ))
+
+    assert len(views) == 1
+    assert views[0].id == raw['id']
+    assert views[0].product_id == raw['asset']['product']['id']
+    assert views[0].parameter('CATEGORIES') == ''
+
+
+def test_asset_helper_should_fetch_the_asset_request_context_concurrently(response, load_json):
+    client = ConnectClient('Key', use_specs=False, max_retries=0)
+
+    raw = load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE)
+    raw['asset']['tiers']['tier2'] = {'id': 'TA-0000-0000-0002'}
+    tier_configuration = {'id': 'TC-000-000-000', 'tier_level': 1}
+
+    response.add('GET', f"{client.endpoint}/requests/{raw['id']}", json=raw)
+    response.add('GET', f"{client.endpoint}/assets/{raw['asset']['id']}", json=raw['asset'])
+    response.add('GET', f'{client.endpoint}/tier/configs', json=[tier_configuration])
+    response.add('GET', f'{client.endpoint}/tier/configs', json=[tier_configuration])
+
+    context = ConnectOpenAPIFacade(client).find_asset_request_context(raw['id'])
+
+    assert context.request.id() == raw['id']
+    assert context.asset.id() == raw['asset']['id']
+    assert context.tier1.id() == 'TC-000-000-000'
+    assert context.tier2.id() == 'TC-000-000-000'
+    assert len(response.calls) == 4
+
+
+def test_asset_helper_should_fetch_the_request_contexts_on_one_long_lived_pool(response, load_json):
+    client = ConnectClient('Key', use_specs=False, max_retries=0)
+
+    raw = load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE)
+
+    response.add('GET', f"{client.endpoint}/requests/{raw['id']}", json=raw)
+    response.add('GET', f"{client.endpoint}/assets/{raw['asset']['id']}", json=raw['asset'])
+    response.add('GET', f'{client.endpoint}/tier/configs', json=[{'id': 'TC-000-000-000', 'tier_level': 1}])
+
+    api = ConnectOpenAPIFacade(client, cache=EntityCache(ttl=60))
+    first = api.find_asset_request_context(raw['id'])
+    pool = api._fan_out_pool()
+    second = api.find_asset_request_context(raw['id'])
+
+    assert first.tier2 is None
+    assert second.tier1.id() == 'TC-000-000-000'
+    assert api._fan_out_pool() is pool
+
+
+def test_asset_helper_should_bind_the_transport_in_the_prefetch_threads():
+    transport = HTTPTransport()
+    api = ConnectOpenAPIFacade(ConnectClient('Key', use_specs=False, max_retries=0), transport=transport)
+
+    call = api._page_call('iter_assets')
+    session = api._fan_out_pool().submit(call, lambda: api._client._session).result(5)
+
+    assert session is transport.session
+
+
+def test_asset_helper_should_not_cache_a_read_that_raced_with_an_invalidation():
+    api = ConnectOpenAPIFacade(ConnectClient('Key', use_specs=False), cache=EntityCache())
+
+    def fetch():
+        # a write lands while the read is in flight, the fetched value is stale.
+        api._invalidate((ASSET, 'AS-9091-4850-9712'))
+        return {'id': 'AS-9091-4850-9712', 'status': 'processing'}
+
+    assert api._read(ASSET, 'AS-9091-4850-9712', fetch)['status'] == 'processing'
+    assert api.cache.get(ASSET, 'AS-9091-4850-9712') is None
+
+    assert api._read(ASSET, 'AS-9091-4850-9712', lambda: {'id': 'AS-9091-4850-9712', 'status': 'active'})
+    assert api.cache.get(ASSET, 'AS-9091-4850-9712')['status'] == 'active'
+
+
+def test_asset_helper_should_revalidate_the_expired_entities_with_conditional_requests():
+    stub = StubServer()
+    stub.start()
+    try:
+        client = ConnectClient('Key', endpoint=stub.endpoint, use_specs=False, max_retries=0)
+        api = ConnectOpenAPIFacade(client, cache=EntityCache(ttl=0, revalidate=True))
+
+        first = api.find_asset_request('PR-0000-0000-0000-001')
+        second = api.find_asset_request('PR-0000-0000-0000-001')
+
+        assert first.raw() == second.raw()
+        assert stub.not_modified == 1
+        assert api.cache.stats.revalidations == 1
+    finally:
+        stub.shutdown()
+        stub.server_close()
+
+
+def test_asset_helper_should_send_the_submitted_operations_through_the_scheduler(sync_client_factory):
+    request = Request()
+    request.with_id('PR-8027-7606-7082-001')
+    request.with_status('approved')
+
+    with OperationScheduler(max_workers=2) as scheduler:
+        api = ConnectOpenAPIFacade(sync_client_factory([]), transition_guard='known', scheduler=scheduler)
+        future = api.submit('approve_asset_request', request, 'TL-662-440-096', priority=CRITICAL, deadline=5)
+
+        assert future.result(5).status() == 'approved'
+
+    assert scheduler.stats()[CRITICAL]['completed'] == 1
+
+
+def test_asset_helper_should_not_submit_operations_without_scheduler(sync_client_factory):
+    with pytest.raises(ValueError):
+        ConnectOpenAPIFacade(sync_client_factory([])).submit('approve_asset_request', Request(), 'TL-662-440-096')
+
+
+def test_asset_helper_should_flush_the_unit_of_work_on_exit(response, load_json):
+    client = ConnectClient('Key', use_specs=False)
+
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+
+    response.add('PUT', f'{client.endpoint}/requests/{request.id()}', json=request.raw())
+    response.add('POST', f'{client.endpoint}/requests/{request.id()}/approve', json=request.raw())
+
+    with ConnectOpenAPIFacade(client).unit_of_work() as uow:
+        uow.update_asset_request_parameters(request, [{'id': 'PARAM_A', 'value': 'A'}])
+        uow.fail_asset_request(request, 'Out of stock.')
+        uow.update_asset_request_parameters(request, [{'id': 'PARAM_B', 'value': 'B'}])
+        uow.approve_asset_request(request, 'TL-662-440-096')
+
+        assert len(response.calls) == 0
+
+    assert [call.request.method for call in response.calls] == ['PUT', 'POST']
+    assert json.loads(response.calls[0].request.body) == {
+        'asset': {'params': [{'id': 'PARAM_A', 'value': 'A'}, {'id': 'PARAM_B', 'value': 'B'}]},
+    }
+    assert [item.operation.operation for item in uow.report.succeeded] == [
+        'update_asset_request_parameters',
+        'approve_asset_request',
+    ]
+
+
+def test_asset_helper_should_warn_when_the_client_retries_on_its_own():
+    with pytest.warns(RuntimeWarning):
+        ConnectOpenAPIFacade(ConnectClient('Key', use_specs=False), retry_policy=RetryPolicy())
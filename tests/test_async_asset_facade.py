@@ -0,0 +1,265 @@
+import asyncio
+import os
+import threading
+
+import pytest
+from connect.client import ClientError
+from rndi.connect.business_objects.adapters import Asset, Request
+from rndi.connect.api_facades.cache import SQLiteEntityCache
+from rndi.connect.api_facades.facade import AsyncConnectOpenAPIFacade
+
+BAD_REQUEST_400 = "400 Bad Request"
+ASSET_REQUEST_FILE = '/request_asset.json'
+
+
+def test_async_asset_helper_should_retrieve_an_asset_by_id(async_client_factory, response_factory):
+    asset = Asset()
+    asset.with_id('AS-9091-4850-9712')
+
+    client = async_client_factory([
+        response_factory(value=asset.raw(), status=200),
+    ])
+
+    asset = asyncio.run(AsyncConnectOpenAPIFacade(client).find_asset('AS-9091-4850-9712'))
+
+    assert isinstance(asset, Asset)
+    assert asset.id() == 'AS-9091-4850-9712'
+
+
+def test_async_asset_helper_should_use_the_sqlite_cache_off_the_event_loop(
+        async_client_factory,
+        response_factory,
+        tmp_path,
+):
+    threads = []
+
+    class RecordingCache(SQLiteEntityCache):
+        def get(self, entity, entity_id):
+            threads.append(threading.current_thread())
+            return super().get(entity, entity_id)
+
+    asset = Asset()
+    asset.with_id('AS-9091-4850-9712')
+
+    client = async_client_factory([
+        response_factory(value=asset.raw(), status=200),
+    ])
+    api = AsyncConnectOpenAPIFacade(client, cache=RecordingCache(str(tmp_path / 'cache.sqlite')))
+
+    async def find_twice():
+        first = await api.find_asset('AS-9091-4850-9712')
+        second = await api.find_asset('AS-9091-4850-9712')
+        return first, second
+
+    first, second = asyncio.run(find_twice())
+
+    assert first.raw() == second.raw()
+    assert api.cache.stats.hits == 1
+    assert len(threads) == 2
+    assert threading.current_thread() not in threads
+
+
+def test_async_asset_helper_should_retrieve_an_asset_request_by_id(async_client_factory, response_factory):
+    request = Request()
+    request.with_id('PR-9091-4850-9712-001')
+    request.with_status('pending')
+
+    client = async_client_factory([
+        response_factory(value=request.raw(), status=200),
+    ])
+
+    request = asyncio.run(AsyncConnectOpenAPIFacade(client).find_asset_request('PR-9091-4850-9712-001'))
+
+    assert isinstance(request, Request)
+    assert request.id() == 'PR-9091-4850-9712-001'
+
+
+def test_async_asset_helper_should_approve_an_asset_request(async_client_factory, response_factory):
+    request = Request()
+    request.with_id('PR-8027-7606-7082-001')
+    request.with_status('pending')
+    request.with_asset(Asset())
+
+    client = async_client_factory([
+        response_factory(value=request.raw(), status=200),
+    ])
+
+    request = asyncio.run(AsyncConnectOpenAPIFacade(client).approve_asset_request(request, 'TL-662-440-096'))
+
+    assert request.id() == 'PR-8027-7606-7082-001'
+    assert request.status() == 'approved'
+
+
+def test_async_asset_helper_should_fail_an_asset_request_with_async_on_success(
+        async_client_factory,
+        response_factory,
+):
+    reason = 'I don\'t like you :P'
+
+    request = Request()
+    request.with_id('PR-8027-7606-7082-001')
+    request.with_status('pending')
+    request.with_asset(Asset())
+
+    client = async_client_factory([
+        response_factory(value=request.raw(), status=200),
+    ])
+
+    async def on_success(req: Request) -> str:
+        return req.status()
+
+    status = asyncio.run(AsyncConnectOpenAPIFacade(client).fail_asset_request(
+        request,
+        reason,
+        on_success=on_success,
+    ))
+
+    assert status == 'failed'
+    assert request.reason() == reason
+
+
+def test_async_asset_helper_should_inquire_an_asset_request(async_client_factory, response_factory):
+    request = Request()
+    request.with_id('PR-8027-7606-7082-001')
+    request.with_status('pending')
+    request.with_asset(Asset())
+
+    client = async_client_factory([
+        response_factory(value=request.raw(), status=200),
+    ])
+
+    request = asyncio.run(AsyncConnectOpenAPIFacade(client).inquire_asset_request(request, 'TL-662-440-097'))
+
+    assert request.status() == 'inquiring'
+
+
+def test_async_asset_helper_should_fail_approving_an_asset_request(async_client_factory, response_factory):
+    exception = ClientError(
+        message=BAD_REQUEST_400,
+        status_code=400,
+        error_code="VAL_001",
+        errors=["effective_date: Datetime has wrong format."],
+    )
+
+    client = async_client_factory([
+        response_factory(exception=exception, status=exception.status_code),
+    ])
+
+    request = Request()
+    request.with_id('PR-8027-7606-7082-001')
+    request.with_asset(Asset())
+
+    with pytest.raises(ClientError):
+        asyncio.run(AsyncConnectOpenAPIFacade(client).approve_asset_request(request, 'TL-662-440-096'))
+
+
+def test_async_asset_helper_should_call_async_on_error_approving_an_asset_request(
+        async_client_factory,
+        response_factory,
+):
+    exception = ClientError(
+        message=BAD_REQUEST_400,
+        status_code=400,
+        error_code="VAL_001",
+        errors=["effective_date: Datetime has wrong format."],
+    )
+
+    client = async_client_factory([
+        response_factory(exception=exception, status=exception.status_code),
+    ])
+
+    request = Request()
+    request.with_id('PR-8027-7606-7082-001')
+    request.with_asset(Asset())
+
+    async def on_error(error: ClientError) -> int:
+        return error.status_code
+
+    status_code = asyncio.run(AsyncConnectOpenAPIFacade(client).approve_asset_request(
+        request,
+        'TL-662-440-096',
+        on_error=on_error,
+    ))
+
+    assert status_code == 400
+
+
+def test_async_asset_helper_should_update_a_request_asset_params(
+        async_client_factory,
+        response_factory,
+        load_json,
+):
+    after_update = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+    asset = after_update.asset()
+    asset.with_param('CAT_SUBSCRIPTION_ID', 'AS-8790-0160-2196')
+    after_update.with_asset(asset)
+
+    client = async_client_factory([
+        response_factory(value=after_update.raw(), status=200),
+    ])
+
+    request = Request(load_json(os.path.dirname(__file__) + ASSET_REQUEST_FILE))
+
+    request = asyncio.run(AsyncConnectOpenAPIFacade(client).update_asset_request_parameters(request, [{
+        'id': 'CAT_SUBSCRIPTION_ID',
+        'value': 'AS-8790-0160-2196',
+    }]))
+
+    assert request.asset().param('CAT_SUBSCRIPTION_ID', 'value') == 'AS-8790-0160-2196'
+
+
+def test_async_asset_helper_should_drive_many_requests_concurrently(async_client_factory, response_factory):
+    requests = []
+    for i in range(5):
+        request = Request()
+        request.with_id(f'PR-8027-7606-7082-00{i}')
+        request.with_status('pending')
+        request.with_asset(Asset())
+        requests.append(request)
+
+    client = async_client_factory([
+        response_factory(value=request.raw(), status=200) for request in requests
+    ])
+
+    api = AsyncConnectOpenAPIFacade(client)
+
+    async def approve_all():
+        return await asyncio.gather(*[
+            api.approve_asset_request(request, 'TL-662-440-096') for request in requests
+        ])
+
+    approved = asyncio.run(approve_all())
+
+    assert [request.status() for request in approved] == ['approved'] * 5
+
+
+def test_async_asset_helper_should_inquire_many_asset_requests(async_client_factory, response_factory):
+    exception = ClientError(
+        message=BAD_REQUEST_400,
+        status_code=400,
+        error_code="REQ_003",
+        errors=["At least one parameter should be marked as invalid."],
+    )
+
+    requests = []
+    for i in range(1, 4):
+        request = Request()
+        request.with_id(f'PR-8027-7606-7082-00{i}')
+        request.with_status('pending')
+        request.with_asset(Asset())
+        requests.append(request)
+
+    client = async_client_factory([
+        response_factory(value=requests[0].raw(), status=200),
+        response_factory(exception=exception, status=exception.status_code),
+        response_factory(value=requests[2].raw(), status=200),
+    ])
+
+    report = asyncio.run(AsyncConnectOpenAPIFacade(client).inquire_asset_requests(
+        requests,
+        'TL-662-440-097',
+        max_workers=1,
+    ))
+
+    assert [item.succeeded for item in report] == [True, False, True]
+    assert report.items[0].result.status() == 'inquiring'
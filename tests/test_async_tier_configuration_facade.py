@@ -0,0 +1,166 @@
+import asyncio
+import os
+
+import pytest
+from connect.client import ClientError
+from rndi.connect.business_objects.adapters import Request, TierConfiguration
+from rndi.connect.api_facades.facade import AsyncConnectOpenAPIFacade
+
+BAD_REQUEST_400 = '400 Bad Request'
+TIER_CONFIG_REQUEST_FILE = '/request_tier_config.json'
+
+
+def _make_tier_configuration_request(tcr_id: str = 'TCR-0000-0000-0000-001') -> Request:
+    tier_configuration = TierConfiguration()
+    tier_configuration.with_id('TC-0000-0000-0000')
+
+    request = Request()
+    request.with_id(tcr_id)
+    request.with_type('setup')
+    request.with_status('pending')
+    request.with_tier_configuration(tier_configuration)
+    return request
+
+
+def test_async_tier_configuration_service_should_retrieve_a_tier_configuration_by_id(
+        async_client_factory,
+        response_factory,
+):
+    tier_configuration = TierConfiguration()
+    tier_configuration.with_id('TC-0000-0000-0000')
+
+    client = async_client_factory([
+        response_factory(value=tier_configuration.raw(), status=200),
+    ])
+
+    tier_configuration = asyncio.run(
+        AsyncConnectOpenAPIFacade(client).find_tier_configuration('TC-0000-0000-0000'),
+    )
+
+    assert isinstance(tier_configuration, TierConfiguration)
+    assert tier_configuration.id() == 'TC-0000-0000-0000'
+
+
+def test_async_tier_configuration_service_should_retrieve_a_tier_configuration_request_by_id(
+        async_client_factory,
+        response_factory,
+):
+    request = _make_tier_configuration_request()
+
+    client = async_client_factory([
+        response_factory(value=request.raw(), status=200),
+    ])
+
+    request = asyncio.run(
+        AsyncConnectOpenAPIFacade(client).find_tier_configuration_request('TCR-0000-0000-0000-001'),
+    )
+
+    assert isinstance(request, Request)
+    assert request.tier_configuration().id() == 'TC-0000-0000-0000'
+
+
+def test_async_tier_configuration_service_should_approve_a_tier_configuration_request(
+        async_client_factory,
+        response_factory,
+):
+    request = _make_tier_configuration_request()
+
+    client = async_client_factory([
+        response_factory(value=request.raw(), status=200),
+    ])
+
+    request = asyncio.run(
+        AsyncConnectOpenAPIFacade(client).approve_tier_configuration_request(request, 'TL-000-000-001'),
+    )
+
+    assert request.status() == 'approved'
+
+
+def test_async_tier_configuration_service_should_fail_a_tier_configuration_request(
+        async_client_factory,
+        response_factory,
+):
+    request = _make_tier_configuration_request()
+
+    client = async_client_factory([
+        response_factory(value=request.raw(), status=200),
+    ])
+
+    request = asyncio.run(
+        AsyncConnectOpenAPIFacade(client).fail_tier_configuration_request(request, 'Get better'),
+    )
+
+    assert request.status() == 'failed'
+    assert request.reason() == 'Get better'
+
+
+def test_async_tier_configuration_service_should_inquire_with_async_on_success(
+        async_client_factory,
+        response_factory,
+):
+    request = _make_tier_configuration_request()
+
+    client = async_client_factory([
+        response_factory(value=request.raw(), status=200),
+    ])
+
+    async def on_success(req: Request) -> Request:
+        return req
+
+    request = asyncio.run(
+        AsyncConnectOpenAPIFacade(client).inquire_tier_configuration_request(request, on_success=on_success),
+    )
+
+    assert request.status() == 'inquiring'
+
+
+def test_async_tier_configuration_service_should_update_tier_configuration_params(
+        async_client_factory,
+        response_factory,
+        load_json,
+):
+    initial_request = Request(load_json(os.path.dirname(__file__) + TIER_CONFIG_REQUEST_FILE))
+
+    updated_request = Request(load_json(os.path.dirname(__file__) + TIER_CONFIG_REQUEST_FILE))
+    tier_configuration = updated_request.tier_configuration()
+    tier_configuration.with_param('CAT_SUBSCRIPTION_ID', 'AS-0000-0000-0001')
+    updated_request.with_tier_configuration(tier_configuration)
+
+    client = async_client_factory([
+        response_factory(value=updated_request.raw(), status=200),
+    ])
+
+    request = asyncio.run(AsyncConnectOpenAPIFacade(client).update_tier_configuration_request_parameters(
+        initial_request,
+        [{
+            'id': 'CAT_SUBSCRIPTION_ID',
+            'value': 'AS-0000-0000-0001',
+        }],
+    ))
+
+    assert request.tier_configuration().param('CAT_SUBSCRIPTION_ID', 'value') == 'AS-0000-0000-0001'
+
+
+def test_async_tier_configuration_service_should_fail_updating_tier_configuration_params(
+        async_client_factory,
+        response_factory,
+):
+    exception = ClientError(
+        message=BAD_REQUEST_400,
+        status_code=400,
+        error_code="REQ_005",
+        errors=["Missed fields: reason."],
+    )
+
+    client = async_client_factory([
+        response_factory(exception=exception, status=exception.status_code),
+    ])
+
+    with pytest.raises(ClientError):
+        asyncio.run(AsyncConnectOpenAPIFacade(client).update_tier_configuration_request_parameters(
+            _make_tier_configuration_request(),
+            [{
+                'id': 'CAT_SUBSCRIPTION_ID',
+                'value': 'AS-0000-0000-0001',
+            }],
+        ))
@@ -0,0 +1,257 @@
+import multiprocessing
+
+import pytest
+from rndi.connect.api_facades.cache import (
+    ASSET,
+    ASSET_REQUEST,
+    EntityCache,
+    IF_MODIFIED_SINCE,
+    IF_NONE_MATCH,
+    InvalidationLog,
+    response_validators,
+    SQLiteEntityCache,
+    updated_at,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entity_cache_should_return_a_copy_of_the_cached_entity():
+    cache = EntityCache()
+    cache.set(ASSET, 'AS-0000-0000-0000', {'id': 'AS-0000-0000-0000', 'status': 'active'})
+
+    entity = cache.get(ASSET, 'AS-0000-0000-0000')
+    entity['status'] = 'terminated'
+
+    assert cache.get(ASSET, 'AS-0000-0000-0000')['status'] == 'active'
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 0
+
+
+def test_entity_cache_should_count_misses():
+    cache = EntityCache()
+
+    assert cache.get(ASSET, 'AS-0000-0000-0000') is None
+    assert cache.stats.misses == 1
+
+
+def test_entity_cache_should_expire_entries_using_the_entity_ttl():
+    clock = FakeClock()
+    cache = EntityCache(ttl=10, ttls={ASSET_REQUEST: 1}, clock=clock)
+    cache.set(ASSET, 'AS-0000-0000-0000', {'id': 'AS-0000-0000-0000'})
+    cache.set(ASSET_REQUEST, 'PR-0000-0000-0000-001', {'id': 'PR-0000-0000-0000-001'})
+
+    clock.now = 5
+
+    assert cache.get(ASSET, 'AS-0000-0000-0000') is not None
+    assert cache.get(ASSET_REQUEST, 'PR-0000-0000-0000-001') is None
+    assert cache.stats.expirations == 1
+
+
+def test_entity_cache_should_evict_the_least_recently_used_entry():
+    cache = EntityCache(max_size=2)
+    cache.set(ASSET, 'AS-0000-0000-0001', {'id': 'AS-0000-0000-0001'})
+    cache.set(ASSET, 'AS-0000-0000-0002', {'id': 'AS-0000-0000-0002'})
+    cache.get(ASSET, 'AS-0000-0000-0001')
+    cache.set(ASSET, 'AS-0000-0000-0003', {'id': 'AS-0000-0000-0003'})
+
+    assert len(cache) == 2
+    assert cache.get(ASSET, 'AS-0000-0000-0002') is None
+    assert cache.get(ASSET, 'AS-0000-0000-0001') is not None
+    assert cache.stats.evictions == 1
+
+
+def test_entity_cache_should_invalidate_entries():
+    cache = EntityCache()
+    cache.set(ASSET, 'AS-0000-0000-0000', {'id': 'AS-0000-0000-0000'})
+    cache.invalidate(ASSET, 'AS-0000-0000-0000')
+
+    assert cache.get(ASSET, 'AS-0000-0000-0000') is None
+    assert cache.stats.invalidations == 1
+
+
+def test_entity_cache_should_reject_invalid_sizes():
+    with pytest.raises(ValueError):
+        EntityCache(max_size=0)
+
+
+def test_entity_cache_should_keep_the_expired_entries_to_revalidate_them():
+    clock = FakeClock()
+    cache = EntityCache(ttl=1, clock=clock, revalidate=True)
+    cache.set(ASSET, 'AS-0000-0000-0000', {'id': 'AS-0000-0000-0000'}, {'ETag': '"v1"'})
+
+    assert cache.conditional_headers(ASSET, 'AS-0000-0000-0000') == {IF_NONE_MATCH: '"v1"'}
+
+    clock.now = 5
+
+    assert cache.get(ASSET, 'AS-0000-0000-0000') is None
+    assert cache.conditional_headers(ASSET, 'AS-0000-0000-0000') == {IF_NONE_MATCH: '"v1"'}
+    assert cache.revalidated(ASSET, 'AS-0000-0000-0000', {'ETag': '"v2"'}) == {'id': 'AS-0000-0000-0000'}
+    assert cache.get(ASSET, 'AS-0000-0000-0000') == {'id': 'AS-0000-0000-0000'}
+    assert cache.conditional_headers(ASSET, 'AS-0000-0000-0000') == {IF_NONE_MATCH: '"v2"'}
+    assert cache.stats.revalidations == 1
+
+
+def test_entity_cache_should_revalidate_with_the_entity_update_timestamp():
+    cache = EntityCache(revalidate=True)
+    cache.set(ASSET_REQUEST, 'PR-0000-0000-0000-001', {
+        'id': 'PR-0000-0000-0000-001',
+        'updated': '2021-12-23T09:09:25+00:00',
+    })
+
+    assert cache.conditional_headers(ASSET_REQUEST, 'PR-0000-0000-0000-001') == {
+        IF_MODIFIED_SINCE: 'Thu, 23 Dec 2021 09:09:25 GMT',
+    }
+
+
+def test_entity_cache_should_not_build_conditional_headers_without_revalidation():
+    cache = EntityCache()
+    cache.set(ASSET, 'AS-0000-0000-0000', {'id': 'AS-0000-0000-0000'}, {'ETag': '"v1"'})
+
+    assert cache.conditional_headers(ASSET, 'AS-0000-0000-0000') == {}
+    assert cache.revalidated(ASSET, 'AS-0000-0000-0001') is None
+
+
+def test_updated_at_should_read_the_request_and_the_events_timestamps():
+    assert updated_at({'updated': '2021-12-23T09:09:25Z'}) == 'Thu, 23 Dec 2021 09:09:25 GMT'
+    assert updated_at({'events': {'updated': {'at': '2021-12-23T09:09:25+00:00'}}}) == 'Thu, 23 Dec 2021 09:09:25 GMT'
+    assert updated_at({'updated': 'yesterday'}) is None
+    assert updated_at({}) is None
+
+
+def test_response_validators_should_keep_the_etag_and_last_modified_headers():
+    class Response:
+        headers = {'ETag': '"v1"', 'Last-Modified': 'Thu, 23 Dec 2021 09:09:25 GMT', 'Server': 'stub'}
+
+    assert response_validators(Response()) == {'ETag': '"v1"', 'Last-Modified': 'Thu, 23 Dec 2021 09:09:25 GMT'}
+    assert response_validators(None) == {}
+
+
+def _store_asset(path: str, asset_id: str) -> None:
+    SQLiteEntityCache(path).set(ASSET, asset_id, {'id': asset_id, 'status': 'active'})
+
+
+def test_sqlite_entity_cache_should_store_and_return_the_entities(tmp_path):
+    cache = SQLiteEntityCache(str(tmp_path / 'cache.sqlite'))
+    cache.set(ASSET, 'AS-0000-0000-0000', {'id': 'AS-0000-0000-0000', 'status': 'active'})
+
+    entity = cache.get(ASSET, 'AS-0000-0000-0000')
+    entity['status'] = 'terminated'
+
+    assert cache.get(ASSET, 'AS-0000-0000-0000')['status'] == 'active'
+    assert cache.get(ASSET, 'AS-0000-0000-0001') is None
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+    assert len(cache) == 1
+
+
+def test_sqlite_entity_cache_should_share_the_entries_between_processes(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    SQLiteEntityCache(path)
+
+    process = multiprocessing.get_context('spawn').Process(target=_store_asset, args=(path, 'AS-0000-0000-0000'))
+    process.start()
+    process.join(30)
+
+    assert process.exitcode == 0
+    assert SQLiteEntityCache(path).get(ASSET, 'AS-0000-0000-0000') == {'id': 'AS-0000-0000-0000', 'status': 'active'}
+
+
+def test_sqlite_entity_cache_should_expire_entries_using_the_entity_ttl(tmp_path):
+    clock = FakeClock()
+    cache = SQLiteEntityCache(str(tmp_path / 'cache.sqlite'), ttl=10, ttls={ASSET_REQUEST: 1}, clock=clock)
+    cache.set(ASSET, 'AS-0000-0000-0000', {'id': 'AS-0000-0000-0000'})
+    cache.set(ASSET_REQUEST, 'PR-0000-0000-0000-001', {'id': 'PR-0000-0000-0000-001'})
+
+    clock.now = 5
+
+    assert cache.get(ASSET, 'AS-0000-0000-0000') is not None
+    assert cache.get(ASSET_REQUEST, 'PR-0000-0000-0000-001') is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 1
+
+
+def test_sqlite_entity_cache_should_evict_the_least_recently_used_entries(tmp_path):
+    clock = FakeClock()
+    cache = SQLiteEntityCache(str(tmp_path / 'cache.sqlite'), max_size=2, clock=clock, touch_interval=0)
+    cache.set(ASSET, 'AS-0000-0000-0001', {'id': 'AS-0000-0000-0001'})
+    clock.now = 1
+    cache.set(ASSET, 'AS-0000-0000-0002', {'id': 'AS-0000-0000-0002'})
+    clock.now = 2
+    cache.get(ASSET, 'AS-0000-0000-0001')
+    clock.now = 3
+    cache.set(ASSET, 'AS-0000-0000-0003', {'id': 'AS-0000-0000-0003'})
+
+    assert cache.get(ASSET, 'AS-0000-0000-0002') is None
+    assert cache.get(ASSET, 'AS-0000-0000-0001') is not None
+    assert cache.stats.evictions == 1
+
+
+def test_sqlite_entity_cache_should_not_evict_when_replacing_entries(tmp_path):
+    cache = SQLiteEntityCache(str(tmp_path / 'cache.sqlite'), max_size=2)
+    cache.set(ASSET, 'AS-0000-0000-0001', {'id': 'AS-0000-0000-0001'})
+    cache.set(ASSET, 'AS-0000-0000-0002', {'id': 'AS-0000-0000-0002'})
+    cache.set(ASSET, 'AS-0000-0000-0001', {'id': 'AS-0000-0000-0001', 'status': 'active'}, {'ETag': '"v2"'})
+
+    assert len(cache) == 2
+    assert cache.stats.evictions == 0
+    assert cache.get(ASSET, 'AS-0000-0000-0001') == {'id': 'AS-0000-0000-0001', 'status': 'active'}
+    assert cache.peek(ASSET, 'AS-0000-0000-0001')[1] == {'ETag': '"v2"'}
+
+
+def test_sqlite_entity_cache_should_invalidate_and_revalidate_entries(tmp_path):
+    clock = FakeClock()
+    cache = SQLiteEntityCache(str(tmp_path / 'cache.sqlite'), ttl=1, clock=clock, revalidate=True)
+    cache.set(ASSET, 'AS-0000-0000-0000', {'id': 'AS-0000-0000-0000'}, {'ETag': '"v1"'})
+    cache.set(ASSET, 'AS-0000-0000-0001', {'id': 'AS-0000-0000-0001'})
+
+    clock.now = 5
+
+    assert cache.get(ASSET, 'AS-0000-0000-0000') is None
+    assert cache.conditional_headers(ASSET, 'AS-0000-0000-0000') == {IF_NONE_MATCH: '"v1"'}
+    assert cache.revalidated(ASSET, 'AS-0000-0000-0000', {'ETag': '"v2"'}) == {'id': 'AS-0000-0000-0000'}
+    assert cache.get(ASSET, 'AS-0000-0000-0000') == {'id': 'AS-0000-0000-0000'}
+    assert cache.conditional_headers(ASSET, 'AS-0000-0000-0000') == {IF_NONE_MATCH: '"v2"'}
+
+    cache.invalidate(ASSET, 'AS-0000-0000-0001')
+
+    assert cache.peek(ASSET, 'AS-0000-0000-0001') is None
+    assert cache.revalidated(ASSET, 'AS-0000-0000-0001') is None
+    assert cache.stats.invalidations == 1
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test_sqlite_entity_cache_should_reject_invalid_sizes(tmp_path):
+    with pytest.raises(ValueError):
+        SQLiteEntityCache(str(tmp_path / 'cache.sqlite'), max_size=0)
+
+
+def test_invalidation_log_should_tell_the_reads_started_before_an_invalidation():
+    log = InvalidationLog()
+    started = log.current()
+
+    log.invalidate(ASSET, 'AS-0000-0000-0001')
+
+    assert log.changed_since(ASSET, 'AS-0000-0000-0001', started)
+    assert not log.changed_since(ASSET, 'AS-0000-0000-0002', started)
+    assert not log.changed_since(ASSET, 'AS-0000-0000-0001', log.current())
+
+
+def test_invalidation_log_should_consider_stale_the_reads_older_than_the_forgotten_keys():
+    log = InvalidationLog(max_size=1)
+    started = log.current()
+
+    log.invalidate(ASSET, 'AS-0000-0000-0001')
+    log.invalidate(ASSET, 'AS-0000-0000-0002')
+
+    assert log.changed_since(ASSET, 'AS-0000-0000-0003', started)
+    assert not log.changed_since(ASSET, 'AS-0000-0000-0003', log.current())
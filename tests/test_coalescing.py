@@ -0,0 +1,149 @@
+import threading
+import time
+
+from connect.client import ClientError
+import pytest
+from rndi.connect.api_facades.coalescing import ParameterUpdateCoalescer
+
+
+def test_parameter_update_coalescer_should_merge_buffered_updates_into_one_call():
+    coalescer = ParameterUpdateCoalescer(window=None)
+    calls = []
+
+    def send(parameters):
+        calls.append(parameters)
+        return 'sent'
+
+    first = coalescer.submit('PR-1', [{'id': 'A', 'value': '1'}], send, lambda r: r, lambda e: e)
+    second = coalescer.submit('PR-1', [
+        {'id': 'A', 'value': '2'},
+        {'id': 'B', 'value': '3'},
+    ], send, lambda r: r, lambda e: e)
+
+    assert len(coalescer) == 1
+    assert not first.done()
+
+    coalescer.flush('PR-1')
+
+    assert calls == [[{'id': 'A', 'value': '2'}, {'id': 'B', 'value': '3'}]]
+    assert first.result() == 'sent'
+    assert second.result() == 'sent'
+    assert len(coalescer) == 0
+
+
+def test_parameter_update_coalescer_should_keep_the_updates_of_different_keys_apart():
+    coalescer = ParameterUpdateCoalescer(window=None)
+    calls = []
+
+    coalescer.submit('PR-1', [{'id': 'A', 'value': '1'}], lambda p: calls.append(('PR-1', p)), str, str)
+    coalescer.submit('PR-2', [{'id': 'A', 'value': '2'}], lambda p: calls.append(('PR-2', p)), str, str)
+
+    coalescer.flush()
+
+    assert sorted(calls) == [
+        ('PR-1', [{'id': 'A', 'value': '1'}]),
+        ('PR-2', [{'id': 'A', 'value': '2'}]),
+    ]
+
+
+def test_parameter_update_coalescer_should_flush_once_the_window_expires():
+    coalescer = ParameterUpdateCoalescer(window=0.01)
+
+    future = coalescer.submit('PR-1', [{'id': 'A', 'value': '1'}], lambda p: p, lambda r: r, lambda e: e)
+
+    assert future.result(timeout=5) == [{'id': 'A', 'value': '1'}]
+    time.sleep(0.01)
+    assert len(coalescer) == 0
+
+
+def test_parameter_update_coalescer_should_resolve_every_waiter_with_the_fail_callback():
+    coalescer = ParameterUpdateCoalescer(window=None)
+
+    def send(parameters):
+        raise ClientError(status_code=400, error_code="VAL_001", errors=["Invalid parameter."])
+
+    futures = [
+        coalescer.submit('PR-1', [{'id': 'A', 'value': str(i)}], send, lambda r: r, lambda e: e.error_code)
+        for i in range(3)
+    ]
+
+    coalescer.flush('PR-1')
+
+    assert [future.result() for future in futures] == ['VAL_001'] * 3
+
+
+def test_parameter_update_coalescer_should_propagate_unexpected_errors():
+    coalescer = ParameterUpdateCoalescer(window=None)
+
+    def send(parameters):
+        raise RuntimeError('boom')
+
+    future = coalescer.submit('PR-1', [{'id': 'A', 'value': '1'}], send, lambda r: r, lambda e: e)
+
+    with pytest.raises(RuntimeError):
+        coalescer.flush('PR-1')
+
+    with pytest.raises(RuntimeError):
+        future.result()
+
+
+def test_parameter_update_coalescer_should_flush_the_expired_windows_on_one_thread():
+    coalescer = ParameterUpdateCoalescer(window=0.01)
+    threads = []
+
+    def send(parameters):
+        threads.append(threading.current_thread())
+        return parameters
+
+    futures = [coalescer.submit(f'PR-{i}', [{'id': 'A', 'value': str(i)}], send, str, str) for i in range(5)]
+    [future.result(timeout=5) for future in futures]
+
+    futures = [coalescer.submit(f'PR-{i}', [{'id': 'B', 'value': str(i)}], send, str, str) for i in range(5)]
+    [future.result(timeout=5) for future in futures]
+
+    assert len(threads) == 10
+    assert len(set(threads)) == 1
+    assert threads[0] is not threading.current_thread()
+
+
+def test_parameter_update_coalescer_should_not_flush_early_a_batch_flushed_explicitly():
+    coalescer = ParameterUpdateCoalescer(window=0.2)
+    calls = []
+
+    coalescer.submit('PR-1', [{'id': 'A', 'value': '1'}], calls.append, str, str)
+    coalescer.flush('PR-1')
+    second = coalescer.submit('PR-1', [{'id': 'A', 'value': '2'}], calls.append, str, str)
+
+    time.sleep(0.05)
+    assert not second.done()
+    second.result(timeout=5)
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize('window', [None, 0.01])
+def test_parameter_update_coalescer_should_release_the_key_before_running_the_callbacks(window):
+    coalescer = ParameterUpdateCoalescer(window=window)
+    calls = []
+
+    def transition(result):
+        # an on_success approving the same request flushes its key again.
+        coalescer.flush('PR-1')
+        calls.append('transition')
+        return result
+
+    future = coalescer.submit('PR-1', [{'id': 'A', 'value': '1'}], calls.append, transition, str)
+    if window is None:
+        coalescer.flush('PR-1')
+
+    future.result(timeout=5)
+    assert calls == [[{'id': 'A', 'value': '1'}], 'transition']
+
+
+def test_parameter_update_coalescer_should_expose_the_pending_parameters():
+    coalescer = ParameterUpdateCoalescer(window=None)
+
+    coalescer.submit('PR-1', [{'id': 'A', 'value': '1'}], str, str, str)
+    coalescer.submit('PR-1', [{'id': 'A', 'value': '2'}, {'id': 'B', 'value': '3'}], str, str, str)
+
+    assert coalescer.pending('PR-1') == [{'id': 'A', 'value': '2'}, {'id': 'B', 'value': '3'}]
+    assert coalescer.pending('PR-2') == []
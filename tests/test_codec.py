@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+from connect.client import AsyncConnectClient, ConnectClient
+import pytest
+from rndi.connect.api_facades.codec import available_codecs, get_codec, JSONCodec, OrjsonCodec, StdlibJSONCodec
+
+
+class CountingCodec(StdlibJSONCodec):
+    def __init__(self):
+        self.decoded = 0
+
+    def _loads(self, data):
+        self.decoded += 1
+        return super()._loads(data)
+
+
+@pytest.mark.parametrize('name', available_codecs())
+def test_codec_should_encode_and_decode_json_documents(name):
+    codec = get_codec(name)
+    value = {'id': 'PR-001', 'asset': {'params': [{'id': 'ORDER_TYPE', 'value': 'ÑANDÚ'}]}, 'count': 3}
+
+    assert isinstance(codec, JSONCodec)
+    assert codec.loads(codec.dumps(value)) == value
+    assert json.loads(codec.dumps(value)) == value
+
+
+@pytest.mark.parametrize('name', available_codecs())
+def test_codec_should_raise_json_decode_errors_on_invalid_documents(name):
+    with pytest.raises(json.JSONDecodeError):
+        get_codec(name).loads(b'{"id": ')
+
+
+def test_get_codec_should_pick_the_fastest_installed_codec():
+    assert get_codec().name == available_codecs()[0]
+    assert available_codecs()[-1] == 'json'
+
+
+def test_get_codec_should_reject_unknown_codecs():
+    with pytest.raises(ValueError):
+        get_codec('yaml')
+
+
+def test_orjson_codec_should_be_picked_when_installed():
+    pytest.importorskip('orjson')
+
+    assert isinstance(get_codec(), OrjsonCodec)
+
+
+def test_codec_should_build_the_encoded_payload_arguments():
+    codec = StdlibJSONCodec()
+
+    assert codec.payload(None) == {'payload': None}
+    assert codec.payload({'id': 'PR-001'}) == {
+        'data': b'{"id":"PR-001"}',
+        'headers': {'Content-Type': 'application/json'},
+    }
+    assert 'content' in codec.payload({'id': 'PR-001'}, content='content')
+
+
+def test_codec_should_decode_the_bound_client_responses(response):
+    codec = CountingCodec()
+    client = ConnectClient('ApiKey', use_specs=False, max_retries=0)
+
+    response.add('PUT', f'{client.endpoint}/requests/PR-001', json={'id': 'PR-001', 'status': 'pending'})
+
+    codec.bind(codec.bind(client))
+    value = client.requests['PR-001'].update(**codec.payload({'asset': {'params': []}}))
+
+    assert value == {'id': 'PR-001', 'status': 'pending'}
+    assert codec.decoded == 1
+    assert json.loads(response.calls[0].request.body) == {'asset': {'params': []}}
+    assert response.calls[0].request.headers['Content-Type'] == 'application/json'
+
+
+def test_codec_should_decode_the_bound_async_client_responses(httpx_mock):
+    codec = CountingCodec()
+    client = AsyncConnectClient('ApiKey', use_specs=False, max_retries=0)
+
+    httpx_mock.add_response(
+        method='PUT',
+        url=f'{client.endpoint}/requests/PR-001',
+        json={'id': 'PR-001', 'status': 'pending'},
+    )
+
+    async def update():
+        codec.bind(codec.bind(client))
+        return await client.requests['PR-001'].update(**codec.payload({'asset': {'params': []}}, content='content'))
+
+    assert asyncio.run(update()) == {'id': 'PR-001', 'status': 'pending'}
+    assert codec.decoded == 1
+    assert json.loads(httpx_mock.get_requests()[0].content) == {'asset': {'params': []}}
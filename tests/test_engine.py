@@ -0,0 +1,130 @@
+import os
+
+from connect.client import ClientError
+import pytest
+from rndi.connect.api_facades.engine import shard_of, ShardedEngine
+from rndi.connect.api_facades.views import RequestView
+
+
+class WorkerFacade:
+    def __init__(self):
+        self.handled = 0
+
+    def find_asset_request(self, request_id):
+        if request_id == 'PR-MISSING':
+            raise ClientError('Not found', status_code=404, error_code='REQ_000')
+        return {'id': request_id}
+
+
+def build_facade():
+    return WorkerFacade()
+
+
+def handle(api, request):
+    api.handled += 1
+    if request['id'] == 'PR-BROKEN':
+        raise ValueError('broken request')
+    if request['id'] == 'PR-CRASH':
+        os._exit(1)
+    if request['id'] == 'PR-UNPICKLABLE':
+        return lambda: None
+    return os.getpid(), api.handled
+
+
+def test_shard_of_should_be_stable():
+    assert shard_of('PR-1', 4) == shard_of('PR-1', 4)
+    assert {shard_of(f'PR-{i}', 4) for i in range(100)} == {0, 1, 2, 3}
+
+
+def test_engine_should_keep_the_input_order_in_the_report():
+    requests = [f'PR-{i}' for i in range(20)]
+
+    with ShardedEngine(build_facade, handle, processes=2, batch_size=3) as engine:
+        report = engine.run(requests)
+
+    assert [item.request_id for item in report] == requests
+    assert len(report.succeeded) == 20
+    assert len({item.result[0] for item in report}) == 2
+
+
+def test_engine_should_process_the_same_request_id_in_order_in_one_process():
+    requests = ['PR-1', 'PR-2', 'PR-1', 'PR-3', 'PR-1', 'PR-2', 'PR-1']
+
+    with ShardedEngine(build_facade, handle, processes=3, batch_size=1, max_pending=1) as engine:
+        report = engine.run(requests)
+
+    first = [item.result for item in report if item.request_id == 'PR-1']
+    assert len({pid for pid, _ in first}) == 1
+    assert [handled for _, handled in first] == sorted(handled for _, handled in first)
+
+
+def test_engine_should_gather_the_errors_in_the_parent():
+    with ShardedEngine(build_facade, handle, processes=2) as engine:
+        report = engine.run(['PR-1', 'PR-MISSING', 'PR-BROKEN'])
+
+    assert [item.request_id for item in report.failed] == ['PR-MISSING', 'PR-BROKEN']
+    assert isinstance(report.items[1].error, ClientError)
+    assert report.items[1].error.status_code == 404
+    assert isinstance(report.items[2].error, ValueError)
+
+
+def test_engine_should_stream_the_results():
+    with ShardedEngine(build_facade, handle, processes=2, batch_size=2) as engine:
+        results = list(engine.process(f'PR-{i}' for i in range(10)))
+
+    assert sorted(item.request_id for item in results) == sorted(f'PR-{i}' for i in range(10))
+
+
+def test_engine_should_load_the_request_views_through_the_loader():
+    views = [RequestView('asset_request', f'PR-{i}', status='pending') for i in range(4)]
+
+    with ShardedEngine(build_facade, handle, processes=2) as engine:
+        report = engine.run(views)
+
+    assert [item.request_id for item in report] == [f'PR-{i}' for i in range(4)]
+    assert len(report.succeeded) == 4
+
+
+def test_engine_should_report_the_inputs_without_id_as_failed_items():
+    with ShardedEngine(build_facade, handle, processes=2) as engine:
+        report = engine.run(['PR-1', {'status': 'pending'}, 42, 'PR-2'])
+
+    assert [item.request_id for item in report.succeeded] == ['PR-1', 'PR-2']
+    assert isinstance(report.items[1].error, ValueError)
+    assert isinstance(report.items[2].error, TypeError)
+
+
+def test_engine_should_keep_streaming_when_a_shard_is_busy():
+    requests = [f'PR-{i}' for i in range(30)]
+
+    with ShardedEngine(build_facade, handle, processes=3, batch_size=1, max_pending=1) as engine:
+        results = list(engine.process(requests))
+
+    assert sorted(item.request_id for item in results) == sorted(requests)
+
+
+def test_engine_should_replace_a_crashed_worker():
+    requests = ['PR-CRASH', 'PR-1', 'PR-2', 'PR-3']
+
+    with ShardedEngine(build_facade, handle, processes=1, batch_size=1, max_pending=1) as engine:
+        report = engine.run(requests)
+        again = engine.run(['PR-4'])
+
+    assert [item.request_id for item in report] == requests
+    assert not report.items[0].succeeded
+    assert report.items[-1].succeeded
+    assert len(again.succeeded) == 1
+
+
+def test_engine_should_report_the_unpicklable_results_per_item():
+    with ShardedEngine(build_facade, handle, processes=1) as engine:
+        report = engine.run(['PR-1', 'PR-UNPICKLABLE', 'PR-2'])
+
+    assert [item.request_id for item in report.succeeded] == ['PR-1', 'PR-2']
+    assert isinstance(report.items[1].error, RuntimeError)
+
+
+@pytest.mark.parametrize('processes', [0, -1])
+def test_engine_should_fail_on_invalid_processes(processes):
+    with pytest.raises(ValueError):
+        ShardedEngine(build_facade, handle, processes=processes)
@@ -0,0 +1,74 @@
+import asyncio
+
+from connect.client import ClientError
+import pytest
+from rndi.connect.api_facades.helpers import (
+    changed_parameters,
+    merge_parameters,
+    raise_error,
+    resolve,
+    return_request,
+    rql_select,
+    with_select,
+)
+
+
+def test_resolve_should_return_plain_values():
+    assert asyncio.run(resolve(42)) == 42
+
+
+def test_resolve_should_await_awaitable_values():
+    async def value():
+        return 42
+
+    assert asyncio.run(resolve(value())) == 42
+
+
+def test_rql_select_should_combine_included_and_excluded_fields():
+    assert rql_select(['id', 'status'], ['asset.params']) == ['id', 'status', '-asset.params']
+    assert rql_select() == []
+
+
+def test_with_select_should_append_the_select_operator_to_the_path():
+    assert with_select('assets/AS-0000-0000-0000', ['-params']) == 'assets/AS-0000-0000-0000?select(-params)'
+    assert with_select('assets/AS-0000-0000-0000', []) == 'assets/AS-0000-0000-0000'
+
+
+def test_changed_parameters_should_return_only_the_parameters_that_change():
+    current = [
+        {'id': 'PARAM_A', 'value': 'a', 'value_error': ''},
+        {'id': 'PARAM_B', 'value': 'b', 'value_error': ''},
+    ]
+
+    assert changed_parameters(current, [
+        {'id': 'PARAM_A', 'value': 'a'},
+        {'id': 'PARAM_B', 'value': 'b', 'value_error': 'Invalid value'},
+        {'id': 'PARAM_C', 'value': 'c'},
+    ]) == [
+        {'id': 'PARAM_B', 'value': 'b', 'value_error': 'Invalid value'},
+        {'id': 'PARAM_C', 'value': 'c'},
+    ]
+
+
+def test_changed_parameters_should_return_nothing_when_nothing_changes():
+    assert changed_parameters([{'id': 'PARAM_A', 'value': 'a'}], [{'id': 'PARAM_A', 'value': 'a'}]) == []
+
+
+def test_merge_parameters_should_apply_the_updates_by_parameter_id():
+    current = [{'id': 'PARAM_A', 'value': 'a', 'value_error': ''}]
+
+    assert merge_parameters(current, [{'id': 'PARAM_A', 'value': 'b'}, {'id': 'PARAM_B', 'value': 'c'}]) == [
+        {'id': 'PARAM_A', 'value': 'b', 'value_error': ''},
+        {'id': 'PARAM_B', 'value': 'c'},
+    ]
+    assert current == [{'id': 'PARAM_A', 'value': 'a', 'value_error': ''}]
+
+
+def test_default_callbacks_should_return_the_request_and_raise_the_error():
+    request = {'id': 'PR-0000-0000-0000-001'}
+    error = ClientError(status_code=400)
+
+    assert return_request(request) is request
+
+    with pytest.raises(ClientError):
+        raise_error(error)
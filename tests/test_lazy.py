@@ -0,0 +1,67 @@
+import pytest
+from rndi.connect.api_facades.lazy import LazyEntity, materialize
+
+
+class Entity:
+    built = 0
+
+    def __init__(self, raw: dict):
+        Entity.built += 1
+        self._raw = raw
+
+    def raw(self) -> dict:
+        return self._raw
+
+    def id(self) -> str:
+        return self._raw['id']
+
+    def with_status(self, status: str) -> 'Entity':
+        self._raw['status'] = status
+        return self
+
+
+@pytest.fixture(autouse=True)
+def reset_built():
+    Entity.built = 0
+
+
+def test_lazy_entity_should_read_the_raw_fields_without_building_the_object():
+    entity = LazyEntity(Entity, {'id': 'PR-001', 'status': 'pending', 'asset': {'product': {'id': 'PRD-001'}}})
+
+    assert entity.id() == 'PR-001'
+    assert entity.status() == 'pending'
+    assert entity.field('asset', 'product', 'id') == 'PRD-001'
+    assert entity.field('asset', 'tiers', 'customer', default='none') == 'none'
+    assert entity.field('status', 'id') is None
+    assert not entity.materialized
+    assert Entity.built == 0
+
+
+def test_lazy_entity_should_build_the_object_once_on_first_access():
+    entity = LazyEntity(Entity, {'id': 'PR-001', 'status': 'pending'})
+
+    entity.with_status('approved')
+    entity.with_status('failed')
+
+    assert entity.materialized
+    assert Entity.built == 1
+    assert entity.status() == 'failed'
+    assert entity.raw() == {'id': 'PR-001', 'status': 'failed'}
+
+
+def test_lazy_entity_should_not_delegate_private_attributes():
+    entity = LazyEntity(Entity, {'id': 'PR-001'})
+
+    with pytest.raises(AttributeError):
+        entity._raw_value
+
+    assert Entity.built == 0
+
+
+def test_materialize_should_normalize_raw_lazy_and_built_entities():
+    built = Entity({'id': 'PR-001'})
+    lazy = LazyEntity(Entity, {'id': 'PR-002'})
+
+    assert materialize(built, Entity) is built
+    assert materialize(lazy, Entity) is lazy.materialize()
+    assert materialize({'id': 'PR-003'}, Entity).id() == 'PR-003'
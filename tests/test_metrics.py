@@ -0,0 +1,61 @@
+from connect.client import ClientError
+import pytest
+from rndi.connect.api_facades.metrics import Histogram, http_sizes, Metrics
+
+
+def test_histogram_should_estimate_the_quantiles():
+    histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+    for value in [0.05] * 50 + [0.15] * 45 + [0.3] * 5:
+        histogram.observe(value)
+
+    assert histogram.count == 100
+    assert histogram.quantile(0.5) == pytest.approx(0.1)
+    assert histogram.quantile(0.95) == pytest.approx(0.2)
+    assert histogram.quantile(0.99) == pytest.approx(0.36)
+    assert histogram.cumulative()[-1] == (float('inf'), 100)
+
+
+def test_histogram_should_not_estimate_quantiles_without_observations():
+    assert Histogram().quantile(0.5) is None
+
+
+def test_metrics_should_count_calls_successes_and_errors_by_status_code():
+    metrics = Metrics()
+
+    metrics.observe('find_asset', 0.01, request_bytes=0, response_bytes=120)
+    metrics.observe('find_asset', 0.02, ClientError(status_code=429))
+    metrics.observe('find_asset', 0.03, ClientError('Unexpected error'))
+
+    snapshot = metrics.snapshot()['find_asset']
+
+    assert snapshot['calls'] == 3
+    assert snapshot['successes'] == 1
+    assert snapshot['errors'] == {'429': 1, 'none': 1}
+    assert snapshot['response_bytes'] == 120
+    assert snapshot['latency']['count'] == 3
+    assert set(snapshot['latency']) == {'count', 'sum', 'p50', 'p95', 'p99'}
+
+    metrics.reset()
+
+    assert metrics.snapshot() == {}
+
+
+def test_metrics_should_export_the_prometheus_text_format():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.observe('approve_asset_request', 0.05, request_bytes=10, response_bytes=20)
+    metrics.observe('approve_asset_request', 2, ClientError(status_code=503))
+
+    text = metrics.export_prometheus(prefix='connect')
+
+    assert '# TYPE connect_calls_total counter' in text
+    assert 'connect_calls_total{operation="approve_asset_request"} 2' in text
+    assert 'connect_errors_total{operation="approve_asset_request",status="503"} 1' in text
+    assert 'connect_request_bytes_total{operation="approve_asset_request"} 10' in text
+    assert 'connect_latency_seconds_bucket{operation="approve_asset_request",le="0.1"} 1' in text
+    assert 'connect_latency_seconds_bucket{operation="approve_asset_request",le="+Inf"} 2' in text
+    assert 'connect_latency_seconds_count{operation="approve_asset_request"} 2' in text
+    assert text.endswith('\n')
+
+
+def test_http_sizes_should_tolerate_missing_responses():
+    assert http_sizes(None) == (0, 0)
@@ -0,0 +1,195 @@
+import threading
+
+from connect.client import ClientError
+import pytest
+from rndi.connect.api_facades.outbox import BLOCKED, DONE, FAILED, PENDING, SENDING, SQLiteOutbox
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    return SQLiteOutbox(str(tmp_path / 'outbox.sqlite'), max_workers=4)
+
+
+def test_outbox_should_record_the_entries_in_order(outbox):
+    first = outbox.enqueue('PR-1', 'update_asset_request_parameters', {'parameters': [{'id': 'A', 'value': '1'}]})
+    second = outbox.enqueue('PR-1', 'approve_asset_request', {'template_id': 'TL-1'})
+
+    entries = outbox.pending()
+
+    assert second > first
+    assert [entry.seq for entry in entries] == [first, second]
+    assert entries[0].arguments == {'parameters': [{'id': 'A', 'value': '1'}]}
+    assert outbox.counts() == {PENDING: 2}
+
+
+def test_outbox_should_deliver_in_order_per_request_id(outbox):
+    lock = threading.Lock()
+    delivered = []
+
+    def deliver(entry):
+        with lock:
+            delivered.append((entry.request_id, entry.operation))
+
+    for request_id in ('PR-1', 'PR-2', 'PR-3'):
+        outbox.enqueue(request_id, 'update_asset_request_parameters', {})
+        outbox.enqueue(request_id, 'approve_asset_request', {})
+
+    assert outbox.drain(deliver) == 6
+    assert outbox.counts() == {DONE: 6}
+    for request_id in ('PR-1', 'PR-2', 'PR-3'):
+        assert [op for id_, op in delivered if id_ == request_id] == [
+            'update_asset_request_parameters',
+            'approve_asset_request',
+        ]
+
+
+def test_outbox_should_postpone_retryable_entries_blocking_the_next_ones(tmp_path):
+    clock = FakeClock()
+    outbox = SQLiteOutbox(str(tmp_path / 'outbox.sqlite'), backoff_base=1.0, clock=clock)
+    outbox.enqueue('PR-1', 'update_asset_request_parameters', {})
+    outbox.enqueue('PR-1', 'approve_asset_request', {})
+    outbox.enqueue('PR-2', 'approve_asset_request', {})
+
+    def throttled(entry):
+        if entry.request_id == 'PR-1':
+            raise ClientError(status_code=429)
+
+    assert outbox.drain(throttled) == 1
+    assert [entry.attempts for entry in outbox.pending()] == [1, 0]
+
+    clock.now += 0.5
+    assert outbox.drain(lambda entry: None) == 0
+
+    clock.now += 0.5
+    assert outbox.drain(throttled) == 0
+
+    clock.now += 1
+    assert outbox.drain(lambda entry: None) == 0
+    clock.now += 1
+    assert outbox.drain(lambda entry: None) == 2
+    assert outbox.counts() == {DONE: 3}
+
+
+def test_outbox_should_fail_non_retryable_entries(outbox):
+    outbox.enqueue('PR-1', 'approve_asset_request', {})
+
+    def rejected(entry):
+        raise ClientError(status_code=400, error_code='REQ_003', errors=['Invalid status.'])
+
+    assert outbox.drain(rejected) == 0
+    assert outbox.counts() == {FAILED: 1}
+
+
+def test_outbox_should_block_the_next_entries_of_a_failed_request(outbox):
+    outbox.enqueue('PR-1', 'update_asset_request_parameters', {})
+    outbox.enqueue('PR-1', 'approve_asset_request', {})
+    outbox.enqueue('PR-2', 'approve_asset_request', {})
+    delivered = []
+
+    def deliver(entry):
+        if entry.operation == 'update_asset_request_parameters':
+            raise ClientError(status_code=400, error_code='VAL_001', errors=['Invalid parameter.'])
+        delivered.append(entry.request_id)
+
+    assert outbox.drain(deliver) == 1
+    assert outbox.drain(deliver) == 0
+    assert delivered == ['PR-2']
+    assert outbox.counts() == {FAILED: 1, BLOCKED: 1, DONE: 1}
+
+
+def test_outbox_should_fail_the_entries_on_unexpected_errors(outbox):
+    outbox.enqueue('PR-1', 'update_asset_request_parameters', {})
+    outbox.enqueue('PR-1', 'approve_asset_request', {})
+
+    def broken(entry):
+        raise KeyError('request')
+
+    assert outbox.drain(broken) == 0
+    assert outbox.counts() == {FAILED: 1, BLOCKED: 1}
+
+
+def test_outbox_should_not_starve_the_due_requests_behind_postponed_ones(tmp_path):
+    clock = FakeClock()
+    outbox = SQLiteOutbox(str(tmp_path / 'outbox.sqlite'), batch_size=2, clock=clock)
+    for _ in range(3):
+        outbox.enqueue('PR-1', 'update_asset_request_parameters', {})
+    outbox.enqueue('PR-2', 'approve_asset_request', {})
+    delivered = []
+
+    def deliver(entry):
+        if entry.request_id == 'PR-1':
+            raise ClientError(status_code=503)
+        delivered.append(entry.request_id)
+
+    assert outbox.drain(deliver) == 0
+    assert outbox.drain(deliver) == 1
+    assert delivered == ['PR-2']
+    assert outbox.counts() == {PENDING: 3, DONE: 1}
+
+
+def test_outbox_should_deliver_each_entry_once_with_concurrent_drainers(tmp_path):
+    path = str(tmp_path / 'outbox.sqlite')
+    outboxes = [SQLiteOutbox(path, max_workers=2) for _ in range(4)]
+    for i in range(50):
+        outboxes[0].enqueue(f'PR-{i % 10}', 'approve_asset_request', {'n': i})
+
+    lock = threading.Lock()
+    delivered = []
+
+    def deliver(entry):
+        with lock:
+            delivered.append(entry.seq)
+
+    def drain(outbox):
+        while outbox.counts().get(PENDING) or outbox.counts().get(SENDING):
+            outbox.drain(deliver)
+
+    threads = [threading.Thread(target=drain, args=(outbox,)) for outbox in outboxes]
+    [thread.start() for thread in threads]
+    [thread.join(30) for thread in threads]
+
+    assert sorted(delivered) == sorted(set(delivered))
+    assert len(delivered) == 50
+    assert outboxes[0].counts() == {DONE: 50}
+
+
+def test_outbox_should_drain_in_background(outbox):
+    delivered = threading.Event()
+
+    outbox.start(lambda entry: delivered.set())
+    outbox.enqueue('PR-1', 'approve_asset_request', {})
+
+    try:
+        assert delivered.wait(5)
+    finally:
+        outbox.stop(5)
+
+
+def test_outbox_drainer_should_survive_failed_passes(outbox):
+    delivered = threading.Event()
+    claim, failures = outbox._claim, []
+
+    def flaky_claim():
+        if not failures:
+            failures.append(1)
+            raise RuntimeError('database is locked')
+        return claim()
+
+    outbox._claim = flaky_claim
+    outbox.poll_interval = 0.01
+    outbox.enqueue('PR-1', 'approve_asset_request', {})
+    outbox.start(lambda entry: delivered.set())
+
+    try:
+        assert delivered.wait(5)
+    finally:
+        outbox.stop(5)
+    assert failures == [1]
@@ -0,0 +1,105 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from connect.client import ConnectClient
+import pytest
+from rndi.connect.api_facades.pagination import aiterate, iterate
+
+
+def _add_pages(response, client, pages):
+    offset = 0
+    for page in pages:
+        end = offset + len(page) - 1
+        response.add(
+            'GET',
+            f'{client.endpoint}/requests',
+            json=page,
+            headers={'Content-Range': f'items {offset}-{end}/5'},
+        )
+        offset += len(page)
+
+
+@pytest.mark.parametrize('prefetch', [True, False])
+def test_iterate_should_page_through_the_resource_set(response, prefetch):
+    client = ConnectClient('Key', use_specs=False)
+    _add_pages(response, client, [
+        [{'id': 'PR-001'}, {'id': 'PR-002'}],
+        [{'id': 'PR-003'}, {'id': 'PR-004'}],
+        [{'id': 'PR-005'}],
+    ])
+
+    items = list(iterate(client.requests.filter(status='pending'), page_size=2, prefetch=prefetch))
+
+    assert [item['id'] for item in items] == ['PR-001', 'PR-002', 'PR-003', 'PR-004', 'PR-005']
+    assert len(response.calls) == 3
+    assert 'limit=2' in response.calls[1].request.url
+    assert 'offset=2' in response.calls[1].request.url
+    assert 'eq(status,pending)' in response.calls[0].request.url
+
+
+def test_iterate_should_prefetch_the_next_page_while_the_current_one_is_consumed(response):
+    client = ConnectClient('Key', use_specs=False)
+    _add_pages(response, client, [
+        [{'id': 'PR-001'}, {'id': 'PR-002'}],
+        [{'id': 'PR-003'}, {'id': 'PR-004'}],
+        [{'id': 'PR-005'}],
+    ])
+
+    iterator = iterate(client.requests.all(), page_size=2)
+    assert next(iterator)['id'] == 'PR-001'
+
+    response.assert_all_requests_are_fired = False
+    deadline = time.monotonic() + 5
+    while len(response.calls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert len(response.calls) == 2
+    iterator.close()
+
+
+def test_iterate_should_prefetch_on_the_given_executor(response):
+    client = ConnectClient('Key', use_specs=False)
+    _add_pages(response, client, [
+        [{'id': 'PR-001'}, {'id': 'PR-002'}],
+        [{'id': 'PR-003'}, {'id': 'PR-004'}],
+        [{'id': 'PR-005'}],
+    ])
+    threads = []
+
+    def call(fn):
+        threads.append(threading.current_thread().name)
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix='shared') as executor:
+        items = list(iterate(client.requests.all(), page_size=2, call=call, executor=executor))
+
+        assert len(items) == 5
+        assert threads[0] == threading.current_thread().name
+        assert all(name.startswith('shared') for name in threads[1:])
+        # the executor is not owned by the iteration, it is still usable.
+        assert executor.submit(lambda: 'alive').result() == 'alive'
+
+
+def test_iterate_should_reject_invalid_page_sizes():
+    client = ConnectClient('Key', use_specs=False)
+
+    with pytest.raises(ValueError):
+        next(iterate(client.requests.all(), page_size=0))
+
+
+@pytest.mark.parametrize('prefetch', [True, False])
+def test_aiterate_should_page_through_the_async_resource_set(async_client_factory, response_factory, prefetch):
+    client = async_client_factory([
+        response_factory(value=[{'id': 'PR-001'}, {'id': 'PR-002'}]),
+        response_factory(value=[{'id': 'PR-003'}, {'id': 'PR-004'}]),
+        response_factory(value=[]),
+    ])
+
+    async def collect():
+        return [item async for item in aiterate(client.requests.all(), page_size=2, prefetch=prefetch)]
+
+    items = asyncio.run(collect())
+
+    assert [item['id'] for item in items] == ['PR-001', 'PR-002', 'PR-003', 'PR-004']
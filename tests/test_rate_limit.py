@@ -0,0 +1,123 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import sqlite3
+import threading
+
+import pytest
+from rndi.connect.api_facades.rate_limit import RateLimiter, READ, SQLiteTokenBucket, TokenBucket, WRITE
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_should_allow_bursts_up_to_the_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+
+def test_token_bucket_should_refill_at_the_given_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, clock=clock)
+
+    bucket.reserve(2)
+    clock.now += 0.5
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_token_bucket_should_hand_out_every_token_once_across_threads():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=100, clock=clock)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        waits = list(executor.map(lambda _: bucket.reserve(), range(150)))
+
+    assert waits.count(0.0) == 100
+    assert sorted(waits)[-1] == pytest.approx(50)
+
+
+def test_token_bucket_should_reject_invalid_rates():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, capacity=0)
+
+
+def test_sqlite_token_bucket_should_share_the_budget_between_instances(tmp_path):
+    clock = FakeClock()
+    path = str(tmp_path / 'buckets.sqlite')
+
+    worker_a = SQLiteTokenBucket(path, rate=10, capacity=2, clock=clock)
+    worker_b = SQLiteTokenBucket(path, rate=10, capacity=2, clock=clock)
+    other = SQLiteTokenBucket(path, rate=10, capacity=2, name='other', clock=clock)
+
+    assert worker_a.reserve() == 0.0
+    assert worker_b.reserve() == 0.0
+    assert worker_a.reserve() == pytest.approx(0.1)
+    assert other.reserve() == 0.0
+
+    clock.now += 1
+
+    assert worker_b.reserve() == 0.0
+
+
+def test_rate_limiter_should_use_separate_read_and_write_budgets():
+    clock = FakeClock()
+    read = TokenBucket(rate=1, capacity=1, clock=clock)
+    write = TokenBucket(rate=1, capacity=1, clock=clock)
+    limiter = RateLimiter(read=read, write=write)
+
+    limiter.acquire(READ)
+    limiter.acquire(WRITE)
+    asyncio.run(RateLimiter(write=write).acquire_async(READ))
+
+    assert read.reserve() > 0
+    assert write.reserve() > 0
+
+
+def test_sqlite_token_bucket_should_not_block_the_event_loop_while_reserving(tmp_path):
+    bucket = SQLiteTokenBucket(str(tmp_path / 'buckets.sqlite'), rate=100, capacity=100)
+    loop_threads = []
+
+    def reserve(tokens=1):
+        loop_threads.append(threading.current_thread())
+        return SQLiteTokenBucket.reserve(bucket, tokens)
+
+    bucket.reserve = reserve
+
+    async def run():
+        await asyncio.gather(*[bucket.acquire_async() for _ in range(5)])
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+
+    assert len(loop_threads) == 5
+    assert loop_thread not in loop_threads
+
+
+def test_sqlite_token_bucket_should_close_its_connections(tmp_path):
+    connections = []
+
+    class RecordingBucket(SQLiteTokenBucket):
+        def _connect(self):
+            connections.append(super()._connect())
+            return connections[-1]
+
+    bucket = RecordingBucket(str(tmp_path / 'buckets.sqlite'), rate=10, capacity=2)
+    bucket.reserve()
+
+    assert len(connections) == 2
+    for connection in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute('SELECT 1')
@@ -0,0 +1,112 @@
+import asyncio
+
+from connect.client import ClientError
+import pytest
+from requests import HTTPError, Response
+from rndi.connect.api_facades.retry import retry_after, RetryPolicy
+
+
+def _client_error(status_code, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+
+    error = ClientError(status_code=status_code)
+    error.__cause__ = HTTPError(response=response)
+    return error
+
+
+def _failing(errors, result='done'):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return result
+
+    return fn, calls
+
+
+def test_retry_policy_should_retry_retryable_errors_until_success():
+    sleeps = []
+    policy = RetryPolicy(max_attempts=3, sleep=sleeps.append, jitter=False, backoff_base=0.5)
+    fn, calls = _failing([_client_error(503), _client_error(429)])
+
+    assert policy.call(fn) == 'done'
+    assert len(calls) == 3
+    assert sleeps == [0.5, 1.0]
+
+
+def test_retry_policy_should_raise_once_the_attempts_are_exhausted():
+    policy = RetryPolicy(max_attempts=2, sleep=lambda s: None)
+    fn, calls = _failing([_client_error(503), _client_error(503), _client_error(503)])
+
+    with pytest.raises(ClientError):
+        policy.call(fn)
+
+    assert len(calls) == 2
+
+
+def test_retry_policy_should_not_retry_non_retryable_errors():
+    policy = RetryPolicy(sleep=lambda s: None)
+    fn, calls = _failing([_client_error(400)])
+
+    with pytest.raises(ClientError):
+        policy.call(fn)
+
+    assert len(calls) == 1
+
+
+def test_retry_policy_should_retry_non_idempotent_calls_only_when_throttled():
+    policy = RetryPolicy(sleep=lambda s: None)
+
+    fn, calls = _failing([_client_error(503)])
+    with pytest.raises(ClientError):
+        policy.call(fn, idempotent=False)
+    assert len(calls) == 1
+
+    fn, calls = _failing([_client_error(429)])
+    assert policy.call(fn, idempotent=False) == 'done'
+    assert len(calls) == 2
+
+
+def test_retry_policy_should_honor_the_retry_after_header():
+    policy = RetryPolicy(backoff_cap=10)
+
+    assert retry_after(_client_error(429, {'Retry-After': '3'})) == 3.0
+    assert retry_after(_client_error(429)) is None
+    assert retry_after(_client_error(429, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0.0
+    assert policy.delay(_client_error(429, {'Retry-After': '3'}), 1) == 3.0
+    assert policy.delay(_client_error(429, {'Retry-After': '120'}), 1) == 10
+
+
+def test_retry_policy_should_apply_full_jitter_to_the_capped_backoff():
+    policy = RetryPolicy(backoff_base=1, backoff_cap=5, uniform=lambda low, high: (low, high))
+
+    assert policy.delay(_client_error(503), 1) == (0, 1)
+    assert policy.delay(_client_error(503), 3) == (0, 4)
+    assert policy.delay(_client_error(503), 10) == (0, 5)
+
+
+def test_retry_policy_should_reject_invalid_max_attempts():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_retry_policy_should_retry_coroutines():
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    policy = RetryPolicy(async_sleep=sleep, jitter=False, backoff_base=0.25)
+    errors = [_client_error(502)]
+
+    async def fn():
+        if errors:
+            raise errors.pop(0)
+        return 'done'
+
+    assert asyncio.run(policy.call_async(fn)) == 'done'
+    assert sleeps == [0.25]
@@ -0,0 +1,139 @@
+import threading
+
+import pytest
+from rndi.connect.api_facades.scheduler import (
+    BULK,
+    CRITICAL,
+    DeadlineExceeded,
+    INTERACTIVE,
+    OperationScheduler,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _blocked(scheduler):
+    # occupies the single worker until the returned event is set.
+    started, release = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    scheduler.submit(block, priority=CRITICAL)
+    started.wait(5)
+    return release
+
+
+def test_scheduler_should_dispatch_by_priority_class_first():
+    dispatched = []
+
+    with OperationScheduler(max_workers=1) as scheduler:
+        release = _blocked(scheduler)
+        futures = [
+            scheduler.submit(dispatched.append, 'bulk', priority=BULK),
+            scheduler.submit(dispatched.append, 'interactive', priority=INTERACTIVE),
+            scheduler.submit(dispatched.append, 'critical', priority=CRITICAL),
+        ]
+        release.set()
+        [future.result(5) for future in futures]
+
+    assert dispatched == ['critical', 'interactive', 'bulk']
+
+
+def test_scheduler_should_dispatch_earliest_deadline_first_inside_a_class():
+    dispatched = []
+
+    with OperationScheduler(max_workers=1) as scheduler:
+        release = _blocked(scheduler)
+        futures = [
+            scheduler.submit(dispatched.append, 'none', priority=BULK),
+            scheduler.submit(dispatched.append, 'late', priority=BULK, deadline=60),
+            scheduler.submit(dispatched.append, 'early', priority=BULK, deadline=30),
+        ]
+        release.set()
+        [future.result(5) for future in futures]
+
+    assert dispatched == ['early', 'late', 'none']
+
+
+def test_scheduler_should_drop_the_operations_whose_deadline_passed():
+    clock = FakeClock()
+    called = []
+
+    with OperationScheduler(max_workers=1, clock=clock) as scheduler:
+        release = _blocked(scheduler)
+        expired = scheduler.submit(called.append, 'expired', priority=INTERACTIVE, deadline=1)
+        on_time = scheduler.submit(called.append, 'on time', priority=INTERACTIVE, deadline=10)
+        clock.now = 5
+        release.set()
+
+        with pytest.raises(DeadlineExceeded):
+            expired.result(5)
+        on_time.result(5)
+
+    assert called == ['on time']
+    assert scheduler.stats()[INTERACTIVE]['dropped'] == 1
+
+
+def test_scheduler_should_expose_the_stats_per_class():
+    with OperationScheduler(max_workers=2) as scheduler:
+        futures = [scheduler.submit(lambda value: value * 2, i, priority=BULK) for i in range(5)]
+        assert [future.result(5) for future in futures] == [0, 2, 4, 6, 8]
+
+    stats = scheduler.stats()
+    assert stats[BULK]['submitted'] == 5
+    assert stats[BULK]['completed'] == 5
+    assert stats[BULK]['queued'] == 0
+    assert stats[BULK]['wait']['count'] == 5
+    assert stats[CRITICAL]['submitted'] == 0
+
+
+def test_scheduler_should_propagate_the_operation_errors():
+    def fail():
+        raise ValueError('boom')
+
+    with OperationScheduler() as scheduler:
+        future = scheduler.submit(fail)
+
+        with pytest.raises(ValueError):
+            future.result(5)
+
+
+@pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+def test_scheduler_should_resolve_the_future_and_replace_the_worker_on_base_exceptions():
+    def stop():
+        raise SystemExit(1)
+
+    with OperationScheduler(max_workers=1) as scheduler:
+        release = _blocked(scheduler)
+        stopped = scheduler.submit(stop)
+        queued = scheduler.submit(lambda: 'queued')
+        release.set()
+
+        with pytest.raises(SystemExit):
+            stopped.result(5)
+        assert queued.result(5) == 'queued'
+        assert scheduler.submit(lambda: 'replaced').result(5) == 'replaced'
+
+    assert scheduler.stats()[BULK]['running'] == 0
+
+
+def test_scheduler_should_reject_unknown_priority_classes():
+    with OperationScheduler() as scheduler:
+        with pytest.raises(ValueError):
+            scheduler.submit(print, priority='urgent')
+
+
+def test_scheduler_should_reject_submissions_after_shutdown():
+    scheduler = OperationScheduler()
+    scheduler.shutdown()
+
+    with pytest.raises(RuntimeError):
+        scheduler.submit(print)
@@ -0,0 +1,103 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+from connect.client import ClientError
+import pytest
+from rndi.connect.api_facades.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_should_share_one_call_between_concurrent_callers():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {'id': 'AS-0000-0000-0000', 'params': []}
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(single_flight.do, ('asset', 'AS-0000-0000-0000'), fetch) for _ in range(5)]
+        started.wait(5)
+        while single_flight._calls[('asset', 'AS-0000-0000-0000')].waiters < 4:
+            pass
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result == {'id': 'AS-0000-0000-0000', 'params': []} for result in results)
+    assert len({id(result) for result in results}) == 5
+    assert len(single_flight) == 0
+
+
+def test_single_flight_should_propagate_errors_to_every_waiter():
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        started.set()
+        release.wait(5)
+        raise ClientError(status_code=404)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(single_flight.do, 'key', fetch)
+        started.wait(5)
+        waiter = executor.submit(single_flight.do, 'key', fetch)
+        while single_flight._calls['key'].waiters == 0:
+            pass
+        release.set()
+
+        for future in (leader, waiter):
+            with pytest.raises(ClientError):
+                future.result()
+
+
+def test_single_flight_should_not_share_sequential_calls():
+    single_flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return len(calls)
+
+    assert single_flight.do('key', fetch) == 1
+    assert single_flight.do('key', fetch) == 2
+
+
+def test_async_single_flight_should_share_one_call_between_concurrent_tasks():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {'id': 'PR-0000-0000-0000-001'}
+
+    async def run():
+        return await asyncio.gather(*[
+            single_flight.do(('asset_request', 'PR-0000-0000-0000-001'), fetch) for _ in range(10)
+        ])
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(result == {'id': 'PR-0000-0000-0000-001'} for result in results)
+
+
+def test_async_single_flight_should_propagate_errors_to_every_waiter():
+    single_flight = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise ClientError(status_code=404)
+
+    async def run():
+        return await asyncio.gather(*[single_flight.do('key', fetch) for _ in range(3)], return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, ClientError) for result in results)
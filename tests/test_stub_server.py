@@ -0,0 +1,115 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from connect.client import ClientError, ConnectClient
+import pytest
+from loadtest.generator import percentile
+from loadtest.stub_server import latency_distribution, StubServer
+
+
+@pytest.fixture
+def stub():
+    server = StubServer()
+    server.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_stub_server_should_serve_any_asset_request(stub):
+    client = ConnectClient('ApiKey', endpoint=stub.endpoint, use_specs=False, max_retries=0)
+
+    request = client.requests['PR-0000-0000-0000-001'].get()
+
+    assert request['id'] == 'PR-0000-0000-0000-001'
+    assert request['status'] == 'pending'
+    assert client.assets['AS-0000-0000-0000'].get()['id'] == 'AS-0000-0000-0000'
+
+
+def test_stub_server_should_keep_the_transitions_and_parameter_updates(stub):
+    client = ConnectClient('ApiKey', endpoint=stub.endpoint, use_specs=False, max_retries=0)
+
+    client.requests['PR-0000-0000-0000-001'].update(payload={'asset': {'params': [{'id': 'ORDER_TYPE', 'value': 'X'}]}})
+    client.requests['PR-0000-0000-0000-001']('approve').post(payload={'template_id': 'TL-000-000-000'})
+
+    request = client.requests['PR-0000-0000-0000-001'].get()
+
+    assert request['status'] == 'approved'
+    assert {'id': 'ORDER_TYPE', 'value': 'X'}.items() <= next(
+        param for param in request['asset']['params'] if param['id'] == 'ORDER_TYPE'
+    ).items()
+
+    with pytest.raises(ClientError) as e:
+        client.requests['PR-0000-0000-0000-001']('fail').post(payload={'reason': 'Failed.'})
+
+    assert e.value.status_code == 400
+    assert e.value.error_code == 'REQ_003'
+
+
+def test_stub_server_should_serve_tier_configuration_requests(stub):
+    client = ConnectClient('ApiKey', endpoint=stub.endpoint, use_specs=False, max_retries=0)
+
+    client.ns('tier').config_requests['TCR-000-000-000-001']('inquire').post(payload={})
+
+    assert client.ns('tier').config_requests['TCR-000-000-000-001'].get()['status'] == 'inquiring'
+
+
+def test_stub_server_should_inject_throttling_errors(stub):
+    stub.throttle_rate = 1.0
+    client = ConnectClient('ApiKey', endpoint=stub.endpoint, use_specs=False, max_retries=0)
+
+    with pytest.raises(ClientError) as e:
+        client.assets['AS-0000-0000-0000'].get()
+
+    assert e.value.status_code == 429
+    assert client.response.headers['Retry-After'] == '1'
+
+
+def test_latency_distributions_should_be_parsed_from_the_spec():
+    assert latency_distribution('fixed:0.5')() == 0.5
+    assert 0.1 <= latency_distribution('uniform:0.1,0.2')() <= 0.2
+    assert latency_distribution('exponential:0.01')() >= 0
+
+    with pytest.raises(ValueError):
+        latency_distribution('gaussian:1')
+
+
+def test_percentile_should_use_the_nearest_rank():
+    values = [float(i) for i in range(1, 101)]
+
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_stub_server_should_answer_conditional_gets(stub):
+    client = ConnectClient('ApiKey', endpoint=stub.endpoint, use_specs=False, max_retries=0)
+
+    client.assets['AS-0000-0000-0000'].get()
+    etag = client.response.headers['ETag']
+    last_modified = client.response.headers['Last-Modified']
+
+    client.assets['AS-0000-0000-0000'].get(headers={'If-None-Match': etag})
+    assert client.response.status_code == 304
+
+    client.assets['AS-0000-0000-0000'].get(headers={'If-Modified-Since': last_modified})
+    assert client.response.status_code == 304
+
+    client.assets['AS-0000-0000-0000'].get(headers={'If-None-Match': '"other"'})
+    assert client.response.status_code == 200
+    assert stub.not_modified == 2
+
+
+def test_stub_server_should_count_every_concurrent_conditional_get(stub):
+    client = ConnectClient('ApiKey', endpoint=stub.endpoint, use_specs=False, max_retries=0)
+    client.assets['AS-0000-0000-0000'].get()
+    etag = client.response.headers['ETag']
+
+    def read(_):
+        worker = ConnectClient('ApiKey', endpoint=stub.endpoint, use_specs=False, max_retries=0)
+        for _ in range(10):
+            worker.assets['AS-0000-0000-0000'].get(headers={'If-None-Match': etag})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(read, range(8)))
+
+    assert stub.not_modified == 80
@@ -1,8 +1,10 @@
 import os
 
 import pytest
-from connect.client import ClientError
+from connect.client import ClientError, ConnectClient
 from rndi.connect.business_objects.adapters import Request, TierConfiguration
+from rndi.connect.api_facades.cache import EntityCache
+from rndi.connect.api_facades.coalescing import ParameterUpdateCoalescer
 from rndi.connect.api_facades.facade import ConnectOpenAPIFacade
 
 BAD_REQUEST_400 = '400 Bad Request'
@@ -498,3 +500,196 @@ def test_tier_configuration_service_should_inquire_an_tier_configuration_request
     assert request.id() == tcr_id
     assert request.tier_configuration().id() == tc_id
     assert request.status() == 'inquiring'
+
+
+def test_tier_configuration_service_should_retrieve_a_cached_tier_configuration(
+        sync_client_factory,
+        response_factory,
+):
+    tier_configuration = TierConfiguration()
+    tier_configuration.with_id('TC-0000-0000-0000')
+
+    client = sync_client_factory([
+        response_factory(value=tier_configuration.raw(), status=200),
+    ])
+
+    cache = EntityCache()
+    api = ConnectOpenAPIFacade(client, cache=cache)
+
+    api.find_tier_configuration('TC-0000-0000-0000')
+    tier_configuration = api.find_tier_configuration('TC-0000-0000-0000')
+
+    assert tier_configuration.id() == 'TC-0000-0000-0000'
+    assert cache.stats.hits == 1
+
+
+def test_tier_configuration_service_should_invalidate_the_cache_on_fail(
+        sync_client_factory,
+        response_factory,
+):
+    tier_configuration = TierConfiguration()
+    tier_configuration.with_id('TC-0000-0000-0000')
+
+    request = Request()
+    request.with_id('TCR-0000-0000-0000-001')
+    request.with_status('pending')
+    request.with_tier_configuration(tier_configuration)
+
+    client = sync_client_factory([
+        response_factory(value=tier_configuration.raw(), status=200),
+        response_factory(value=request.raw(), status=200),
+    ])
+
+    cache = EntityCache()
+    api = ConnectOpenAPIFacade(client, cache=cache)
+
+    api.find_tier_configuration('TC-0000-0000-0000')
+    api.fail_tier_configuration_request(request, 'Get better')
+
+    assert len(cache) == 0
+
+
+def test_tier_configuration_service_should_approve_many_tier_configuration_requests(response):
+    client = ConnectClient('Key', use_specs=False)
+
+    requests = []
+    for i in range(1, 4):
+        request = Request()
+        request.with_id(f'TCR-0000-0000-0000-00{i}')
+        request.with_status('pending')
+        request.with_tier_configuration(TierConfiguration())
+        requests.append(request.raw())
+
+        response.add(
+            'POST',
+            f'{client.endpoint}/tier/config-requests/TCR-0000-0000-0000-00{i}/approve',
+            json=request.raw(),
+            status=200,
+        )
+
+    report = ConnectOpenAPIFacade(client).approve_tier_configuration_requests(
+        requests,
+        'TL-000-000-001',
+        max_workers=3,
+    )
+
+    assert len(report.succeeded) == 3
+    assert [item.result.status() for item in report] == ['approved'] * 3
+
+
+def test_tier_configuration_service_should_iterate_tier_configurations_lazily(
+        sync_client_factory,
+        response_factory,
+):
+    tier_configuration = TierConfiguration()
+    tier_configuration.with_id('TC-0000-0000-0000')
+
+    client = sync_client_factory([
+        response_factory(value=[tier_configuration.raw()]),
+    ])
+
+    tier_configurations = list(ConnectOpenAPIFacade(client).iter_tier_configurations(
+        product__id='PRD-000-000-000',
+        prefetch=False,
+    ))
+
+    assert len(tier_configurations) == 1
+    assert isinstance(tier_configurations[0], TierConfiguration)
+    assert tier_configurations[0].id() == 'TC-0000-0000-0000'
+
+
+def test_tier_configuration_service_should_skip_the_parameters_update_when_nothing_changes(
+        sync_client_factory,
+        load_json,
+):
+    client = sync_client_factory([])
+
+    request = Request(load_json(os.path.dirname(__file__) + TIER_CONFIG_REQUEST_FILE))
+    tier_configuration = request.tier_configuration()
+    tier_configuration.with_param('sub_reseller_account_id', 'TA-0000-0000-0000')
+    request.with_tier_configuration(tier_configuration)
+
+    updated = ConnectOpenAPIFacade(client).update_tier_configuration_request_parameters(
+        request,
+        [{'id': 'sub_reseller_account_id', 'value': 'TA-0000-0000-0000'}],
+        diff=True,
+    )
+
+    assert updated.tier_configuration().param('sub_reseller_account_id', 'value') == 'TA-0000-0000-0000'
+
+
+def test_tier_configuration_service_should_send_buffered_parameter_updates_on_flush(
+        sync_client_factory,
+        response_factory,
+        load_json,
+):
+    request = Request(load_json(os.path.dirname(__file__) + TIER_CONFIG_REQUEST_FILE))
+
+    client = sync_client_factory([
+        response_factory(value=request.raw(), status=200),
+    ])
+
+    api = ConnectOpenAPIFacade(client, parameter_coalescer=ParameterUpdateCoalescer(window=None))
+
+    future = api.update_tier_configuration_request_parameters(
+        request,
+        [{'id': 'sub_reseller_account_id', 'value': 'TA-0000-0000-0000'}],
+        on_success=lambda req: req.id(),
+    )
+
+    assert not future.done()
+
+    api.flush_parameter_updates()
+
+    assert future.result() == request.id()
+
+
+def test_tier_configuration_service_should_skip_the_inquiry_of_an_inquiring_request(sync_client_factory):
+    client = sync_client_factory([])
+
+    request = Request()
+    request.with_id('TCR-000-000-000-001')
+    request.with_status('inquiring')
+
+    inquired = ConnectOpenAPIFacade(client, transition_guard='known').inquire_tier_configuration_request(request)
+
+    assert inquired.status() == 'inquiring'
+
+
+def test_tier_configuration_service_should_fetch_the_tier_configuration_request_context(response, load_json):
+    client = ConnectClient('Key', use_specs=False, max_retries=0)
+
+    raw = load_json(os.path.dirname(__file__) + TIER_CONFIG_REQUEST_FILE)
+    raw['configuration']['tier_level'] = 2
+    parent = {'id': 'TC-000-000-001', 'tier_level': 1}
+
+    response.add('GET', f"{client.endpoint}/tier/config-requests/{raw['id']}", json=raw)
+    response.add('GET', f"{client.endpoint}/tiers/{raw['configuration']['id']}", json=raw['configuration'])
+    response.add('GET', f'{client.endpoint}/tier/configs', json=[parent])
+
+    context = ConnectOpenAPIFacade(client).find_tier_configuration_request_context(raw['id'])
+
+    assert context.request.id() == raw['id']
+    assert context.tier_configuration.id() == raw['configuration']['id']
+    assert context.parent.id() == 'TC-000-000-001'
+
+
+def test_tier_configuration_service_should_re_read_the_status_before_failing_with_a_strict_guard(response, load_json):
+    client = ConnectClient('Key', use_specs=False, max_retries=0)
+
+    raw = load_json(os.path.dirname(__file__) + TIER_CONFIG_REQUEST_FILE)
+    current = dict(raw, status='failed')
+
+    response.add('GET', f"{client.endpoint}/tier/config-requests/{raw['id']}", json=current)
+
+    request = Request(raw)
+    request.with_status('pending')
+
+    failed = ConnectOpenAPIFacade(client, transition_guard='strict').fail_tier_configuration_request(
+        request,
+        'Failure reason.',
+    )
+
+    assert failed.status() == 'failed'
+    assert len(response.calls) == 1
+    assert response.calls[0].request.url.startswith(f"{client.endpoint}/tier/config-requests/{raw['id']}?")
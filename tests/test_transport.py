@@ -0,0 +1,81 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from connect.client import AsyncConnectClient, ConnectClient
+import pytest
+from loadtest.stub_server import StubServer
+from rndi.connect.api_facades.transport import AsyncHTTPTransport, HTTPTransport, TransportSettings
+
+
+@pytest.fixture
+def stub():
+    server = StubServer()
+    server.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_transport_should_reuse_the_connections_between_calls(stub):
+    transport = HTTPTransport(TransportSettings(connect_timeout=1, read_timeout=5))
+    client = transport.bind(ConnectClient('ApiKey', endpoint=stub.endpoint, use_specs=False, max_retries=0))
+
+    for _ in range(3):
+        client.assets['AS-0000-0000-0000'].get()
+
+    stats = transport.stats()
+
+    assert client.timeout == (1, 5)
+    assert stats['requests'] == 3
+    assert stats['new_connections'] == 1
+    assert stats['in_use'] == 0
+
+
+def test_http_transport_should_share_the_pool_between_threads(stub):
+    transport = HTTPTransport(TransportSettings(pool_size=2, max_connections=2))
+    client = ConnectClient('ApiKey', endpoint=stub.endpoint, use_specs=False, max_retries=0)
+
+    def find(index):
+        return transport.bind(client).assets[f'AS-0000-0000-{index:04d}'].get()['id']
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        ids = list(executor.map(find, range(24)))
+
+    stats = transport.stats()
+
+    assert len(ids) == 24
+    assert stats['requests'] == 24
+    assert stats['new_connections'] <= 2
+    assert stats['max_in_use'] <= 2
+
+
+def test_http_transport_should_close_the_connections_without_keep_alive(stub):
+    transport = HTTPTransport(TransportSettings(keep_alive=False))
+    client = transport.bind(ConnectClient('ApiKey', endpoint=stub.endpoint, use_specs=False, max_retries=0))
+
+    client.assets['AS-0000-0000-0000'].get()
+
+    assert client._session.headers['Connection'] == 'close'
+
+
+def test_transport_settings_should_reject_invalid_pool_sizes():
+    with pytest.raises(ValueError):
+        TransportSettings(pool_size=0)
+
+    with pytest.raises(ValueError):
+        TransportSettings(max_connections=0)
+
+
+def test_async_http_transport_should_bind_the_shared_session(stub):
+    transport = AsyncHTTPTransport(TransportSettings(pool_size=4))
+    client = transport.bind(AsyncConnectClient('ApiKey', endpoint=stub.endpoint, use_specs=False, max_retries=0))
+
+    async def find():
+        try:
+            return await client.assets['AS-0000-0000-0000'].get()
+        finally:
+            await transport.close()
+
+    assert asyncio.run(find())['id'] == 'AS-0000-0000-0000'
+    assert client._session is transport.session
+    assert transport.stats()['in_use'] == 0
@@ -0,0 +1,206 @@
+import asyncio
+import threading
+
+from connect.client import ClientError
+import pytest
+from rndi.connect.api_facades.unit_of_work import AsyncUnitOfWork, UnitOfWork
+
+
+class RecordingFacade:
+    def __init__(self, failing=()):
+        self.failing = failing
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _record(self, operation, request, **arguments):
+        with self.lock:
+            self.calls.append((operation, request.id(), arguments))
+        if (operation, request.id()) in self.failing:
+            raise ClientError('Bad Request', status_code=400, error_code='REQ_001')
+        return threading.current_thread().name
+
+    def update_asset_request_parameters(self, request, parameters, on_error=None, on_success=None, diff=None):
+        return self._record('update_asset_request_parameters', request, parameters=parameters)
+
+    def approve_asset_request(
+            self,
+            request,
+            template_id,
+            activation_tile=None,
+            effective_date=None,
+            on_error=None,
+            on_success=None,
+    ):
+        return self._record('approve_asset_request', request, template_id=template_id)
+
+    def fail_asset_request(self, request, reason, on_error=None, on_success=None):
+        return self._record('fail_asset_request', request, reason=reason)
+
+    def inquire_tier_configuration_request(self, request, on_error=None, on_success=None):
+        return self._record('inquire_tier_configuration_request', request)
+
+
+class AsyncRecordingFacade(RecordingFacade):
+    async def update_asset_request_parameters(self, request, parameters, on_error=None, on_success=None, diff=None):
+        return self._record('update_asset_request_parameters', request, parameters=parameters)
+
+    async def approve_asset_request(
+            self,
+            request,
+            template_id,
+            activation_tile=None,
+            effective_date=None,
+            on_error=None,
+            on_success=None,
+    ):
+        await asyncio.sleep(0)
+        return self._record('approve_asset_request', request, template_id=template_id)
+
+
+def _of(calls, request_id):
+    return [(operation, arguments) for operation, id_, arguments in calls if id_ == request_id]
+
+
+def test_unit_of_work_should_collapse_the_recorded_calls_per_request():
+    uow = UnitOfWork(RecordingFacade())
+    uow.update_asset_request_parameters({'id': 'PR-1'}, [{'id': 'A', 'value': '1'}, {'id': 'B', 'value': '1'}])
+    uow.approve_asset_request({'id': 'PR-1'}, 'TL-1')
+    uow.update_asset_request_parameters({'id': 'PR-1'}, [{'id': 'A', 'value': '2'}])
+    uow.fail_asset_request({'id': 'PR-1'}, 'Out of stock.')
+
+    plan = uow.plan()
+
+    assert len(plan) == 1
+    update, transition = plan[0]
+    assert update.operation == 'update_asset_request_parameters'
+    assert update.arguments == {'parameters': [{'id': 'A', 'value': '2'}, {'id': 'B', 'value': '1'}]}
+    assert update.recorded == 2
+    assert transition.operation == 'fail_asset_request'
+    assert transition.arguments == {'reason': 'Out of stock.'}
+    assert transition.recorded == 2
+
+
+def test_unit_of_work_should_forward_the_callbacks_of_the_recorded_calls():
+    def on_error(error):
+        return error
+
+    def on_success(request):
+        return request
+
+    uow = UnitOfWork(RecordingFacade())
+    uow.update_asset_request_parameters({'id': 'PR-1'}, [{'id': 'A', 'value': '1'}], on_success=on_success, diff=True)
+    uow.update_asset_request_parameters({'id': 'PR-1'}, [{'id': 'B', 'value': '1'}], on_success=on_success, diff=True)
+    uow.approve_asset_request({'id': 'PR-1'}, 'TL-1', on_error=on_error)
+
+    update, approval = uow.plan()[0]
+
+    assert update.arguments == {
+        'parameters': [{'id': 'A', 'value': '1'}, {'id': 'B', 'value': '1'}],
+        'on_success': on_success,
+        'diff': True,
+    }
+    assert approval.arguments['on_error'] is on_error
+    assert 'on_success' not in approval.arguments
+
+
+@pytest.mark.parametrize('options', [{'on_success': str}, {'on_error': str}, {'diff': False}])
+def test_unit_of_work_should_reject_merged_updates_with_different_callbacks(options):
+    uow = UnitOfWork(RecordingFacade())
+    uow.update_asset_request_parameters({'id': 'PR-1'}, [{'id': 'A', 'value': '1'}], diff=True)
+
+    with pytest.raises(ValueError):
+        uow.update_asset_request_parameters({'id': 'PR-1'}, [{'id': 'B', 'value': '1'}], **{'diff': True, **options})
+
+    assert uow.plan()[0][0].arguments['parameters'] == [{'id': 'A', 'value': '1'}]
+
+
+def test_unit_of_work_should_flush_on_its_own_pool_sized_by_max_workers():
+    api = RecordingFacade()
+    # passes only once 12 requests are sent at the same time, more than the facade pool size.
+    barrier = threading.Barrier(12, timeout=5)
+
+    def fail_asset_request(request, reason, on_error=None, on_success=None):
+        barrier.wait()
+        return threading.current_thread().name
+
+    api.fail_asset_request = fail_asset_request
+
+    with UnitOfWork(api, max_workers=12) as uow:
+        for i in range(24):
+            uow.fail_asset_request({'id': f'PR-{i}'}, 'Out of stock.')
+
+    assert [item.request_id for item in uow.report] == [f'PR-{i}' for i in range(24)]
+    assert all(item.result.startswith('connect-unit-of-work') for item in uow.report)
+    assert uow._executor is None
+
+
+def test_unit_of_work_should_send_the_parameter_updates_before_the_transition():
+    api = RecordingFacade()
+
+    with UnitOfWork(api, max_workers=4) as uow:
+        for i in range(10):
+            uow.approve_asset_request({'id': f'PR-{i}'}, 'TL-1')
+            uow.update_asset_request_parameters({'id': f'PR-{i}'}, [{'id': 'A', 'value': str(i)}])
+
+    assert len(api.calls) == 20
+    for i in range(10):
+        assert [operation for operation, _ in _of(api.calls, f'PR-{i}')] == [
+            'update_asset_request_parameters',
+            'approve_asset_request',
+        ]
+    assert len(uow.report) == 20
+    assert [item.request_id for item in uow.report][:2] == ['PR-0', 'PR-0']
+    assert len(uow) == 0
+
+
+def test_unit_of_work_should_skip_the_transition_if_the_parameters_update_fails():
+    api = RecordingFacade(failing=[('update_asset_request_parameters', 'PR-1')])
+
+    with UnitOfWork(api) as uow:
+        uow.update_asset_request_parameters({'id': 'PR-1'}, [{'id': 'A', 'value': '1'}])
+        uow.approve_asset_request({'id': 'PR-1'}, 'TL-1')
+        uow.approve_asset_request({'id': 'PR-2'}, 'TL-1')
+
+    update, approval = uow.report.of('PR-1')
+    assert isinstance(update.error, ClientError)
+    assert approval.skipped
+    assert approval.error is update.error
+    assert [item.request_id for item in uow.report.succeeded] == ['PR-2']
+    assert ('approve_asset_request', 'PR-1', {'template_id': 'TL-1'}) not in api.calls
+
+
+def test_unit_of_work_should_not_send_anything_if_the_block_fails():
+    api = RecordingFacade()
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(api) as uow:
+            uow.inquire_tier_configuration_request({'id': 'TCR-1'})
+            raise RuntimeError('handler failure')
+
+    assert api.calls == []
+    assert uow.report is None
+
+
+def test_async_unit_of_work_should_send_the_collapsed_plan():
+    api = AsyncRecordingFacade()
+
+    async def run():
+        async with AsyncUnitOfWork(api, max_workers=2) as uow:
+            for i in range(5):
+                uow.approve_asset_request({'id': f'PR-{i}'}, 'TL-1')
+                uow.update_asset_request_parameters({'id': f'PR-{i}'}, [{'id': 'A', 'value': str(i)}])
+        return uow.report
+
+    report = asyncio.run(run())
+
+    assert len(report.succeeded) == 10
+    for i in range(5):
+        assert [operation for operation, _ in _of(api.calls, f'PR-{i}')] == [
+            'update_asset_request_parameters',
+            'approve_asset_request',
+        ]
+
+
+def test_unit_of_work_should_fail_on_invalid_max_workers():
+    with pytest.raises(ValueError):
+        UnitOfWork(RecordingFacade(), max_workers=0)
@@ -0,0 +1,69 @@
+import os
+import pickle
+
+import pytest
+from rndi.connect.api_facades.views import ASSET_REQUEST, RequestView, TIER_CONFIGURATION_REQUEST
+
+
+class FakeFacade:
+    def find_asset_request(self, request_id):
+        return ASSET_REQUEST, request_id
+
+    def find_tier_configuration_request(self, request_id):
+        return TIER_CONFIGURATION_REQUEST, request_id
+
+
+def test_request_view_should_project_an_asset_request(load_json):
+    raw = load_json(os.path.dirname(__file__) + '/request_asset.json')
+
+    view = RequestView.from_asset_request(raw, ['CATEGORIES', 'UNKNOWN'])
+
+    assert view.kind == ASSET_REQUEST
+    assert view.id == raw['id']
+    assert view.status == raw['status']
+    assert view.type == raw['type']
+    assert view.asset_id == raw['asset']['id']
+    assert view.product_id == raw['asset']['product']['id']
+    assert view.tier_id('customer') == raw['asset']['tiers']['customer']['id']
+    assert view.tier_id('tier3') is None
+    assert view.parameter('CATEGORIES') == ''
+    assert view.parameter('UNKNOWN', 'missing') == 'missing'
+
+
+def test_request_view_should_project_a_tier_configuration_request(load_json):
+    raw = load_json(os.path.dirname(__file__) + '/request_tier_config.json')
+
+    view = RequestView.from_tier_configuration_request(raw, ['my_ordering_parameter'])
+
+    assert view.kind == TIER_CONFIGURATION_REQUEST
+    assert view.id == raw['id']
+    assert view.asset_id == raw['configuration']['id']
+    assert view.product_id == raw['configuration']['product']['id']
+    assert view.tier_id('tier1') == raw['tiers']['tier1']['id']
+    assert view.parameter('my_ordering_parameter') == '111111'
+
+
+def test_request_view_should_be_read_only_and_compact():
+    view = RequestView(ASSET_REQUEST, 'PR-001', 'pending')
+
+    with pytest.raises(AttributeError):
+        view.status = 'approved'
+
+    with pytest.raises(AttributeError):
+        del view.status
+
+    assert not hasattr(view, '__dict__')
+    assert view.parameters == ()
+
+
+def test_request_view_should_survive_pickling():
+    view = RequestView(ASSET_REQUEST, 'PR-001', 'pending', 'purchase', 'AS-001', 'PRD-001', (('customer', 'TA-001'),))
+
+    assert pickle.loads(pickle.dumps(view)) == view
+
+
+def test_request_view_should_read_the_full_request_back_through_the_facade():
+    api = FakeFacade()
+
+    assert RequestView(ASSET_REQUEST, 'PR-001').to_request(api) == (ASSET_REQUEST, 'PR-001')
+    assert RequestView(TIER_CONFIGURATION_REQUEST, 'TCR-001').to_request(api) == (TIER_CONFIGURATION_REQUEST, 'TCR-001')